@@ -0,0 +1,100 @@
+"""Add mv_dealership_hourly_activity materialized view for /reports/analysis
+
+Revision ID: bd_dealership_hourly_rollup
+Revises: bc_missed_call_voicemail_notif
+Create Date: 2026-10-17
+
+One row per (dealership, UTC hour, metric). Buckets are truncated in UTC
+explicitly, so they do not depend on the TimeZone of the session running the
+refresh. Hourly buckets line up with the local start/end-of-day ranges the
+analytics page sends for whole-hour timezones, and keep extract(dow) identical
+to the per-row value.
+Refreshed concurrently by the scheduler (app.tasks.analytics_rollup).
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "bd_dealership_hourly_rollup"
+down_revision: Union[str, None] = "bc_missed_call_voicemail_notif"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+APPOINTMENT_SET_STATUSES = (
+    "'scheduled', 'confirmed', 'arrived', 'in_showroom', "
+    "'in_progress', 'completed', 'no_show', 'sold'"
+)
+
+
+def upgrade() -> None:
+    op.execute(
+        f"""
+        CREATE MATERIALIZED VIEW mv_dealership_hourly_activity AS
+        SELECT dealership_id, date_trunc('hour', created_at, 'UTC') AS bucket, 'leads' AS metric, count(*) AS n
+        FROM leads
+        WHERE dealership_id IS NOT NULL
+        GROUP BY 1, 2
+        UNION ALL
+        SELECT dealership_id, date_trunc('hour', created_at, 'UTC'), 'active_leads', count(*)
+        FROM leads
+        WHERE dealership_id IS NOT NULL AND is_active
+        GROUP BY 1, 2
+        UNION ALL
+        SELECT a.dealership_id, date_trunc('hour', a.created_at, 'UTC'), 'notes', count(*)
+        FROM activities a
+        JOIN leads l ON l.id = a.lead_id AND l.dealership_id = a.dealership_id
+        WHERE a.type = 'NOTE_ADDED'
+        GROUP BY 1, 2
+        UNION ALL
+        SELECT dealership_id, date_trunc('hour', created_at, 'UTC'), 'appointments_set', count(*)
+        FROM appointments
+        WHERE dealership_id IS NOT NULL AND status IN ({APPOINTMENT_SET_STATUSES})
+        GROUP BY 1, 2
+        UNION ALL
+        SELECT dealership_id, date_trunc('hour', created_at, 'UTC'), 'appointments_scheduled', count(*)
+        FROM appointments
+        WHERE dealership_id IS NOT NULL AND status = 'scheduled'
+        GROUP BY 1, 2
+        UNION ALL
+        SELECT dealership_id, date_trunc('hour', created_at, 'UTC'), 'appointments_confirmed', count(*)
+        FROM appointments
+        WHERE dealership_id IS NOT NULL AND status = 'confirmed'
+        GROUP BY 1, 2
+        UNION ALL
+        SELECT dealership_id, date_trunc('hour', scheduled_at, 'UTC'), 'appointments_slotted', count(*)
+        FROM appointments
+        WHERE dealership_id IS NOT NULL
+        GROUP BY 1, 2
+        UNION ALL
+        SELECT l.dealership_id, date_trunc('hour', f.created_at, 'UTC'), 'follow_ups_scheduled', count(*)
+        FROM follow_ups f
+        JOIN leads l ON l.id = f.lead_id
+        WHERE l.dealership_id IS NOT NULL
+        GROUP BY 1, 2
+        UNION ALL
+        SELECT l.dealership_id, date_trunc('hour', f.completed_at, 'UTC'), 'follow_ups_completed', count(*)
+        FROM follow_ups f
+        JOIN leads l ON l.id = f.lead_id
+        WHERE l.dealership_id IS NOT NULL AND f.status = 'COMPLETED' AND f.completed_at IS NOT NULL
+        GROUP BY 1, 2
+        UNION ALL
+        SELECT dealership_id, date_trunc('hour', started_at, 'UTC'), 'outbound_calls', count(*)
+        FROM call_logs
+        WHERE dealership_id IS NOT NULL AND direction = 'outbound'
+        GROUP BY 1, 2
+        UNION ALL
+        SELECT v.dealership_id, date_trunc('hour', v.checked_in_at, 'UTC'), 'check_ins', count(*)
+        FROM showroom_visits v
+        JOIN leads l ON l.id = v.lead_id AND l.dealership_id = v.dealership_id
+        GROUP BY 1, 2
+        """
+    )
+    # Unique index is required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+    op.execute(
+        "CREATE UNIQUE INDEX ix_mv_dealership_hourly_activity_key "
+        "ON mv_dealership_hourly_activity (dealership_id, bucket, metric)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS mv_dealership_hourly_activity")
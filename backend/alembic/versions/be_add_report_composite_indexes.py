@@ -0,0 +1,56 @@
+"""Add composite/partial indexes for report filter predicates
+
+Revision ID: be_report_composite_indexes
+Revises: bd_dealership_hourly_rollup
+Create Date: 2026-10-17
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "be_report_composite_indexes"
+down_revision: Union[str, None] = "bd_dealership_hourly_rollup"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_follow_ups_assigned_pending",
+        "follow_ups",
+        ["assigned_to", "scheduled_at"],
+        postgresql_where=sa.text("status = 'PENDING'"),
+    )
+    op.create_index(
+        "ix_appointments_assigned_active",
+        "appointments",
+        ["assigned_to", "scheduled_at"],
+        postgresql_where=sa.text("status IN ('scheduled', 'confirmed')"),
+    )
+    op.create_index(
+        "ix_call_logs_dealership_created",
+        "call_logs",
+        ["dealership_id", sa.text("created_at DESC")],
+        postgresql_include=["user_id", "direction", "status", "duration_seconds"],
+    )
+    op.create_index(
+        "ix_sms_logs_dealership_created",
+        "sms_logs",
+        ["dealership_id", sa.text("created_at DESC")],
+        postgresql_include=["user_id", "direction"],
+    )
+    op.create_index(
+        "ix_activities_dealership_type_created",
+        "activities",
+        ["dealership_id", "type", "created_at"],
+        postgresql_include=["user_id", "lead_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_activities_dealership_type_created", table_name="activities")
+    op.drop_index("ix_sms_logs_dealership_created", table_name="sms_logs")
+    op.drop_index("ix_call_logs_dealership_created", table_name="call_logs")
+    op.drop_index("ix_appointments_assigned_active", table_name="appointments")
+    op.drop_index("ix_follow_ups_assigned_pending", table_name="follow_ups")
@@ -0,0 +1,65 @@
+"""Add mv_lead_hourly_activity materialized view for the /reports/analytics charts
+
+Revision ID: bf_lead_hourly_rollup
+Revises: be_report_composite_indexes
+Create Date: 2026-10-17
+
+One row per (dealership, UTC hour, metric, lead stage/source/assignee/BDC agent)
+so leads-over-time, leads-by-stage, leads-by-source and activities-over-time
+can apply their lead filters to pre-aggregated rows. Hourly rather than daily
+buckets keep the local start/end-of-day ranges the analytics page sends exact;
+they are truncated in UTC so the refreshing session's TimeZone does not matter.
+Refreshed concurrently by the scheduler (app.tasks.analytics_rollup).
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "bf_lead_hourly_rollup"
+down_revision: Union[str, None] = "be_report_composite_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+LEAD_DIMENSIONS = "l.stage_id, l.source, l.assigned_to, l.bdc_assigned_to_id"
+
+
+def upgrade() -> None:
+    op.execute(
+        f"""
+        CREATE MATERIALIZED VIEW mv_lead_hourly_activity AS
+        SELECT l.dealership_id, date_trunc('hour', l.created_at, 'UTC') AS bucket, 'leads_created' AS metric,
+               {LEAD_DIMENSIONS}, count(*) AS n
+        FROM leads l
+        WHERE l.dealership_id IS NOT NULL AND l.created_at IS NOT NULL
+        GROUP BY 1, 2, 3, 4, 5, 6, 7
+        UNION ALL
+        SELECT l.dealership_id, date_trunc('hour', l.converted_at, 'UTC'), 'leads_converted',
+               {LEAD_DIMENSIONS}, count(*)
+        FROM leads l
+        WHERE l.dealership_id IS NOT NULL AND l.outcome = 'converted' AND l.converted_at IS NOT NULL
+        GROUP BY 1, 2, 3, 4, 5, 6, 7
+        UNION ALL
+        SELECT l.dealership_id, date_trunc('hour', a.created_at, 'UTC'), 'activities',
+               {LEAD_DIMENSIONS}, count(*)
+        FROM activities a
+        JOIN leads l ON l.id = a.lead_id AND l.dealership_id = a.dealership_id
+        GROUP BY 1, 2, 3, 4, 5, 6, 7
+        UNION ALL
+        SELECT l.dealership_id, date_trunc('hour', a.created_at, 'UTC'), 'notes',
+               {LEAD_DIMENSIONS}, count(*)
+        FROM activities a
+        JOIN leads l ON l.id = a.lead_id AND l.dealership_id = a.dealership_id
+        WHERE a.type = 'NOTE_ADDED'
+        GROUP BY 1, 2, 3, 4, 5, 6, 7
+        """
+    )
+    # Unique index is required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+    op.execute(
+        "CREATE UNIQUE INDEX ix_mv_lead_hourly_activity_key "
+        "ON mv_lead_hourly_activity "
+        "(dealership_id, bucket, metric, stage_id, source, assigned_to, bdc_assigned_to_id)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS mv_lead_hourly_activity")
@@ -0,0 +1,32 @@
+"""Add partial index on note activities by author and recency
+
+Revision ID: bh_activity_user_notes_index
+Revises: bf_lead_hourly_rollup
+Create Date: 2026-10-17
+
+Serves the DISTINCT ON (assigned_to) ... ORDER BY created_at DESC lookup of
+each salesperson's latest note in /reports/analysis.
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "bh_activity_user_notes_index"
+down_revision: Union[str, None] = "bf_lead_hourly_rollup"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_activities_user_notes_created",
+        "activities",
+        ["user_id", sa.text("created_at DESC")],
+        postgresql_where=sa.text("type = 'NOTE_ADDED'"),
+        postgresql_include=["lead_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_activities_user_notes_created", table_name="activities")
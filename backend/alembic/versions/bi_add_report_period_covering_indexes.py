@@ -0,0 +1,48 @@
+"""Add covering (dealership_id, timestamp) indexes for the analysis period counts
+
+Revision ID: bi_report_period_covering_indexes
+Revises: bh_activity_user_notes_index
+Create Date: 2026-10-17
+
+The Friday/Saturday cards filter on enumerated UTC day ranges and the check-in
+counts on the report period, so each count is a range scan per dealership; the
+INCLUDE columns (lead scope and per-salesperson grouping keys) let those counts
+run as index-only scans.
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "bi_report_period_covering_indexes"
+down_revision: Union[str, None] = "bh_activity_user_notes_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_call_logs_dealership_outbound_started",
+        "call_logs",
+        ["dealership_id", "started_at"],
+        postgresql_where=sa.text("direction = 'outbound'"),
+        postgresql_include=["user_id", "lead_id"],
+    )
+    op.create_index(
+        "ix_appointments_dealership_scheduled",
+        "appointments",
+        ["dealership_id", "scheduled_at"],
+        postgresql_include=["assigned_to", "lead_id"],
+    )
+    op.create_index(
+        "ix_showroom_visits_dealership_checked_in",
+        "showroom_visits",
+        ["dealership_id", "checked_in_at"],
+        postgresql_include=["lead_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_showroom_visits_dealership_checked_in", table_name="showroom_visits")
+    op.drop_index("ix_appointments_dealership_scheduled", table_name="appointments")
+    op.drop_index("ix_call_logs_dealership_outbound_started", table_name="call_logs")
@@ -0,0 +1,77 @@
+"""Add partial/composite indexes for the showroom open-visit and stats queries
+
+Revision ID: bj_showroom_visit_indexes
+Revises: bi_report_period_covering_indexes
+Create Date: 2026-10-17
+
+Open visits (checked_out_at IS NULL) are a small slice of showroom_visits:
+a lead's current visit is looked up by lead_id, the current-visitors list and
+its stat card by dealership. A lead can have at most one open visit, so the
+lead_id index is unique; check-in relies on it with INSERT ... ON CONFLICT DO
+NOTHING, which also closes the race where two concurrent check-ins both saw
+no open visit. Duplicate open visits left by that race (all but the latest per
+lead) are closed first, each at the check-in time of the lead's next visit so
+it does not become a multi-day visit in the duration stats; their outcome and
+checked_out_by stay NULL.
+
+The outcome index serves "sold today" and the history outcome filter. The
+(dealership_id, checked_in_at) range index already exists
+(bi_report_period_covering_indexes) and schedules.user_id is indexed since
+the initial tables.
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "bj_showroom_visit_indexes"
+down_revision: Union[str, None] = "bi_report_period_covering_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        UPDATE showroom_visits v
+        SET checked_out_at = COALESCE(nxt.next_checked_in_at, v.checked_in_at), updated_at = now()
+        FROM (
+            SELECT id, lead(checked_in_at) OVER (
+                PARTITION BY lead_id ORDER BY checked_in_at, id
+            ) AS next_checked_in_at
+            FROM showroom_visits
+        ) nxt
+        WHERE nxt.id = v.id
+          AND v.checked_out_at IS NULL
+          AND v.id NOT IN (
+            SELECT DISTINCT ON (lead_id) id
+            FROM showroom_visits
+            WHERE checked_out_at IS NULL
+            ORDER BY lead_id, checked_in_at DESC, id DESC
+          )
+        """
+    )
+    op.create_index(
+        "ix_showroom_visits_open_lead",
+        "showroom_visits",
+        ["lead_id"],
+        unique=True,
+        postgresql_where=sa.text("checked_out_at IS NULL"),
+    )
+    op.create_index(
+        "ix_showroom_visits_open_dealership",
+        "showroom_visits",
+        ["dealership_id", sa.text("checked_in_at DESC")],
+        postgresql_where=sa.text("checked_out_at IS NULL"),
+    )
+    op.create_index(
+        "ix_showroom_visits_dealership_outcome_checked_in",
+        "showroom_visits",
+        ["dealership_id", "outcome", "checked_in_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_showroom_visits_dealership_outcome_checked_in", table_name="showroom_visits")
+    op.drop_index("ix_showroom_visits_open_dealership", table_name="showroom_visits")
+    op.drop_index("ix_showroom_visits_open_lead", table_name="showroom_visits")
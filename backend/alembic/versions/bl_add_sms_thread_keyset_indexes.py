@@ -0,0 +1,37 @@
+"""Add (created_at, id) keyset indexes for SMS conversation threads
+
+Revision ID: bl_sms_thread_keyset_indexes
+Revises: bj_showroom_visit_indexes
+Create Date: 2026-10-17
+
+A conversation thread is a customer's messages (legacy rows: a lead's),
+newest first, paged with a (created_at, id) cursor. These indexes match that
+order so each page is an index seek rather than a sort of the whole thread.
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "bl_sms_thread_keyset_indexes"
+down_revision: Union[str, None] = "bj_showroom_visit_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_sms_logs_customer_created_id",
+        "sms_logs",
+        ["customer_id", sa.text("created_at DESC"), sa.text("id DESC")],
+    )
+    op.create_index(
+        "ix_sms_logs_lead_created_id",
+        "sms_logs",
+        ["lead_id", sa.text("created_at DESC"), sa.text("id DESC")],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_sms_logs_lead_created_id", table_name="sms_logs")
+    op.drop_index("ix_sms_logs_customer_created_id", table_name="sms_logs")
@@ -20,7 +20,7 @@ from app.schemas.dealership_twilio_config import (
     DealershipTwilioConfigUpdate,
 )
 from app.models.dealership_twilio_config import DealershipTwilioConfig
-from app.services.dealership_twilio_config_service import get_dealership_twilio_row
+from app.services.dealership_twilio_config_service import get_dealership_twilio_row, invalidate_sms_status
 from app.services.email_notifier import send_new_member_welcome_email
 
 router = APIRouter()
@@ -377,4 +377,5 @@ async def patch_dealership_twilio_config(
     await db.flush()
     await db.commit()
     await db.refresh(row)
+    await invalidate_sms_status(dealership_id)
     return _twilio_config_to_response(dealership_id, row)
@@ -53,6 +53,7 @@ async def create_stage(
         is_terminal=stage_in.is_terminal,
     )
     await db.commit()
+    await LeadStageService.invalidate_stage_cache()
     return stage
 
 
@@ -72,6 +73,7 @@ async def update_stage(
     data = stage_in.model_dump(exclude_unset=True)
     stage = await LeadStageService.update_stage(db, stage, data)
     await db.commit()
+    await LeadStageService.invalidate_stage_cache()
     return stage
 
 
@@ -103,6 +105,7 @@ async def delete_stage(
         raise HTTPException(status_code=404, detail="Stage not found")
     stage.is_active = False
     await db.commit()
+    await LeadStageService.invalidate_stage_cache()
     return {"message": "Stage deactivated"}
 
 
@@ -116,4 +119,5 @@ async def seed_stages(
         raise HTTPException(status_code=403, detail="Only super admin can seed stages")
     stages = await LeadStageService.seed_default_stages(db)
     await db.commit()
+    await LeadStageService.invalidate_stage_cache()
     return {"message": f"Seeded {len(stages)} stages"}
@@ -6,20 +6,25 @@ Provides endpoints for:
 - Sending notifications from admin to salesperson
 - Communication monitoring (calls, SMS) for admins
 """
+import hashlib
+import json
 import logging
-from datetime import datetime, timedelta
-from typing import Any, List, Optional
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Annotated, Any, List, NamedTuple, Optional, Union
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from pydantic import BaseModel
-from sqlalchemy import select, func, and_, or_, extract
+from fastapi import APIRouter, Depends, HTTPException, Request, status, Query
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, BeforeValidator
+from sqlalchemy import DateTime, Integer, Uuid, select, func, and_, or_, case, extract, lambda_stmt, literal_column, bindparam, union_all, table, column, values, join, true, false, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
 from app.api import deps
+from app.core.cache import cache_get, cache_set
 from app.core.timezone import utc_now
 from app.core.access_scope import get_accessible_dealership_ids
-from app.db.database import get_db
+from app.db.database import execute_concurrently, get_db
 from app.models.user import User, UserRole
 from app.models.appointment import Appointment, AppointmentStatus
 from app.models.follow_up import FollowUp, FollowUpStatus
@@ -31,6 +36,7 @@ from app.models.sms_log import SMSLog, MessageDirection
 from app.models.showroom_visit import ShowroomVisit, ShowroomOutcome
 from app.models.customer import Customer
 from app.services.notification_service import NotificationService
+from app.utils.cursor import decode_keyset_cursor, encode_keyset_cursor
 
 logger = logging.getLogger(__name__)
 
@@ -52,8 +58,8 @@ APPOINTMENT_SET_STATUSES = (
 
 # Schemas
 class PendingFollowUp(BaseModel):
-    id: str
-    lead_id: str
+    id: UUID
+    lead_id: UUID
     lead_name: str
     scheduled_at: datetime
     notes: Optional[str]
@@ -64,7 +70,7 @@ class PendingFollowUp(BaseModel):
 
 
 class PendingAppointment(BaseModel):
-    id: str
+    id: UUID
     lead_id: str
     lead_name: str
     title: Optional[str]
@@ -77,7 +83,7 @@ class PendingAppointment(BaseModel):
 
 
 class SalespersonPendingTasksResponse(BaseModel):
-    user_id: str
+    user_id: UUID
     user_name: str
     overdue_followups: List[PendingFollowUp]
     upcoming_followups: List[PendingFollowUp]
@@ -122,11 +128,11 @@ class CommunicationOverviewResponse(BaseModel):
 
 
 class TeamActivityItem(BaseModel):
-    id: str
+    id: UUID
     type: str  # call, sms, email
-    user_id: Optional[str]
+    user_id: Optional[UUID]
     user_name: Optional[str]
-    lead_id: Optional[str]
+    lead_id: Optional[UUID]
     lead_name: Optional[str]
     direction: str
     summary: str
@@ -138,6 +144,7 @@ class TeamActivityResponse(BaseModel):
     total: int
     page: int
     page_size: int
+    next_cursor: Optional[str] = None  # Pass as cursor to load the next page
 
 
 class DealershipSummary(BaseModel):
@@ -161,7 +168,7 @@ class DealershipSummary(BaseModel):
 
 
 class SalespersonAnalysisRow(BaseModel):
-    user_id: str
+    user_id: UUID
     user_name: str
     leads_assigned: int
     notes_added: int
@@ -183,12 +190,24 @@ class SalespersonAnalysisRow(BaseModel):
     check_ins_in_period: int
 
 
+# SalespersonAnalysisRow integer fields filled from the per-salesperson GROUP BY queries
+SALESPERSON_COUNT_FIELDS = (
+    "leads_assigned", "notes_added",
+    "follow_ups_total", "follow_ups_pending", "follow_ups_overdue",
+    "follow_ups_scheduled_in_period", "follow_ups_completed_in_period",
+    "appointments_total", "appointments_scheduled", "appointments_confirmed",
+    "appointments_scheduled_in_period", "appointments_confirmed_in_period",
+    "notes_friday", "outbound_calls_friday", "appointments_contacted_saturday",
+    "check_ins_in_period",
+)
+
+
 class CheckInRow(BaseModel):
     """One showroom check-in in the report period."""
-    visit_id: str
-    lead_id: str
+    visit_id: UUID
+    lead_id: UUID
     lead_name: str
-    assigned_to_id: Optional[str] = None
+    assigned_to_id: Optional[UUID] = None
     assigned_to_name: Optional[str] = None
     checked_in_at: datetime
     checked_in_by_name: Optional[str] = None
@@ -401,10 +420,327 @@ def _append_sold_date_filters_to_lead_query(
         )
 
 
+def _bare_date(value: Any) -> Any:
+    """Keep a YYYY-MM-DD query value a date; pydantic would otherwise read it as midnight."""
+    if isinstance(value, str) and len(value) == 10:
+        return date.fromisoformat(value)
+    return value
+
+
+# Query range bound: a bare date (whole UTC day) or an explicit ISO datetime.
+# Declare it as Annotated[DateOrDateTime, Query(...)]; a Query(...) default drops the validator.
+DateOrDateTime = Annotated[Union[datetime, date], BeforeValidator(_bare_date)]
+
+
+def _utc_date_range(date_from: Union[date, datetime], date_to: Union[date, datetime]) -> tuple[datetime, datetime]:
+    """
+    Normalize validated query values to an aware UTC range.
+
+    Naive datetimes are treated as UTC and keep their time; a bare date covers
+    the whole day (date_from from its start, date_to through 23:59:59).
+    """
+    if not isinstance(date_from, datetime):
+        date_from = datetime.combine(date_from, time.min)
+    if not isinstance(date_to, datetime):
+        date_to = datetime.combine(date_to, time(23, 59, 59))
+    return _as_utc(date_from), _as_utc(date_to)
+
+
+def _as_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """Treat a naive query datetime as UTC and convert aware ones to UTC; None passes through."""
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+ANALYTICS_CACHE_PREFIX = "reports:analytics:"
+# Ranges that include today change as activity comes in; closed ranges only move when
+# leads are edited (stage, assignee) or the hourly rollups refresh.
+ANALYTICS_CACHE_TTL_OPEN_SECONDS = 60
+ANALYTICS_CACHE_TTL_CLOSED_SECONDS = 300
+
+
+def _analytics_cache_key(endpoint: str, *params: Any) -> str:
+    """Stable key for an analytics response: endpoint name plus a hash of its resolved filters."""
+    digest = hashlib.blake2b(json.dumps(params, default=str).encode(), digest_size=16).hexdigest()
+    return f"{ANALYTICS_CACHE_PREFIX}{endpoint}:{digest}"
+
+
+async def _cache_analytics_response(cache_key: str, date_to: Optional[datetime], response: BaseModel) -> ORJSONResponse:
+    """
+    Store an analytics response (TTL depends on whether the range reaches today) and return it.
+
+    The JSON-mode dump made for the cache is sent as-is: returning a Response skips
+    FastAPI's response_model validation and jsonable_encoder pass over a payload we built.
+    """
+    today_start = utc_now().replace(hour=0, minute=0, second=0, microsecond=0)
+    date_to = _as_utc(date_to)
+    closed = date_to is not None and date_to < today_start
+    ttl = ANALYTICS_CACHE_TTL_CLOSED_SECONDS if closed else ANALYTICS_CACHE_TTL_OPEN_SECONDS
+    content = response.model_dump(mode="json")
+    await cache_set(cache_key, content, ttl_seconds=ttl)
+    return ORJSONResponse(content)
+
+
+# Hourly rollup maintained by app.tasks.analytics_rollup (alembic bd_dealership_hourly_rollup)
+_hourly_rollup = table(
+    "mv_dealership_hourly_activity",
+    column("dealership_id"),
+    column("bucket"),
+    column("metric"),
+    column("n"),
+)
+
+
+# Lead-dimensioned hourly rollup for the analytics charts (alembic bf_lead_hourly_rollup)
+_lead_rollup = table(
+    "mv_lead_hourly_activity",
+    column("dealership_id"),
+    column("bucket"),
+    column("metric"),
+    column("stage_id"),
+    column("source", Lead.__table__.c.source.type),
+    column("assigned_to"),
+    column("bdc_assigned_to_id"),
+    column("n"),
+)
+
+
+def _utc_dow(ts_column) -> Any:
+    """
+    Day of week (0=Sun, 5=Fri, 6=Sat) of a timestamptz, evaluated in UTC.
+
+    EXTRACT on a bare timestamptz depends on the session TimeZone; pinning it to
+    UTC keeps rollup buckets and live rows on the same calendar. Not indexed:
+    weekday filters on live rows go through _on_utc_weekday/_utc_weekday_days.
+    """
+    return extract("dow", ts_column.op("AT TIME ZONE")(literal_column("'UTC'")))
+
+
+# Beyond this many matching days (about a year of one weekday) the OR of ranges
+# costs more to plan than evaluating _utc_dow on the rows already in the period.
+MAX_WEEKDAY_WINDOWS = 53
+
+
+def _utc_weekday_starts(date_from: datetime, date_to: datetime, dow: int) -> List[datetime]:
+    """UTC midnights of the days in [date_from, date_to] with the given day of week (0=Sun, 5=Fri, 6=Sat)."""
+    day = _as_utc(date_from).date()
+    last_day = _as_utc(date_to).date()
+    # Postgres dow counts from Sunday; Python weekday() from Monday
+    day += timedelta(days=(dow - 1 - day.weekday()) % 7)
+    starts = []
+    while day <= last_day:
+        starts.append(datetime.combine(day, time.min, tzinfo=timezone.utc))
+        day += timedelta(days=7)
+    return starts
+
+
+def _on_utc_weekday(ts_column, date_from: datetime, date_to: datetime, dow: int) -> Any:
+    """
+    Restrict a timestamptz to UTC days with the given day of week (0=Sun, 5=Fri, 6=Sat).
+
+    The matching days in [date_from, date_to] are enumerated here and emitted as
+    plain range predicates, so the planner can use the column's ordinary btree
+    index instead of evaluating EXTRACT on every row in the period. Callers still
+    apply the period bounds themselves; the windows only pick the weekday.
+    Usable inside FILTER clauses; standalone counts join _utc_weekday_days instead.
+    """
+    starts = _utc_weekday_starts(date_from, date_to, dow)
+    if len(starts) > MAX_WEEKDAY_WINDOWS:
+        return _utc_dow(ts_column) == dow
+    return or_(false(), *(
+        and_(ts_column >= day_start, ts_column < day_start + timedelta(days=1)) for day_start in starts
+    ))
+
+
+def _utc_weekday_days(date_from: datetime, date_to: datetime, dow: int, name: str) -> Optional[Any]:
+    """
+    The matching UTC days as a VALUES (day_start, day_end) list, or None when there are none.
+
+    Joining a count against this drives one index range scan per day from a tiny
+    outer side, with no cap on the number of days.
+    """
+    starts = _utc_weekday_starts(date_from, date_to, dow)
+    if not starts:
+        return None
+    return values(
+        column("day_start", DateTime(timezone=True)),
+        column("day_end", DateTime(timezone=True)),
+        name=name,
+    ).data([(day_start, day_start + timedelta(days=1)) for day_start in starts])
+
+
+def _join_utc_weekday_days(entity, ts_column, days) -> Any:
+    """FROM clause of entity joined to a _utc_weekday_days list on its timestamp."""
+    return join(entity, days, and_(ts_column >= days.c.day_start, ts_column < days.c.day_end))
+
+
+class _RollupCounts(NamedTuple):
+    total: int = 0
+    friday: int = 0
+    saturday: int = 0
+
+
+_EMPTY_ROLLUP = _RollupCounts()
+
+
+def _rollup_window(
+    date_from: Optional[datetime], date_to: Optional[datetime]
+) -> Optional[tuple[datetime, datetime]]:
+    """
+    Map an inclusive [date_from, date_to] range onto whole hourly buckets.
+
+    Returns (start, end_exclusive) in UTC when date_from is on a UTC hour and date_to
+    is the last instant of one (e.g. endOfDay().toISOString()), otherwise None so the
+    caller falls back to exact per-row counts. Bounds in a half-hour offset such as
+    +05:30 are not on a UTC hour and always take the per-row path.
+    """
+    if date_from is None or date_to is None:
+        return None
+    date_from, date_to = _as_utc(date_from), _as_utc(date_to)
+    if (date_from.minute, date_from.second, date_from.microsecond) != (0, 0, 0):
+        return None
+    if (date_to.minute, date_to.second) != (59, 59):
+        return None
+    return date_from, date_to.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
+
+
+def _closed_rollup_window(
+    date_from: Optional[datetime], date_to: Optional[datetime]
+) -> Optional[tuple[datetime, datetime]]:
+    """
+    _rollup_window for ranges that end before today (UTC), so the current day
+    is always counted from live rows rather than a rollup up to 5 minutes old.
+    Bounds are normalized to UTC by _rollup_window before either check.
+    """
+    window = _rollup_window(date_from, date_to)
+    if window is None:
+        return None
+    today_start = utc_now().replace(hour=0, minute=0, second=0, microsecond=0)
+    return window if window[1] <= today_start else None
+
+
+def _lead_rollup_filters(
+    dealership_id: UUID,
+    window: tuple[datetime, datetime],
+    assigned_to: Optional[UUID],
+    bdc_agent_id: Optional[UUID],
+    source: Optional[str],
+    stage_id: Optional[UUID],
+) -> list:
+    """The lead filters of _resolve_dealership_and_lead_filters, applied to _lead_rollup rows."""
+    c = _lead_rollup.c
+    filters = [c.dealership_id == dealership_id, c.bucket >= window[0], c.bucket < window[1]]
+    if assigned_to is not None:
+        filters.append(c.assigned_to == assigned_to)
+    if bdc_agent_id is not None:
+        filters.append(c.bdc_assigned_to_id == bdc_agent_id)
+    if source is not None:
+        try:
+            filters.append(c.source == LeadSource(source))
+        except ValueError:
+            pass
+    if stage_id is not None:
+        filters.append(c.stage_id == stage_id)
+    return filters
+
+
+# Fixed-shape statements are built once with named binds; each request only supplies
+# values, so neither the statement nor its cache key is rebuilt per call.
+_HOURLY_ROLLUP_TOTALS = (
+    select(
+        _hourly_rollup.c.metric,
+        func.coalesce(func.sum(_hourly_rollup.c.n), 0),
+        func.coalesce(func.sum(_hourly_rollup.c.n).filter(_utc_dow(_hourly_rollup.c.bucket) == 5), 0),
+        func.coalesce(func.sum(_hourly_rollup.c.n).filter(_utc_dow(_hourly_rollup.c.bucket) == 6), 0),
+    )
+    .where(
+        _hourly_rollup.c.dealership_id == bindparam("dealership_id", type_=Uuid()),
+        _hourly_rollup.c.bucket >= bindparam("start", type_=DateTime(timezone=True)),
+        _hourly_rollup.c.bucket < bindparam("end", type_=DateTime(timezone=True)),
+    )
+    .group_by(_hourly_rollup.c.metric)
+)
+
+_ACTIVE_SALESPERSONS_FILTER = and_(
+    User.dealership_id == bindparam("dealership_id"),
+    User.role == UserRole.SALESPERSON,
+    User.is_active == True,
+)
+_ACTIVE_SALESPERSONS = select(User).where(_ACTIVE_SALESPERSONS_FILTER)
+_ACTIVE_SALESPERSON_IDS = select(User.id).where(_ACTIVE_SALESPERSONS_FILTER)
+
+
+def _rollup_counts_by_metric(result) -> dict[str, _RollupCounts]:
+    """Per-metric totals with Friday/Saturday splits from an executed _HOURLY_ROLLUP_TOTALS."""
+    return {
+        row[0]: _RollupCounts(int(row[1]), int(row[2]), int(row[3]))
+        for row in result.all()
+    }
+
+
+async def _execute_single_row_aggregates(db: AsyncSession, aggregates: List[Any]) -> dict[str, int]:
+    """
+    Run several single-row aggregate selects in one round-trip.
+
+    Each select must return exactly one row with labeled columns; they are
+    cross-joined as subqueries and the combined row is returned as a dict.
+    """
+    subqueries = [agg.subquery() for agg in aggregates]
+    from_clause = subqueries[0]
+    for subq in subqueries[1:]:
+        from_clause = from_clause.join(subq, true())
+    result = await db.execute(
+        select(*[col for subq in subqueries for col in subq.c]).select_from(from_clause)
+    )
+    return {key: value or 0 for key, value in result.one()._mapping.items()}
+
+
+def _lead_scope_halves(lead_id_column, lead_ids_subq) -> tuple[Any, Any]:
+    """
+    The two disjoint halves of "no lead, or a lead in scope" for nullable lead_id columns.
+
+    Counting each half separately and adding the results gives the planner two plain
+    index conditions instead of an OR it can only satisfy with a BitmapOr.
+    """
+    return lead_id_column.is_(None), lead_id_column.in_(lead_ids_subq)
+
+
+def _count_lead_scoped(entity, lead_id_column, lead_ids_subq, *filters, label: str):
+    """Single-row count of entity rows matching filters with no lead or a lead in scope."""
+    without_lead, in_scope = (
+        select(func.count()).select_from(entity).where(*filters, half).scalar_subquery()
+        for half in _lead_scope_halves(lead_id_column, lead_ids_subq)
+    )
+    return select((without_lead + in_scope).label(label))
+
+
+def _lead_name_column(missing_label: str):
+    """
+    "First Last" for the outer-joined Lead/Customer, or missing_label when there is no lead.
+
+    Mirrors f"{lead.first_name} {lead.last_name or ''}".strip() so callers get a final string.
+    """
+    return case(
+        (Lead.id.is_(None), literal_column(f"'{missing_label}'")),
+        else_=func.trim(func.concat(Customer.first_name, " ", func.coalesce(Customer.last_name, ""))),
+    ).label("lead_name")
+
+
+_REPORT_ACCESS_ROLES = frozenset({
+    UserRole.SUPER_ADMIN,
+    UserRole.DEALERSHIP_ADMIN,
+    UserRole.DEALERSHIP_OWNER,
+    UserRole.BDC,
+})
+
+
 # Helper function to check admin/owner/BDC permissions for reports
 def require_reports_access(current_user: User = Depends(deps.get_current_active_user)) -> User:
     """Require user to be dealership admin, owner, super admin, or BDC agent."""
-    if current_user.role not in [UserRole.SUPER_ADMIN, UserRole.DEALERSHIP_ADMIN, UserRole.DEALERSHIP_OWNER, UserRole.BDC]:
+    if current_user.role not in _REPORT_ACCESS_ROLES:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Reports access required"
@@ -416,6 +752,24 @@ def require_reports_access(current_user: User = Depends(deps.get_current_active_
 require_admin_or_owner = require_reports_access
 
 
+def _target_user_query(user_id: UUID):
+    """Columns needed to validate and name the salesperson a report is about."""
+    return lambda_stmt(
+        lambda: select(User.id, User.first_name, User.last_name, User.dealership_id).where(User.id == user_id)
+    )
+
+
+def _ensure_target_user_visible(target_user, current_user: User, forbidden_detail: str) -> None:
+    """404 if the target user row is missing, 403 if it belongs to another dealership."""
+    if target_user is None:
+        raise HTTPException(status_code=404, detail="User not found")
+    
+    # Permission check: non-super-admins can only act on users in their dealership
+    if current_user.role != UserRole.SUPER_ADMIN:
+        if target_user.dealership_id != current_user.dealership_id:
+            raise HTTPException(status_code=403, detail=forbidden_detail)
+
+
 @router.get("/salesperson/{user_id}/pending-tasks", response_model=SalespersonPendingTasksResponse)
 async def get_salesperson_pending_tasks(
     user_id: UUID,
@@ -426,61 +780,62 @@ async def get_salesperson_pending_tasks(
     Get all pending follow-ups and appointments for a salesperson.
     Shows both overdue and upcoming items.
     """
-    # Verify the target user exists and is in the same dealership (if not super admin)
-    target_user_result = await db.execute(select(User).where(User.id == user_id))
-    target_user = target_user_result.scalar_one_or_none()
-    
-    if not target_user:
-        raise HTTPException(status_code=404, detail="User not found")
-    
-    # Permission check: non-super-admins can only view users in their dealership
-    if current_user.role != UserRole.SUPER_ADMIN:
-        if target_user.dealership_id != current_user.dealership_id:
-            raise HTTPException(status_code=403, detail="Cannot view users from other dealerships")
-    
     now = utc_now()
     
-    # Get follow-ups
-    followups_result = await db.execute(
-        select(FollowUp)
-        .where(
-            FollowUp.assigned_to == user_id,
-            FollowUp.status == FollowUpStatus.PENDING
-        )
-        .order_by(FollowUp.scheduled_at)
-    )
-    followups = followups_result.scalars().all()
-    
-    # Get appointments
-    appointments_result = await db.execute(
-        select(Appointment)
-        .where(
-            Appointment.assigned_to == user_id,
-            Appointment.status.in_([AppointmentStatus.SCHEDULED, AppointmentStatus.CONFIRMED])
-        )
-        .order_by(Appointment.scheduled_at)
+    # Look up the target user alongside the follow-up/appointment rows (lead name
+    # built in SQL) instead of before them; the rows are discarded if the check fails.
+    target_user_result, followups_result, appointments_result = await execute_concurrently(
+        db,
+        _target_user_query(user_id),
+        # lambda_stmt caches the compiled SQL; only user_id varies between calls
+        lambda_stmt(
+            lambda: select(
+                FollowUp.id,
+                FollowUp.lead_id,
+                FollowUp.scheduled_at,
+                FollowUp.notes,
+                _lead_name_column("Unknown"),
+            )
+            .outerjoin(Lead, Lead.id == FollowUp.lead_id)
+            .outerjoin(Customer, Customer.id == Lead.customer_id)
+            .where(
+                FollowUp.assigned_to == user_id,
+                FollowUp.status == FollowUpStatus.PENDING
+            )
+            .order_by(FollowUp.scheduled_at)
+        ),
+        lambda_stmt(
+            lambda: select(
+                Appointment.id,
+                Appointment.lead_id,
+                Appointment.title,
+                Appointment.scheduled_at,
+                Appointment.location,
+                _lead_name_column("No lead"),
+            )
+            .outerjoin(Lead, Lead.id == Appointment.lead_id)
+            .outerjoin(Customer, Customer.id == Lead.customer_id)
+            .where(
+                Appointment.assigned_to == user_id,
+                Appointment.status.in_([AppointmentStatus.SCHEDULED, AppointmentStatus.CONFIRMED])
+            )
+            .order_by(Appointment.scheduled_at)
+        ),
     )
-    appointments = appointments_result.scalars().all()
-    
-    # Get lead names
-    lead_ids = set([f.lead_id for f in followups] + [a.lead_id for a in appointments if a.lead_id])
-    leads_result = await db.execute(select(Lead).where(Lead.id.in_(lead_ids)))
-    leads = {lead.id: lead for lead in leads_result.scalars().all()}
+    target_user = target_user_result.one_or_none()
+    _ensure_target_user_visible(target_user, current_user, "Cannot view users from other dealerships")
     
-    # Categorize follow-ups
+    # Categorize follow-ups (rows come from our own query, so skip re-validation)
     overdue_followups = []
     upcoming_followups = []
     
-    for followup in followups:
-        lead = leads.get(followup.lead_id)
-        lead_name = f"{lead.first_name} {lead.last_name or ''}".strip() if lead else "Unknown"
-        
+    for followup in followups_result.all():
         is_overdue = followup.scheduled_at < now
         
-        pending_followup = PendingFollowUp(
-            id=str(followup.id),
-            lead_id=str(followup.lead_id),
-            lead_name=lead_name,
+        pending_followup = PendingFollowUp.model_construct(
+            id=followup.id,
+            lead_id=followup.lead_id,
+            lead_name=followup.lead_name,
             scheduled_at=followup.scheduled_at,
             notes=followup.notes,
             is_overdue=is_overdue
@@ -495,16 +850,13 @@ async def get_salesperson_pending_tasks(
     overdue_appointments = []
     upcoming_appointments = []
     
-    for appointment in appointments:
-        lead = leads.get(appointment.lead_id) if appointment.lead_id else None
-        lead_name = f"{lead.first_name} {lead.last_name or ''}".strip() if lead else "No lead"
-        
+    for appointment in appointments_result.all():
         is_overdue = appointment.scheduled_at < now
         
-        pending_appointment = PendingAppointment(
-            id=str(appointment.id),
+        pending_appointment = PendingAppointment.model_construct(
+            id=appointment.id,
             lead_id=str(appointment.lead_id) if appointment.lead_id else "",
-            lead_name=lead_name,
+            lead_name=appointment.lead_name,
             title=appointment.title,
             scheduled_at=appointment.scheduled_at,
             location=appointment.location,
@@ -517,7 +869,7 @@ async def get_salesperson_pending_tasks(
             upcoming_appointments.append(pending_appointment)
     
     return SalespersonPendingTasksResponse(
-        user_id=str(target_user.id),
+        user_id=target_user.id,
         user_name=f"{target_user.first_name} {target_user.last_name}",
         overdue_followups=overdue_followups,
         upcoming_followups=upcoming_followups,
@@ -539,44 +891,36 @@ async def notify_salesperson_about_tasks(
     Admin/Owner sends notification to salesperson about pending tasks.
     Sends via all channels: push, email, and SMS.
     """
-    # Verify the target user exists and is in the same dealership (if not super admin)
-    target_user_result = await db.execute(select(User).where(User.id == user_id))
-    target_user = target_user_result.scalar_one_or_none()
-    
-    if not target_user:
-        raise HTTPException(status_code=404, detail="User not found")
-    
-    # Permission check
-    if current_user.role != UserRole.SUPER_ADMIN:
-        if target_user.dealership_id != current_user.dealership_id:
-            raise HTTPException(status_code=403, detail="Cannot notify users from other dealerships")
-    
     # Get pending tasks if requested
     pending_tasks = None
     if notification_in.include_pending_tasks:
         # Get the pending tasks
         now = utc_now()
         
-        # Overdue follow-ups
-        overdue_followups_result = await db.execute(
-            select(FollowUp)
-            .where(
-                FollowUp.assigned_to == user_id,
-                FollowUp.status == FollowUpStatus.PENDING,
-                FollowUp.scheduled_at < now
-            )
+        # Overdue follow-ups and appointments, fetched together with the target user
+        target_user_result, overdue_followups_result, overdue_appointments_result = await execute_concurrently(
+            db,
+            _target_user_query(user_id),
+            lambda_stmt(
+                lambda: select(FollowUp)
+                .where(
+                    FollowUp.assigned_to == user_id,
+                    FollowUp.status == FollowUpStatus.PENDING,
+                    FollowUp.scheduled_at < now
+                )
+            ),
+            lambda_stmt(
+                lambda: select(Appointment)
+                .where(
+                    Appointment.assigned_to == user_id,
+                    Appointment.status.in_([AppointmentStatus.SCHEDULED, AppointmentStatus.CONFIRMED]),
+                    Appointment.scheduled_at < now
+                )
+            ),
         )
+        target_user = target_user_result.one_or_none()
+        _ensure_target_user_visible(target_user, current_user, "Cannot notify users from other dealerships")
         overdue_followups = overdue_followups_result.scalars().all()
-        
-        # Overdue appointments
-        overdue_appointments_result = await db.execute(
-            select(Appointment)
-            .where(
-                Appointment.assigned_to == user_id,
-                Appointment.status.in_([AppointmentStatus.SCHEDULED, AppointmentStatus.CONFIRMED]),
-                Appointment.scheduled_at < now
-            )
-        )
         overdue_appointments = overdue_appointments_result.scalars().all()
         
         # Build pending tasks data
@@ -598,6 +942,9 @@ async def notify_salesperson_about_tasks(
                 for a in overdue_appointments
             ]
         }
+    else:
+        target_user = (await db.execute(_target_user_query(user_id))).one_or_none()
+        _ensure_target_user_visible(target_user, current_user, "Cannot notify users from other dealerships")
     
     # Send notification
     notification_service = NotificationService(db)
@@ -629,6 +976,9 @@ async def notify_salesperson_about_tasks(
         )
 
 
+COMMUNICATIONS_OVERVIEW_CACHE_TTL_SECONDS = 30
+
+
 @router.get("/communications/overview", response_model=CommunicationOverviewResponse)
 async def get_communication_overview(
     days: int = Query(7, ge=1, le=90, description="Number of days to look back"),
@@ -638,12 +988,17 @@ async def get_communication_overview(
     """
     Get communication overview statistics for admin monitoring.
     Shows calls, SMS, and email stats grouped by user.
+    Cached briefly per (dealership, days) since admin dashboards poll it.
     """
+    dealership_id = current_user.dealership_id if current_user.role != UserRole.SUPER_ADMIN else None
+    cache_key = f"reports:communications_overview:{dealership_id or 'all'}:{days}"
+    cached = await cache_get(cache_key)
+    if cached is not None:
+        return cached
+    
     now = utc_now()
     period_start = now - timedelta(days=days)
     
-    dealership_id = current_user.dealership_id if current_user.role != UserRole.SUPER_ADMIN else None
-    
     # Build base filters
     call_filter = [CallLog.created_at >= period_start]
     sms_filter = [SMSLog.created_at >= period_start]
@@ -652,34 +1007,35 @@ async def get_communication_overview(
         call_filter.append(CallLog.dealership_id == dealership_id)
         sms_filter.append(SMSLog.dealership_id == dealership_id)
     
-    # Get call stats per user
-    call_stats_result = await db.execute(
+    # Per-user call/SMS stats are independent; run them together. Rows are grouped
+    # by user_id including the NULL group, so summing them yields the period totals.
+    call_stats_result, sms_stats_result = await execute_concurrently(
+        db,
         select(
             CallLog.user_id,
             func.count(CallLog.id).label("total_calls"),
-            func.sum(func.case([(CallLog.direction == CallDirection.INBOUND, 1)], else_=0)).label("inbound_calls"),
-            func.sum(func.case([(CallLog.direction == CallDirection.OUTBOUND, 1)], else_=0)).label("outbound_calls"),
+            func.count().filter(CallLog.direction == CallDirection.INBOUND).label("inbound_calls"),
+            func.count().filter(CallLog.direction == CallDirection.OUTBOUND).label("outbound_calls"),
             func.sum(CallLog.duration_seconds).label("total_duration"),
-            func.sum(func.case([
-                (CallLog.status.in_([CallStatus.NO_ANSWER, CallStatus.BUSY, CallStatus.FAILED]), 1)
-            ], else_=0)).label("missed_calls")
+            func.count().filter(
+                CallLog.status.in_([CallStatus.NO_ANSWER, CallStatus.BUSY, CallStatus.FAILED])
+            ).label("missed_calls")
         )
         .where(and_(*call_filter))
-        .group_by(CallLog.user_id)
-    )
-    call_stats = {row.user_id: row for row in call_stats_result.all()}
-    
-    # Get SMS stats per user
-    sms_stats_result = await db.execute(
+        .group_by(CallLog.user_id),
         select(
             SMSLog.user_id,
-            func.sum(func.case([(SMSLog.direction == MessageDirection.OUTBOUND, 1)], else_=0)).label("sms_sent"),
-            func.sum(func.case([(SMSLog.direction == MessageDirection.INBOUND, 1)], else_=0)).label("sms_received")
+            func.count(SMSLog.id).label("total_sms"),
+            func.count().filter(SMSLog.direction == MessageDirection.OUTBOUND).label("sms_sent"),
+            func.count().filter(SMSLog.direction == MessageDirection.INBOUND).label("sms_received")
         )
         .where(and_(*sms_filter))
-        .group_by(SMSLog.user_id)
+        .group_by(SMSLog.user_id),
     )
+    call_stats = {row.user_id: row for row in call_stats_result.all()}
     sms_stats = {row.user_id: row for row in sms_stats_result.all()}
+    total_calls = sum(row.total_calls for row in call_stats.values())
+    total_sms = sum(row.total_sms for row in sms_stats.values())
     
     # Get all user IDs with activity
     user_ids = set(call_stats.keys()) | set(sms_stats.keys())
@@ -717,18 +1073,7 @@ async def get_communication_overview(
     # Sort by total activity
     user_stats_list.sort(key=lambda x: x.total_calls + x.total_sms_sent, reverse=True)
     
-    # Get totals
-    total_calls_result = await db.execute(
-        select(func.count(CallLog.id)).where(and_(*call_filter))
-    )
-    total_calls = total_calls_result.scalar() or 0
-    
-    total_sms_result = await db.execute(
-        select(func.count(SMSLog.id)).where(and_(*sms_filter))
-    )
-    total_sms = total_sms_result.scalar() or 0
-    
-    return CommunicationOverviewResponse(
+    response = CommunicationOverviewResponse(
         period_start=period_start,
         period_end=now,
         dealership_id=str(dealership_id) if dealership_id else None,
@@ -737,12 +1082,15 @@ async def get_communication_overview(
         total_emails=0,  # TODO: Add email stats
         user_stats=user_stats_list
     )
+    await cache_set(cache_key, response.model_dump(mode="json"), ttl_seconds=COMMUNICATIONS_OVERVIEW_CACHE_TTL_SECONDS)
+    return response
 
 
-@router.get("/communications/activity", response_model=TeamActivityResponse)
+@router.get("/communications/activity", response_model=TeamActivityResponse, response_class=ORJSONResponse)
 async def get_team_activity(
     page: int = Query(1, ge=1),
     page_size: int = Query(50, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page; seeks past it instead of using page"),
     user_id: Optional[UUID] = None,
     type: Optional[str] = Query(None, description="Filter by type: call, sms"),
     db: AsyncSession = Depends(get_db),
@@ -753,79 +1101,125 @@ async def get_team_activity(
     Shows calls and SMS in chronological order.
     """
     dealership_id = current_user.dealership_id if current_user.role != UserRole.SUPER_ADMIN else None
+    offset = (page - 1) * page_size
+    feed_cursor = None
+    if cursor:
+        try:
+            feed_cursor = decode_keyset_cursor(cursor)
+        except ValueError:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
     
-    items = []
-    
-    # Get calls
+    # Merge calls and SMS into one (id, type, created_at) feed; the database
+    # orders and pages it so only the requested page is hydrated below.
+    feed_parts = []
     if not type or type == "call":
-        call_query = select(CallLog, User, Lead).outerjoin(
-            User, CallLog.user_id == User.id
-        ).outerjoin(
-            Lead, CallLog.lead_id == Lead.id
+        call_feed = select(
+            CallLog.id.label("id"),
+            literal_column("'call'").label("type"),
+            CallLog.created_at.label("created_at"),
         )
-        
         if dealership_id:
-            call_query = call_query.where(CallLog.dealership_id == dealership_id)
+            call_feed = call_feed.where(CallLog.dealership_id == dealership_id)
         if user_id:
-            call_query = call_query.where(CallLog.user_id == user_id)
-        
-        call_query = call_query.order_by(CallLog.created_at.desc()).limit(page_size)
-        
-        call_result = await db.execute(call_query)
+            call_feed = call_feed.where(CallLog.user_id == user_id)
+        feed_parts.append(call_feed)
+    if not type or type == "sms":
+        sms_feed = select(
+            SMSLog.id.label("id"),
+            literal_column("'sms'").label("type"),
+            SMSLog.created_at.label("created_at"),
+        )
+        if dealership_id:
+            sms_feed = sms_feed.where(SMSLog.dealership_id == dealership_id)
+        if user_id:
+            sms_feed = sms_feed.where(SMSLog.user_id == user_id)
+        feed_parts.append(sms_feed)
+    
+    if not feed_parts:
+        return TeamActivityResponse(items=[], total=0, page=page, page_size=page_size)
+    
+    feed = (union_all(*feed_parts) if len(feed_parts) > 1 else feed_parts[0]).subquery()
+    # id breaks created_at ties so rows with the same timestamp never repeat or
+    # drop out between pages; a cursor seeks on the same pair instead of OFFSET
+    page_query = select(feed.c.id, feed.c.type, feed.c.created_at).order_by(
+        feed.c.created_at.desc(), feed.c.id.desc()
+    )
+    if feed_cursor:
+        page_query = page_query.where(tuple_(feed.c.created_at, feed.c.id) < feed_cursor)
+    else:
+        page_query = page_query.offset(offset)
+    page_result, total_result = await execute_concurrently(
+        db,
+        page_query.limit(page_size),
+        select(func.count()).select_from(feed),
+    )
+    page_rows = page_result.all()
+    total = total_result.scalar() or 0
+    
+    call_ids = [row.id for row in page_rows if row.type == "call"]
+    sms_ids = [row.id for row in page_rows if row.type == "sms"]
+    items_by_id: dict[UUID, TeamActivityItem] = {}
+    
+    if call_ids:
+        call_result = await db.execute(
+            select(CallLog, User, Lead)
+            .outerjoin(User, CallLog.user_id == User.id)
+            .outerjoin(Lead, CallLog.lead_id == Lead.id)
+            .where(CallLog.id.in_(call_ids))
+        )
         for call, user, lead in call_result.all():
-            items.append(TeamActivityItem(
-                id=str(call.id),
+            items_by_id[call.id] = TeamActivityItem(
+                id=call.id,
                 type="call",
-                user_id=str(call.user_id) if call.user_id else None,
+                user_id=call.user_id,
                 user_name=user.full_name if user else None,
-                lead_id=str(call.lead_id) if call.lead_id else None,
+                lead_id=call.lead_id,
                 lead_name=lead.full_name if lead else None,
                 direction=call.direction.value,
                 summary=f"{call.direction.value.capitalize()} call - {call.status.value} ({call.duration_seconds}s)",
                 timestamp=call.created_at
-            ))
+            )
     
-    # Get SMS
-    if not type or type == "sms":
-        sms_query = select(SMSLog, User, Lead).outerjoin(
-            User, SMSLog.user_id == User.id
-        ).outerjoin(
-            Lead, SMSLog.lead_id == Lead.id
-        )
-        
-        if dealership_id:
-            sms_query = sms_query.where(SMSLog.dealership_id == dealership_id)
-        if user_id:
-            sms_query = sms_query.where(SMSLog.user_id == user_id)
-        
-        sms_query = sms_query.order_by(SMSLog.created_at.desc()).limit(page_size)
-        
-        sms_result = await db.execute(sms_query)
-        for sms, user, lead in sms_result.all():
-            items.append(TeamActivityItem(
-                id=str(sms.id),
+    if sms_ids:
+        # Only the 50-char preview (plus one char to detect overflow) leaves the database
+        sms_result = await db.execute(
+            select(
+                SMSLog.id,
+                SMSLog.user_id,
+                SMSLog.lead_id,
+                SMSLog.direction,
+                SMSLog.created_at,
+                func.substr(SMSLog.body, 1, 51).label("body_preview"),
+                User,
+                Lead,
+            )
+            .outerjoin(User, SMSLog.user_id == User.id)
+            .outerjoin(Lead, SMSLog.lead_id == Lead.id)
+            .where(SMSLog.id.in_(sms_ids))
+        )
+        for sms in sms_result.all():
+            preview = sms.body_preview or ""
+            items_by_id[sms.id] = TeamActivityItem(
+                id=sms.id,
                 type="sms",
-                user_id=str(sms.user_id) if sms.user_id else None,
-                user_name=user.full_name if user else None,
-                lead_id=str(sms.lead_id) if sms.lead_id else None,
-                lead_name=lead.full_name if lead else None,
+                user_id=sms.user_id,
+                user_name=sms.User.full_name if sms.User else None,
+                lead_id=sms.lead_id,
+                lead_name=sms.Lead.full_name if sms.Lead else None,
                 direction=sms.direction.value,
-                summary=f"SMS {sms.direction.value}: {sms.body[:50]}..." if len(sms.body) > 50 else f"SMS {sms.direction.value}: {sms.body}",
+                summary=f"SMS {sms.direction.value}: {preview[:50]}..." if len(preview) > 50 else f"SMS {sms.direction.value}: {preview}",
                 timestamp=sms.created_at
-            ))
-    
-    # Sort by timestamp
-    items.sort(key=lambda x: x.timestamp, reverse=True)
-    
-    # Paginate
-    offset = (page - 1) * page_size
-    paginated_items = items[offset:offset + page_size]
+            )
     
     return TeamActivityResponse(
-        items=paginated_items,
-        total=len(items),
+        items=[items_by_id[row.id] for row in page_rows if row.id in items_by_id],
+        total=total,
         page=page,
-        page_size=page_size
+        page_size=page_size,
+        next_cursor=(
+            encode_keyset_cursor(page_rows[-1].created_at, page_rows[-1].id)
+            if len(page_rows) == page_size else None
+        ),
     )
 
 
@@ -843,10 +1237,11 @@ async def _resolve_dealership_and_lead_filters(
     For BDC users, validates dealership_id is in their accessible list.
     """
     resolved = None
+    role = current_user.role
     
-    if current_user.role == UserRole.SUPER_ADMIN:
+    if role == UserRole.SUPER_ADMIN:
         resolved = dealership_id  # Super admin can view any dealership
-    elif current_user.role == UserRole.BDC:
+    elif role == UserRole.BDC:
         # BDC users can access multiple dealerships via user_dealership_access
         accessible_ids = await get_accessible_dealership_ids(db, current_user)
         if dealership_id is not None:
@@ -888,10 +1283,10 @@ async def _resolve_dealership_and_lead_filters(
     return resolved, lead_filters, has_lead_specific_filters
 
 
-@router.get("/analysis", response_model=DealershipAnalysisResponse)
+@router.get("/analysis", response_model=DealershipAnalysisResponse, response_class=ORJSONResponse)
 async def get_dealership_analysis(
-    date_from: Optional[str] = Query(None, description="ISO date for range start"),
-    date_to: Optional[str] = Query(None, description="ISO date for range end"),
+    date_from: Optional[datetime] = Query(None, description="ISO date for range start"),
+    date_to: Optional[datetime] = Query(None, description="ISO date for range end"),
     dealership_id: Optional[UUID] = Query(None, description="Dealership to scope (super_admin only)"),
     assigned_to: Optional[UUID] = Query(None, description="Filter by salesperson"),
     bdc_agent_id: Optional[UUID] = Query(None, description="Filter by BDC agent"),
@@ -916,19 +1311,23 @@ async def get_dealership_analysis(
         )
     lead_filters_base = and_(*lead_filters) if lead_filters else (Lead.dealership_id == resolved_dealership_id)
 
-    # Optional date range (leads by created_at; activities by their own timestamps)
-    activity_date_from = None
-    activity_date_to = None
-    if date_from:
-        try:
-            activity_date_from = datetime.fromisoformat(date_from.replace("Z", "+00:00"))
-        except ValueError:
-            pass
-    if date_to:
-        try:
-            activity_date_to = datetime.fromisoformat(date_to.replace("Z", "+00:00"))
-        except ValueError:
-            pass
+    # Optional date range (leads by created_at; activities by their own timestamps).
+    # FastAPI has already parsed and validated both values.
+    activity_date_from = _as_utc(date_from)
+    activity_date_to = _as_utc(date_to)
+
+    cache_key = _analytics_cache_key(
+        "dealership_analysis", resolved_dealership_id, activity_date_from, activity_date_to, assigned_to, bdc_agent_id, source, stage_id
+    )
+    cached = await cache_get(cache_key)
+    if cached is not None:
+        return ORJSONResponse(cached)
+
+    # UTC Fridays/Saturdays of a bounded period for the day-of-week cards (None: no such day)
+    fridays = saturdays = None
+    if activity_date_from is not None and activity_date_to is not None:
+        fridays = _utc_weekday_days(activity_date_from, activity_date_to, 5, "fridays")
+        saturdays = _utc_weekday_days(activity_date_from, activity_date_to, 6, "saturdays")
 
     # Lead overview counts: respect date range via Lead.created_at
     lead_period_filters = list(lead_filters) if lead_filters else [Lead.dealership_id == resolved_dealership_id]
@@ -939,28 +1338,23 @@ async def get_dealership_analysis(
     lead_filters_in_period = and_(*lead_period_filters)
 
     # --- Dealership summary (leads in period; activities use all matching leads) ---
-    total_leads_result = await db.execute(select(func.count()).select_from(Lead).where(lead_filters_in_period))
-    total_leads = total_leads_result.scalar() or 0
-
-    active_result = await db.execute(
-        select(func.count()).select_from(Lead).where(and_(lead_filters_in_period, Lead.is_active == True))
-    )
-    active_leads = active_result.scalar() or 0
-
     # Activity/appt/check-in scoping uses all leads matching non-date filters so
     # period activity on older leads is still counted.
-    lead_ids_result = await db.execute(select(Lead.id).where(lead_filters_base))
-    lead_ids = [r[0] for r in lead_ids_result.fetchall()]
+    # The lead set stays in the database as a subquery instead of a Python IN-list.
+    lead_ids_subq = select(Lead.id).where(lead_filters_base)
 
     # If lead-specific filters were applied but no leads match, all activity counts should be 0
-    no_matching_leads = has_lead_specific_filters and not lead_ids
+    no_matching_leads = False
+    if has_lead_specific_filters:
+        any_lead_result = await db.execute(select(lead_ids_subq.exists()))
+        no_matching_leads = not any_lead_result.scalar()
 
     # Converted/sold in the selected period (NOT "created in period and currently converted").
     # Union of: (1) leads with sold/converted date in range, (2) check-ins with outcome=sold
     # in range (same date field as the Check-ins table). Matches what JB compares.
-    if no_matching_leads:
-        converted_leads = 0
-    else:
+    converted_leads = 0
+    converted_count_q = None
+    if not no_matching_leads:
         converted_lead_filters = list(lead_filters) if lead_filters else [Lead.dealership_id == resolved_dealership_id]
         converted_lead_filters.append(Lead.outcome == "converted")
         if activity_date_from is not None or activity_date_to is not None:
@@ -973,8 +1367,7 @@ async def get_dealership_analysis(
             ShowroomVisit.dealership_id == resolved_dealership_id,
             ShowroomVisit.outcome == ShowroomOutcome.SOLD,
         ]
-        if lead_ids:
-            sold_visit_filters.append(ShowroomVisit.lead_id.in_(lead_ids))
+        sold_visit_filters.append(ShowroomVisit.lead_id.in_(lead_ids_subq))
         if activity_date_from is not None:
             sold_visit_filters.append(ShowroomVisit.checked_in_at >= activity_date_from)
         if activity_date_to is not None:
@@ -982,139 +1375,158 @@ async def get_dealership_analysis(
         converted_from_visits_q = select(ShowroomVisit.lead_id).where(and_(*sold_visit_filters))
 
         converted_union = converted_from_leads_q.union(converted_from_visits_q).subquery()
-        converted_result = await db.execute(select(func.count()).select_from(converted_union))
-        converted_leads = converted_result.scalar() or 0
-
-    activity_filters = [Activity.dealership_id == resolved_dealership_id]
-    if lead_ids:
-        activity_filters.append(Activity.lead_id.in_(lead_ids))
-    if activity_date_from is not None:
-        activity_filters.append(Activity.created_at >= activity_date_from)
-    if activity_date_to is not None:
-        activity_filters.append(Activity.created_at <= activity_date_to)
-
-    if no_matching_leads:
-        total_notes = 0
-    else:
-        total_notes_result = await db.execute(
-            select(func.count()).select_from(Activity).where(
-                and_(*activity_filters, Activity.type == ActivityType.NOTE_ADDED)
+        converted_count_q = select(func.count().label("converted_leads")).select_from(converted_union)
+
+    # Without lead-specific filters the summary counts come from the hourly rollup
+    # view when the range is hour-aligned (the analytics page sends local day bounds)
+    # and ends before today, so the totals agree with the live per-salesperson rows;
+    # the converted count goes out alongside it, or with the live aggregates below.
+    rollup = None
+    if not has_lead_specific_filters:
+        rollup_window = _closed_rollup_window(activity_date_from, activity_date_to)
+        if rollup_window is not None:
+            rollup_start, rollup_end = rollup_window
+            rollup_result, converted_result = await execute_concurrently(
+                db,
+                _HOURLY_ROLLUP_TOTALS.params(
+                    dealership_id=resolved_dealership_id, start=rollup_start, end=rollup_end
+                ),
+                converted_count_q,
             )
-        )
-        total_notes = total_notes_result.scalar() or 0
-
-    appt_filters = [Appointment.dealership_id == resolved_dealership_id]
-    if lead_ids:
-        appt_filters.append(
-            or_(Appointment.lead_id.is_(None), Appointment.lead_id.in_(lead_ids))
-        )
-    if activity_date_from is not None:
-        appt_filters.append(Appointment.created_at >= activity_date_from)
-    if activity_date_to is not None:
-        appt_filters.append(Appointment.created_at <= activity_date_to)
-    appt_filters_base = and_(*appt_filters)
-    
-    if no_matching_leads:
-        total_appointments = 0
-        total_appointments_scheduled_in_period = 0
-        total_appointments_confirmed_in_period = 0
+            rollup = _rollup_counts_by_metric(rollup_result)
+            converted_leads = converted_result.scalar() or 0
+
+    if rollup is not None:
+        total_leads = rollup.get("leads", _EMPTY_ROLLUP).total
+        active_leads = rollup.get("active_leads", _EMPTY_ROLLUP).total
+        total_notes = rollup.get("notes", _EMPTY_ROLLUP).total
+        total_appointments = rollup.get("appointments_set", _EMPTY_ROLLUP).total
+        total_appointments_scheduled_in_period = rollup.get("appointments_scheduled", _EMPTY_ROLLUP).total
+        total_appointments_confirmed_in_period = rollup.get("appointments_confirmed", _EMPTY_ROLLUP).total
+        total_follow_ups_scheduled_in_period = rollup.get("follow_ups_scheduled", _EMPTY_ROLLUP).total
+        total_follow_ups_completed_in_period = rollup.get("follow_ups_completed", _EMPTY_ROLLUP).total
+        notes_friday = rollup.get("notes", _EMPTY_ROLLUP).friday
+        outbound_calls_friday = rollup.get("outbound_calls", _EMPTY_ROLLUP).friday
+        appointments_contacted_saturday = rollup.get("appointments_slotted", _EMPTY_ROLLUP).saturday
+        total_check_ins_in_period = rollup.get("check_ins", _EMPTY_ROLLUP).total
     else:
-        # "Appts set": any appointment created in period that was not cancelled/rescheduled
-        total_appointments_result = await db.execute(
-            select(func.count()).select_from(Appointment).where(
-                and_(appt_filters_base, Appointment.status.in_(APPOINTMENT_SET_STATUSES))
+        # Every live summary count goes out in one statement: each aggregate below
+        # returns exactly one row, and they are cross-joined into a single result row.
+        summary_aggregates = [
+            select(
+                func.count().label("total_leads"),
+                func.count().filter(Lead.is_active == True).label("active_leads"),
+            ).select_from(Lead).where(lead_filters_in_period)
+        ]
+
+        if not no_matching_leads:
+            activity_filters = [Activity.dealership_id == resolved_dealership_id, Activity.lead_id.in_(lead_ids_subq)]
+            if activity_date_from is not None:
+                activity_filters.append(Activity.created_at >= activity_date_from)
+            if activity_date_to is not None:
+                activity_filters.append(Activity.created_at <= activity_date_to)
+            note_counts = [func.count().label("total_notes")]
+            if activity_date_from is not None and activity_date_to is not None:
+                # Friday notes come out of the same scan (dow 0=Sun, 5=Fri, 6=Sat)
+                note_counts.append(
+                    func.count().filter(
+                        _on_utc_weekday(Activity.created_at, activity_date_from, activity_date_to, 5)
+                    ).label("notes_friday")
+                )
+            summary_aggregates.append(
+                select(*note_counts).select_from(Activity).where(
+                    and_(*activity_filters, Activity.type == ActivityType.NOTE_ADDED)
+                )
             )
-        )
-        total_appointments = total_appointments_result.scalar() or 0
-        # Status breakdown (current status among appts created in period)
-        total_appointments_scheduled_in_period_result = await db.execute(
-            select(func.count()).select_from(Appointment).where(
-                and_(appt_filters_base, Appointment.status == AppointmentStatus.SCHEDULED)
+
+            appt_filters = [
+                Appointment.dealership_id == resolved_dealership_id,
+                or_(Appointment.lead_id.is_(None), Appointment.lead_id.in_(lead_ids_subq)),
+            ]
+            if activity_date_from is not None:
+                appt_filters.append(Appointment.created_at >= activity_date_from)
+            if activity_date_to is not None:
+                appt_filters.append(Appointment.created_at <= activity_date_to)
+            # "Appts set": any appointment created in period that was not cancelled/rescheduled,
+            # plus the status breakdown (current status among appts created in period)
+            summary_aggregates.append(
+                select(
+                    func.count().filter(Appointment.status.in_(APPOINTMENT_SET_STATUSES)).label("total_appointments"),
+                    func.count().filter(Appointment.status == AppointmentStatus.SCHEDULED).label("total_appointments_scheduled_in_period"),
+                    func.count().filter(Appointment.status == AppointmentStatus.CONFIRMED).label("total_appointments_confirmed_in_period"),
+                ).select_from(Appointment).where(and_(*appt_filters))
             )
-        )
-        total_appointments_scheduled_in_period = total_appointments_scheduled_in_period_result.scalar() or 0
-        total_appointments_confirmed_in_period_result = await db.execute(
-            select(func.count()).select_from(Appointment).where(
-                and_(appt_filters_base, Appointment.status == AppointmentStatus.CONFIRMED)
+
+            fu_scheduled_filters = []
+            fu_completed_filters = [FollowUp.status == FollowUpStatus.COMPLETED]
+            if activity_date_from is not None:
+                fu_scheduled_filters.append(FollowUp.created_at >= activity_date_from)
+                fu_completed_filters.append(FollowUp.completed_at >= activity_date_from)
+            if activity_date_to is not None:
+                fu_scheduled_filters.append(FollowUp.created_at <= activity_date_to)
+                fu_completed_filters.append(FollowUp.completed_at <= activity_date_to)
+            summary_aggregates.append(
+                select(
+                    func.count().filter(and_(true(), *fu_scheduled_filters)).label("total_follow_ups_scheduled_in_period"),
+                    func.count().filter(and_(*fu_completed_filters)).label("total_follow_ups_completed_in_period"),
+                ).select_from(FollowUp).where(FollowUp.lead_id.in_(lead_ids_subq))
             )
-        )
-        total_appointments_confirmed_in_period = total_appointments_confirmed_in_period_result.scalar() or 0
 
-    if lead_ids:
-        fu_scheduled_filters = [FollowUp.lead_id.in_(lead_ids)]
-        fu_completed_filters = [FollowUp.lead_id.in_(lead_ids), FollowUp.status == FollowUpStatus.COMPLETED]
-        if activity_date_from is not None:
-            fu_scheduled_filters.append(FollowUp.created_at >= activity_date_from)
-            fu_completed_filters.append(FollowUp.completed_at >= activity_date_from)
-        if activity_date_to is not None:
-            fu_scheduled_filters.append(FollowUp.created_at <= activity_date_to)
-            fu_completed_filters.append(FollowUp.completed_at <= activity_date_to)
-        total_follow_ups_scheduled_result = await db.execute(
-            select(func.count()).select_from(FollowUp).where(and_(*fu_scheduled_filters))
-        )
-        total_follow_ups_scheduled_in_period = total_follow_ups_scheduled_result.scalar() or 0
-        total_follow_ups_completed_result = await db.execute(
-            select(func.count()).select_from(FollowUp).where(and_(*fu_completed_filters))
-        )
-        total_follow_ups_completed_in_period = total_follow_ups_completed_result.scalar() or 0
-    else:
-        total_follow_ups_scheduled_in_period = 0
-        total_follow_ups_completed_in_period = 0
-    total_follow_ups = total_follow_ups_scheduled_in_period + total_follow_ups_completed_in_period
+            # Remaining day-of-week metrics and check-ins (only when date range is set)
+            if activity_date_from is not None and activity_date_to is not None:
+                # Friday/Saturday counts join the period's calendar days (no such day: count is 0)
+                if fridays is not None:
+                    summary_aggregates.append(
+                        _count_lead_scoped(
+                            _join_utc_weekday_days(CallLog, CallLog.started_at, fridays),
+                            CallLog.lead_id, lead_ids_subq,
+                            CallLog.dealership_id == resolved_dealership_id,
+                            CallLog.direction == CallDirection.OUTBOUND,
+                            CallLog.started_at >= activity_date_from,
+                            CallLog.started_at <= activity_date_to,
+                            label="outbound_calls_friday",
+                        )
+                    )
+                if saturdays is not None:
+                    summary_aggregates.append(
+                        _count_lead_scoped(
+                            _join_utc_weekday_days(Appointment, Appointment.scheduled_at, saturdays),
+                            Appointment.lead_id, lead_ids_subq,
+                            Appointment.dealership_id == resolved_dealership_id,
+                            Appointment.scheduled_at >= activity_date_from,
+                            Appointment.scheduled_at <= activity_date_to,
+                            label="appointments_contacted_saturday",
+                        )
+                    )
+                # Check-ins in period (showroom visits with checked_in_at in date range)
+                summary_aggregates.append(
+                    select(func.count().label("total_check_ins_in_period")).select_from(ShowroomVisit).where(
+                        ShowroomVisit.dealership_id == resolved_dealership_id,
+                        ShowroomVisit.lead_id.in_(lead_ids_subq),
+                        ShowroomVisit.checked_in_at >= activity_date_from,
+                        ShowroomVisit.checked_in_at <= activity_date_to,
+                    )
+                )
 
-    # Day-of-week metrics (only when date range is set; dow 0=Sun, 5=Fri, 6=Sat)
-    notes_friday = 0
-    outbound_calls_friday = 0
-    appointments_contacted_saturday = 0
-    if activity_date_from is not None and activity_date_to is not None and not no_matching_leads:
-        notes_fri_filters = list(activity_filters) + [Activity.type == ActivityType.NOTE_ADDED, extract("dow", Activity.created_at) == 5]
-        notes_friday_result = await db.execute(
-            select(func.count()).select_from(Activity).where(and_(*notes_fri_filters))
-        )
-        notes_friday = notes_friday_result.scalar() or 0
-        call_fri_filters = [
-            CallLog.dealership_id == resolved_dealership_id,
-            CallLog.direction == CallDirection.OUTBOUND,
-            CallLog.started_at >= activity_date_from,
-            CallLog.started_at <= activity_date_to,
-            extract("dow", CallLog.started_at) == 5,
-        ]
-        if lead_ids:
-            call_fri_filters.append(
-                or_(CallLog.lead_id.is_(None), CallLog.lead_id.in_(lead_ids))
-            )
-        outbound_calls_friday_result = await db.execute(
-            select(func.count()).select_from(CallLog).where(and_(*call_fri_filters))
-        )
-        outbound_calls_friday = outbound_calls_friday_result.scalar() or 0
-        appt_sat_filters = [
-            Appointment.dealership_id == resolved_dealership_id,
-            Appointment.scheduled_at >= activity_date_from,
-            Appointment.scheduled_at <= activity_date_to,
-            extract("dow", Appointment.scheduled_at) == 6,
-        ]
-        if lead_ids:
-            appt_sat_filters.append(
-                or_(Appointment.lead_id.is_(None), Appointment.lead_id.in_(lead_ids))
-            )
-        appointments_contacted_saturday_result = await db.execute(
-            select(func.count()).select_from(Appointment).where(and_(*appt_sat_filters))
-        )
-        appointments_contacted_saturday = appointments_contacted_saturday_result.scalar() or 0
+        if converted_count_q is not None:
+            summary_aggregates.append(converted_count_q)
+
+        summary_counts = await _execute_single_row_aggregates(db, summary_aggregates)
+        converted_leads = summary_counts.get("converted_leads", 0)
+        total_leads = summary_counts["total_leads"]
+        active_leads = summary_counts["active_leads"]
+        total_notes = summary_counts.get("total_notes", 0)
+        total_appointments = summary_counts.get("total_appointments", 0)
+        total_appointments_scheduled_in_period = summary_counts.get("total_appointments_scheduled_in_period", 0)
+        total_appointments_confirmed_in_period = summary_counts.get("total_appointments_confirmed_in_period", 0)
+        total_follow_ups_scheduled_in_period = summary_counts.get("total_follow_ups_scheduled_in_period", 0)
+        total_follow_ups_completed_in_period = summary_counts.get("total_follow_ups_completed_in_period", 0)
+        notes_friday = summary_counts.get("notes_friday", 0)
+        outbound_calls_friday = summary_counts.get("outbound_calls_friday", 0)
+        appointments_contacted_saturday = summary_counts.get("appointments_contacted_saturday", 0)
+        total_check_ins_in_period = summary_counts.get("total_check_ins_in_period", 0)
 
-    # Check-ins in period (showroom visits with checked_in_at in date range)
-    total_check_ins_in_period = 0
-    if lead_ids and activity_date_from is not None and activity_date_to is not None and not no_matching_leads:
-        check_in_filters = [
-            ShowroomVisit.dealership_id == resolved_dealership_id,
-            ShowroomVisit.lead_id.in_(lead_ids),
-            ShowroomVisit.checked_in_at >= activity_date_from,
-            ShowroomVisit.checked_in_at <= activity_date_to,
-        ]
-        check_in_result = await db.execute(
-            select(func.count()).select_from(ShowroomVisit).where(and_(*check_in_filters))
-        )
-        total_check_ins_in_period = check_in_result.scalar() or 0
+    total_follow_ups = total_follow_ups_scheduled_in_period + total_follow_ups_completed_in_period
 
     summary = DealershipSummary(
         total_leads=total_leads,
@@ -1133,11 +1545,17 @@ async def get_dealership_analysis(
         total_check_ins_in_period=total_check_ins_in_period,
     )
 
-    # --- Latest note content per salesperson: one row per assigned_to via subquery (avoids loading all rows) ---
-    last_note_subq = (
+    # --- Per-salesperson: every statement below is independent of the others (salesperson
+    # scope is a subquery, not a Python id list), so they all run concurrently. Each count
+    # statement labels its key "user_id" and its counts with the sp_data field names.
+    has_period = activity_date_from is not None and activity_date_to is not None
+    sp_ids_subq = _ACTIVE_SALESPERSON_IDS.params(dealership_id=resolved_dealership_id)
+
+    # Latest note content per salesperson: DISTINCT ON keeps the newest note per assigned_to in one pass
+    last_note_q = (
         select(
-            Lead.assigned_to.label("assigned_to"),
-            func.max(Activity.created_at).label("max_ts"),
+            Lead.assigned_to,
+            Activity.meta_data["content"].astext.label("content"),
         )
         .select_from(Activity)
         .join(Lead, Lead.id == Activity.lead_id)
@@ -1147,316 +1565,148 @@ async def get_dealership_analysis(
                 Lead.assigned_to.isnot(None),
                 Lead.dealership_id == resolved_dealership_id,
                 Activity.user_id == Lead.assigned_to,
+                Activity.lead_id.in_(lead_ids_subq),
             )
         )
+        .distinct(Lead.assigned_to)
+        .order_by(Lead.assigned_to, Activity.created_at.desc())
+    )
+
+    # Leads per assigned_to (same date window as Total Leads)
+    lead_sp_q = (
+        select(Lead.assigned_to.label("user_id"), func.count().label("leads_assigned"))
+        .select_from(Lead)
+        .where(lead_filters_in_period, Lead.assigned_to.in_(sp_ids_subq))
         .group_by(Lead.assigned_to)
-        .subquery()
     )
-    last_note_q = (
-        select(Lead.assigned_to, Activity.meta_data)
+
+    # Notes in period per user_id
+    note_sp_filters = [Activity.user_id.in_(sp_ids_subq), Activity.type == ActivityType.NOTE_ADDED]
+    if activity_date_from is not None:
+        note_sp_filters.append(Activity.created_at >= activity_date_from)
+    if activity_date_to is not None:
+        note_sp_filters.append(Activity.created_at <= activity_date_to)
+    note_sp_counts = [func.count().label("notes_added")]
+    if has_period:
+        # Friday notes share the scan (dow 5); only reported for a bounded period
+        note_sp_counts.append(
+            func.count().filter(
+                _on_utc_weekday(Activity.created_at, activity_date_from, activity_date_to, 5)
+            ).label("notes_friday")
+        )
+    note_sp_q = (
+        select(Activity.user_id.label("user_id"), *note_sp_counts)
         .select_from(Activity)
-        .join(Lead, Lead.id == Activity.lead_id)
-        .join(
-            last_note_subq,
-            and_(
-                Lead.assigned_to == last_note_subq.c.assigned_to,
-                Activity.created_at == last_note_subq.c.max_ts,
-            ),
-        )
-        .where(
-            and_(
-                Activity.type == ActivityType.NOTE_ADDED,
-                Lead.dealership_id == resolved_dealership_id,
-                Activity.user_id == Lead.assigned_to,
-            )
-        )
+        .where(and_(*note_sp_filters))
+        .group_by(Activity.user_id)
     )
-    if lead_ids:
-        last_note_q = last_note_q.where(Activity.lead_id.in_(lead_ids))
-    last_note_result = await db.execute(last_note_q)
-    last_note_rows = last_note_result.all()
-    last_note_by_user: dict[UUID, str] = {}
-    for row in last_note_rows:
-        if row.assigned_to and row.assigned_to not in last_note_by_user:
-            meta = row.meta_data if isinstance(row.meta_data, dict) else {}
-            content = meta.get("content") if meta else None
-            if content:
-                last_note_by_user[row.assigned_to] = content
 
-    # --- Per-salesperson: fetch all salespersons then batch all counts (GROUP BY) to avoid N*17 queries ---
-    salespersons_result = await db.execute(
-        select(User).where(
-            and_(
-                User.dealership_id == resolved_dealership_id,
-                User.role == UserRole.SALESPERSON,
-                User.is_active == True,
-            )
-        )
+    # FollowUp: all five metrics in one scan grouped by assigned_to
+    fu_sched_conds = [FollowUp.lead_id.in_(lead_ids_subq)]
+    fu_done_conds = [FollowUp.status == FollowUpStatus.COMPLETED, FollowUp.lead_id.in_(lead_ids_subq)]
+    if activity_date_from is not None:
+        fu_sched_conds.append(FollowUp.created_at >= activity_date_from)
+        fu_done_conds.append(FollowUp.completed_at >= activity_date_from)
+    if activity_date_to is not None:
+        fu_sched_conds.append(FollowUp.created_at <= activity_date_to)
+        fu_done_conds.append(FollowUp.completed_at <= activity_date_to)
+    fu_sp_q = (
+        select(
+            FollowUp.assigned_to.label("user_id"),
+            func.count().label("follow_ups_total"),
+            func.count().filter(FollowUp.status == FollowUpStatus.PENDING).label("follow_ups_pending"),
+            func.count().filter(
+                and_(FollowUp.status == FollowUpStatus.PENDING, FollowUp.scheduled_at < now)
+            ).label("follow_ups_overdue"),
+            func.count().filter(and_(*fu_sched_conds)).label("follow_ups_scheduled_in_period"),
+            func.count().filter(and_(*fu_done_conds)).label("follow_ups_completed_in_period"),
+        )
+        .where(FollowUp.assigned_to.in_(sp_ids_subq))
+        .group_by(FollowUp.assigned_to)
     )
-    salespersons = salespersons_result.scalars().all()
-    sp_ids = [sp.id for sp in salespersons]
-    now_ts = now
-
-    # Defaults per sp (all zeros)
-    sp_data: dict[UUID, dict[str, int]] = {sp_id: {
-        "leads_assigned": 0, "notes_added": 0,
-        "follow_ups_total": 0, "follow_ups_pending": 0, "follow_ups_overdue": 0,
-        "follow_ups_scheduled_in_period": 0, "follow_ups_completed_in_period": 0,
-        "appointments_total": 0, "appointments_scheduled": 0, "appointments_confirmed": 0,
-        "appointments_scheduled_in_period": 0, "appointments_confirmed_in_period": 0,
-        "notes_friday": 0, "outbound_calls_friday": 0, "appointments_contacted_saturday": 0,
-        "check_ins_in_period": 0,
-    } for sp_id in sp_ids}
-
-    if sp_ids:
-        # Leads per assigned_to (same date window as Total Leads)
-        lead_sp_base = and_(lead_filters_in_period, Lead.assigned_to.in_(sp_ids))
-        lead_sp_result = await db.execute(
-            select(Lead.assigned_to, func.count()).select_from(Lead).where(lead_sp_base).group_by(Lead.assigned_to)
-        )
-        for row in lead_sp_result.all():
-            if row[0]:
-                sp_data[row[0]]["leads_assigned"] = row[1] or 0
-
-        # Notes in period per user_id
-        note_sp_filters = [Activity.user_id.in_(sp_ids), Activity.type == ActivityType.NOTE_ADDED]
-        if activity_date_from is not None:
-            note_sp_filters.append(Activity.created_at >= activity_date_from)
-        if activity_date_to is not None:
-            note_sp_filters.append(Activity.created_at <= activity_date_to)
-        note_sp_result = await db.execute(
-            select(Activity.user_id, func.count()).select_from(Activity).where(and_(*note_sp_filters)).group_by(Activity.user_id)
-        )
-        for row in note_sp_result.all():
-            if row[0]:
-                sp_data[row[0]]["notes_added"] = row[1] or 0
 
-        # FollowUp: total, pending, overdue
-        fu_total_result = await db.execute(
-            select(FollowUp.assigned_to, func.count()).select_from(FollowUp).where(FollowUp.assigned_to.in_(sp_ids)).group_by(FollowUp.assigned_to)
-        )
-        for row in fu_total_result.all():
-            if row[0]:
-                sp_data[row[0]]["follow_ups_total"] = row[1] or 0
-        fu_pending_result = await db.execute(
-            select(FollowUp.assigned_to, func.count()).select_from(FollowUp).where(
-                and_(FollowUp.assigned_to.in_(sp_ids), FollowUp.status == FollowUpStatus.PENDING)
-            ).group_by(FollowUp.assigned_to)
-        )
-        for row in fu_pending_result.all():
-            if row[0]:
-                sp_data[row[0]]["follow_ups_pending"] = row[1] or 0
-        fu_overdue_result = await db.execute(
-            select(FollowUp.assigned_to, func.count()).select_from(FollowUp).where(
+    # Appointments: all-time status counts, in-period counts (same dealership and
+    # lead scope) and Saturday slots, in one scan grouped by assigned_to
+    appt_scope = and_(
+        Appointment.dealership_id == resolved_dealership_id,
+        or_(Appointment.lead_id.is_(None), Appointment.lead_id.in_(lead_ids_subq)),
+    )
+    appt_created_conds = [appt_scope]
+    if activity_date_from is not None:
+        appt_created_conds.append(Appointment.created_at >= activity_date_from)
+    if activity_date_to is not None:
+        appt_created_conds.append(Appointment.created_at <= activity_date_to)
+    appt_sp_counts = [
+        func.count().label("appointments_total"),
+        func.count().filter(Appointment.status == AppointmentStatus.SCHEDULED).label("appointments_scheduled"),
+        func.count().filter(Appointment.status == AppointmentStatus.CONFIRMED).label("appointments_confirmed"),
+        # Appointments set in period (all non-cancelled/rescheduled statuses)
+        func.count().filter(
+            and_(*appt_created_conds, Appointment.status.in_(APPOINTMENT_SET_STATUSES))
+        ).label("appointments_scheduled_in_period"),
+        func.count().filter(
+            and_(*appt_created_conds, Appointment.status == AppointmentStatus.CONFIRMED)
+        ).label("appointments_confirmed_in_period"),
+    ]
+    if has_period:
+        # Day-of-week: appointments slotted on Saturday (dow 6)
+        appt_sp_counts.append(
+            func.count().filter(
                 and_(
-                    FollowUp.assigned_to.in_(sp_ids),
-                    FollowUp.status == FollowUpStatus.PENDING,
-                    FollowUp.scheduled_at < now_ts,
+                    appt_scope,
+                    Appointment.scheduled_at >= activity_date_from,
+                    Appointment.scheduled_at <= activity_date_to,
+                    _on_utc_weekday(Appointment.scheduled_at, activity_date_from, activity_date_to, 6),
                 )
-            ).group_by(FollowUp.assigned_to)
-        )
-        for row in fu_overdue_result.all():
-            if row[0]:
-                sp_data[row[0]]["follow_ups_overdue"] = row[1] or 0
-
-        # FollowUp: scheduled/completed in period
-        fu_sched_filters = [FollowUp.assigned_to.in_(sp_ids)]
-        if lead_ids:
-            fu_sched_filters.append(FollowUp.lead_id.in_(lead_ids))
-        if activity_date_from is not None:
-            fu_sched_filters.append(FollowUp.created_at >= activity_date_from)
-        if activity_date_to is not None:
-            fu_sched_filters.append(FollowUp.created_at <= activity_date_to)
-        fu_sched_result = await db.execute(
-            select(FollowUp.assigned_to, func.count()).select_from(FollowUp).where(and_(*fu_sched_filters)).group_by(FollowUp.assigned_to)
+            ).label("appointments_contacted_saturday")
         )
-        for row in fu_sched_result.all():
-            if row[0]:
-                sp_data[row[0]]["follow_ups_scheduled_in_period"] = row[1] or 0
-        fu_done_filters = [FollowUp.assigned_to.in_(sp_ids), FollowUp.status == FollowUpStatus.COMPLETED]
-        if lead_ids:
-            fu_done_filters.append(FollowUp.lead_id.in_(lead_ids))
-        if activity_date_from is not None:
-            fu_done_filters.append(FollowUp.completed_at >= activity_date_from)
-        if activity_date_to is not None:
-            fu_done_filters.append(FollowUp.completed_at <= activity_date_to)
-        fu_done_result = await db.execute(
-            select(FollowUp.assigned_to, func.count()).select_from(FollowUp).where(and_(*fu_done_filters)).group_by(FollowUp.assigned_to)
-        )
-        for row in fu_done_result.all():
-            if row[0]:
-                sp_data[row[0]]["follow_ups_completed_in_period"] = row[1] or 0
-
-        # Appointments: total, scheduled, confirmed (all-time)
-        appt_total_result = await db.execute(
-            select(Appointment.assigned_to, func.count()).select_from(Appointment).where(
-                Appointment.assigned_to.in_(sp_ids)
-            ).group_by(Appointment.assigned_to)
-        )
-        for row in appt_total_result.all():
-            if row[0]:
-                sp_data[row[0]]["appointments_total"] = row[1] or 0
-        appt_sched_result = await db.execute(
-            select(Appointment.assigned_to, func.count()).select_from(Appointment).where(
-                and_(Appointment.assigned_to.in_(sp_ids), Appointment.status == AppointmentStatus.SCHEDULED)
-            ).group_by(Appointment.assigned_to)
-        )
-        for row in appt_sched_result.all():
-            if row[0]:
-                sp_data[row[0]]["appointments_scheduled"] = row[1] or 0
-        appt_conf_result = await db.execute(
-            select(Appointment.assigned_to, func.count()).select_from(Appointment).where(
-                and_(Appointment.assigned_to.in_(sp_ids), Appointment.status == AppointmentStatus.CONFIRMED)
-            ).group_by(Appointment.assigned_to)
-        )
-        for row in appt_conf_result.all():
-            if row[0]:
-                sp_data[row[0]]["appointments_confirmed"] = row[1] or 0
+    appt_sp_q = (
+        select(Appointment.assigned_to.label("user_id"), *appt_sp_counts)
+        .where(Appointment.assigned_to.in_(sp_ids_subq))
+        .group_by(Appointment.assigned_to)
+    )
 
-        # Appointments set in period (all non-cancelled/rescheduled statuses)
-        appt_period_filters = [
-            Appointment.assigned_to.in_(sp_ids),
-            Appointment.dealership_id == resolved_dealership_id,
-            Appointment.status.in_(APPOINTMENT_SET_STATUSES),
-        ]
-        if lead_ids:
-            appt_period_filters.append(or_(Appointment.lead_id.is_(None), Appointment.lead_id.in_(lead_ids)))
-        if activity_date_from is not None:
-            appt_period_filters.append(Appointment.created_at >= activity_date_from)
-        if activity_date_to is not None:
-            appt_period_filters.append(Appointment.created_at <= activity_date_to)
-        appt_set_period_result = await db.execute(
-            select(Appointment.assigned_to, func.count()).select_from(Appointment).where(
-                and_(*appt_period_filters)
-            ).group_by(Appointment.assigned_to)
-        )
-        for row in appt_set_period_result.all():
-            if row[0]:
-                sp_data[row[0]]["appointments_scheduled_in_period"] = row[1] or 0
-
-        appt_conf_period_filters = [
-            Appointment.assigned_to.in_(sp_ids),
-            Appointment.dealership_id == resolved_dealership_id,
-            Appointment.status == AppointmentStatus.CONFIRMED,
-        ]
-        if lead_ids:
-            appt_conf_period_filters.append(or_(Appointment.lead_id.is_(None), Appointment.lead_id.in_(lead_ids)))
-        if activity_date_from is not None:
-            appt_conf_period_filters.append(Appointment.created_at >= activity_date_from)
-        if activity_date_to is not None:
-            appt_conf_period_filters.append(Appointment.created_at <= activity_date_to)
-        appt_conf_period_result = await db.execute(
-            select(Appointment.assigned_to, func.count()).select_from(Appointment).where(
-                and_(*appt_conf_period_filters)
-            ).group_by(Appointment.assigned_to)
-        )
-        for row in appt_conf_period_result.all():
-            if row[0]:
-                sp_data[row[0]]["appointments_confirmed_in_period"] = row[1] or 0
-
-        # Day-of-week: notes Friday, outbound calls Friday, appointments Saturday
-        if activity_date_from is not None and activity_date_to is not None:
-            nf_sp_filters = [
-                Activity.user_id.in_(sp_ids),
-                Activity.type == ActivityType.NOTE_ADDED,
-                Activity.created_at >= activity_date_from,
-                Activity.created_at <= activity_date_to,
-                extract("dow", Activity.created_at) == 5,
-            ]
-            nf_sp_result = await db.execute(
-                select(Activity.user_id, func.count()).select_from(Activity).where(and_(*nf_sp_filters)).group_by(Activity.user_id)
-            )
-            for row in nf_sp_result.all():
-                if row[0]:
-                    sp_data[row[0]]["notes_friday"] = row[1] or 0
-            oc_sp_filters = [
-                CallLog.user_id.in_(sp_ids),
+    sp_count_queries = [lead_sp_q, note_sp_q, fu_sp_q, appt_sp_q]
+    check_in_list_q = None
+    if fridays is not None:
+        # Day-of-week: outbound calls Friday (Friday notes come with notes_added). The
+        # no-lead and in-scope halves are counted separately and summed per user.
+        calls_friday = union_all(*(
+            select(CallLog.user_id.label("user_id"), func.count().label("n"))
+            .select_from(_join_utc_weekday_days(CallLog, CallLog.started_at, fridays))
+            .where(
+                CallLog.user_id.in_(sp_ids_subq),
                 CallLog.direction == CallDirection.OUTBOUND,
                 CallLog.started_at >= activity_date_from,
                 CallLog.started_at <= activity_date_to,
-                extract("dow", CallLog.started_at) == 5,
-            ]
-            if lead_ids:
-                oc_sp_filters.append(or_(CallLog.lead_id.is_(None), CallLog.lead_id.in_(lead_ids)))
-            oc_sp_result = await db.execute(
-                select(CallLog.user_id, func.count()).select_from(CallLog).where(and_(*oc_sp_filters)).group_by(CallLog.user_id)
-            )
-            for row in oc_sp_result.all():
-                if row[0]:
-                    sp_data[row[0]]["outbound_calls_friday"] = row[1] or 0
-            ap_sat_sp_filters = [
-                Appointment.assigned_to.in_(sp_ids),
-                Appointment.dealership_id == resolved_dealership_id,
-                Appointment.scheduled_at >= activity_date_from,
-                Appointment.scheduled_at <= activity_date_to,
-                extract("dow", Appointment.scheduled_at) == 6,
-            ]
-            if lead_ids:
-                ap_sat_sp_filters.append(or_(Appointment.lead_id.is_(None), Appointment.lead_id.in_(lead_ids)))
-            ap_sat_sp_result = await db.execute(
-                select(Appointment.assigned_to, func.count()).select_from(Appointment).where(and_(*ap_sat_sp_filters)).group_by(Appointment.assigned_to)
+                half,
             )
-            for row in ap_sat_sp_result.all():
-                if row[0]:
-                    sp_data[row[0]]["appointments_contacted_saturday"] = row[1] or 0
-
+            .group_by(CallLog.user_id)
+            for half in _lead_scope_halves(CallLog.lead_id, lead_ids_subq)
+        )).subquery()
+        sp_count_queries.append(
+            select(calls_friday.c.user_id, func.sum(calls_friday.c.n).cast(Integer).label("outbound_calls_friday"))
+            .group_by(calls_friday.c.user_id)
+        )
+    if has_period:
         # Check-ins in period (showroom visits for leads assigned to each salesperson)
-        if lead_ids and activity_date_from is not None and activity_date_to is not None:
-            check_in_sp_q = (
-                select(Lead.assigned_to, func.count())
-                .select_from(ShowroomVisit)
-                .join(Lead, Lead.id == ShowroomVisit.lead_id)
-                .where(
-                    and_(
-                        Lead.assigned_to.in_(sp_ids),
-                        ShowroomVisit.dealership_id == resolved_dealership_id,
-                        ShowroomVisit.lead_id.in_(lead_ids),
-                        ShowroomVisit.checked_in_at >= activity_date_from,
-                        ShowroomVisit.checked_in_at <= activity_date_to,
-                    )
-                )
-                .group_by(Lead.assigned_to)
+        sp_count_queries.append(
+            select(Lead.assigned_to.label("user_id"), func.count().label("check_ins_in_period"))
+            .select_from(ShowroomVisit)
+            .join(Lead, Lead.id == ShowroomVisit.lead_id)
+            .where(
+                Lead.assigned_to.in_(sp_ids_subq),
+                ShowroomVisit.dealership_id == resolved_dealership_id,
+                ShowroomVisit.lead_id.in_(lead_ids_subq),
+                ShowroomVisit.checked_in_at >= activity_date_from,
+                ShowroomVisit.checked_in_at <= activity_date_to,
             )
-            check_in_sp_result = await db.execute(check_in_sp_q)
-            for row in check_in_sp_result.all():
-                if row[0]:
-                    sp_data[row[0]]["check_ins_in_period"] = row[1] or 0
-
-    salespeople_rows = [
-        SalespersonAnalysisRow(
-            user_id=str(sp.id),
-            user_name=sp.full_name,
-            leads_assigned=sp_data[sp.id]["leads_assigned"],
-            notes_added=sp_data[sp.id]["notes_added"],
-            follow_ups_total=sp_data[sp.id]["follow_ups_total"],
-            follow_ups_pending=sp_data[sp.id]["follow_ups_pending"],
-            follow_ups_overdue=sp_data[sp.id]["follow_ups_overdue"],
-            appointments_total=sp_data[sp.id]["appointments_total"],
-            appointments_scheduled=sp_data[sp.id]["appointments_scheduled"],
-            appointments_confirmed=sp_data[sp.id]["appointments_confirmed"],
-            last_note_content=last_note_by_user.get(sp.id),
-            follow_ups_scheduled_in_period=sp_data[sp.id]["follow_ups_scheduled_in_period"],
-            follow_ups_completed_in_period=sp_data[sp.id]["follow_ups_completed_in_period"],
-            appointments_scheduled_in_period=sp_data[sp.id]["appointments_scheduled_in_period"],
-            appointments_confirmed_in_period=sp_data[sp.id]["appointments_confirmed_in_period"],
-            notes_friday=sp_data[sp.id]["notes_friday"],
-            outbound_calls_friday=sp_data[sp.id]["outbound_calls_friday"],
-            appointments_contacted_saturday=sp_data[sp.id]["appointments_contacted_saturday"],
-            check_ins_in_period=sp_data[sp.id]["check_ins_in_period"],
+            .group_by(Lead.assigned_to)
         )
-        for sp in salespersons
-    ]
-
-    # Check-ins table: list of showroom visits in period (for dedicated table on frontend)
-    check_ins_list: List[CheckInRow] = []
-    if activity_date_from is not None and activity_date_to is not None:
-        check_in_list_filters = [
-            ShowroomVisit.dealership_id == resolved_dealership_id,
-            ShowroomVisit.checked_in_at >= activity_date_from,
-            ShowroomVisit.checked_in_at <= activity_date_to,
-        ]
-        if lead_ids:
-            check_in_list_filters.append(ShowroomVisit.lead_id.in_(lead_ids))
+        # Check-ins table: list of showroom visits in period (for dedicated table on frontend),
+        # with the assignee and checker names joined in rather than looked up afterwards
+        assignee = aliased(User)
+        checker = aliased(User)
         check_in_list_q = (
             select(
                 ShowroomVisit.id,
@@ -1467,47 +1717,104 @@ async def get_dealership_analysis(
                 ShowroomVisit.checked_in_at,
                 ShowroomVisit.checked_in_by,
                 ShowroomVisit.outcome,
+                assignee.first_name.label("assigned_to_first_name"),
+                assignee.last_name.label("assigned_to_last_name"),
+                checker.first_name.label("checked_in_by_first_name"),
+                checker.last_name.label("checked_in_by_last_name"),
             )
             .select_from(ShowroomVisit)
             .join(Lead, Lead.id == ShowroomVisit.lead_id)
             .join(Customer, Customer.id == Lead.customer_id)
-            .where(and_(*check_in_list_filters))
+            .outerjoin(assignee, assignee.id == Lead.assigned_to)
+            .outerjoin(checker, checker.id == ShowroomVisit.checked_in_by)
+            .where(
+                ShowroomVisit.dealership_id == resolved_dealership_id,
+                ShowroomVisit.checked_in_at >= activity_date_from,
+                ShowroomVisit.checked_in_at <= activity_date_to,
+                ShowroomVisit.lead_id.in_(lead_ids_subq),
+            )
             .order_by(ShowroomVisit.checked_in_at.desc())
             .limit(500)
         )
-        check_in_list_result = await db.execute(check_in_list_q)
-        check_in_rows = check_in_list_result.all()
-        # Resolve assigned_to and checked_in_by user names (batch)
-        user_id_to_name: dict[UUID, str] = {}
-        if check_in_rows:
-            assigned_to_ids = list({r.assigned_to for r in check_in_rows if r.assigned_to})
-            checked_in_by_ids = list({r.checked_in_by for r in check_in_rows if r.checked_in_by})
-            all_user_ids = list(set(assigned_to_ids) | set(checked_in_by_ids))
-            if all_user_ids:
-                users_result = await db.execute(
-                    select(User.id, User.first_name, User.last_name).where(User.id.in_(all_user_ids))
-                )
-                for u in users_result.all():
-                    user_id_to_name[u.id] = f"{u.first_name or ''} {u.last_name or ''}".strip() or str(u.id)
-        for r in check_in_rows:
-            lead_name = f"{r.first_name or ''} {r.last_name or ''}".strip() or "—"
-            check_ins_list.append(
-                CheckInRow(
-                    visit_id=str(r.id),
-                    lead_id=str(r.lead_id),
-                    lead_name=lead_name,
-                    assigned_to_id=str(r.assigned_to) if r.assigned_to else None,
-                    assigned_to_name=user_id_to_name.get(r.assigned_to) if r.assigned_to else None,
-                    checked_in_at=r.checked_in_at,
-                    checked_in_by_name=user_id_to_name.get(r.checked_in_by) if r.checked_in_by else None,
-                    outcome=r.outcome.value if r.outcome else None,
-                )
+
+    salespersons_result, last_note_result, *other_results = await execute_concurrently(
+        db,
+        _ACTIVE_SALESPERSONS.params(dealership_id=resolved_dealership_id),
+        last_note_q,
+        *sp_count_queries,
+        *([check_in_list_q] if check_in_list_q is not None else []),
+    )
+    sp_count_results = other_results[:len(sp_count_queries)]
+    # The check-in result is already buffered by execute; iterate it in place rather than
+    # copying the (up to 500) rows into a list first
+    check_in_rows = other_results[len(sp_count_queries)] if check_in_list_q is not None else ()
+
+    check_ins_list: List[CheckInRow] = []
+    for r in check_in_rows:
+        lead_name = f"{r.first_name or ''} {r.last_name or ''}".strip() or "—"
+        assigned_to_name = None
+        if r.assigned_to:
+            assigned_to_name = (
+                f"{r.assigned_to_first_name or ''} {r.assigned_to_last_name or ''}".strip() or str(r.assigned_to)
+            )
+        checked_in_by_name = None
+        if r.checked_in_by:
+            checked_in_by_name = (
+                f"{r.checked_in_by_first_name or ''} {r.checked_in_by_last_name or ''}".strip() or str(r.checked_in_by)
+            )
+        check_ins_list.append(
+            CheckInRow.model_construct(
+                visit_id=r.id,
+                lead_id=r.lead_id,
+                lead_name=lead_name,
+                assigned_to_id=r.assigned_to,
+                assigned_to_name=assigned_to_name,
+                checked_in_at=r.checked_in_at,
+                checked_in_by_name=checked_in_by_name,
+                outcome=r.outcome.value if r.outcome else None,
+            )
+        )
+
+    # Every count statement is scoped to the salesperson subquery, so a dealership
+    # without active salespeople has empty results there; skip assembling them.
+    salespersons = salespersons_result.scalars().all()
+    salespeople_rows: List[SalespersonAnalysisRow] = []
+    if salespersons:
+        last_note_by_user: dict[UUID, str] = {
+            row.assigned_to: row.content for row in last_note_result.all() if row.content
+        }
+
+        # Defaults per sp (all zeros). Every count statement selects user_id first, so its
+        # remaining column names are resolved once per result rather than once per row.
+        sp_data: dict[UUID, dict[str, int]] = {
+            sp.id: dict.fromkeys(SALESPERSON_COUNT_FIELDS, 0) for sp in salespersons
+        }
+        for result in sp_count_results:
+            count_fields = list(result.keys())[1:]
+            for user_id, *counts in result.all():
+                sp_counts = sp_data.get(user_id)
+                if sp_counts is not None:
+                    sp_counts.update(zip(count_fields, counts))
+
+        # Rows are built from our own counts (sp_data keys are the field names), so skip validation
+        salespeople_rows = [
+            SalespersonAnalysisRow.model_construct(
+                user_id=sp.id,
+                user_name=sp.full_name,
+                last_note_content=last_note_by_user.get(sp.id),
+                **sp_data[sp.id],
             )
+            for sp in salespersons
+        ]
 
-    return DealershipAnalysisResponse(summary=summary, salespeople=salespeople_rows, check_ins=check_ins_list)
+    return await _cache_analytics_response(
+        cache_key,
+        activity_date_to,
+        DealershipAnalysisResponse(summary=summary, salespeople=salespeople_rows, check_ins=check_ins_list),
+    )
 
 
-@router.get("/analytics/leads-over-time", response_model=LeadsOverTimeResponse)
+@router.get("/analytics/leads-over-time", response_model=LeadsOverTimeResponse, response_class=ORJSONResponse)
 async def get_leads_over_time(
     date_from: Optional[str] = Query(None),
     date_to: Optional[str] = Query(None),
@@ -1541,8 +1848,45 @@ async def get_leads_over_time(
         except ValueError:
             pass
 
+    cache_key = _analytics_cache_key(
+        "leads_over_time", resolved, date_from_dt, date_to_dt, assigned_to, bdc_agent_id, source, stage_id, group_by
+    )
+    cached = await cache_get(cache_key)
+    if cached is not None:
+        return ORJSONResponse(cached)
+
+    rollup_window = _closed_rollup_window(date_from_dt, date_to_dt)
+    if rollup_window is not None:
+        n, metric = _lead_rollup.c.n, _lead_rollup.c.metric
+        day = func.date(_lead_rollup.c.bucket)
+        rollup_result = await db.execute(
+            select(
+                day.label("d"),
+                func.sum(n).filter(metric == "leads_created").label("created"),
+                func.sum(n).filter(metric == "leads_converted").label("converted"),
+            )
+            .where(
+                *_lead_rollup_filters(resolved, rollup_window, assigned_to, bdc_agent_id, source, stage_id),
+                metric.in_(["leads_created", "leads_converted"]),
+            )
+            .group_by(day)
+            .order_by(day)
+        )
+        series = [
+            LeadsOverTimeItem(
+                date=str(row.d),
+                leads_created=int(row.created or 0),
+                leads_converted=int(row.converted or 0),
+            )
+            for row in rollup_result.all()
+        ]
+        return await _cache_analytics_response(cache_key, date_to_dt, LeadsOverTimeResponse(series=series))
+
+    # Created and converted per-day counts come back from one statement: each branch
+    # groups its own date column, and the outer query merges the two series by day.
+    created_day = func.date(Lead.created_at)
     created_q = (
-        select(func.date(Lead.created_at).label("d"), func.count(Lead.id).label("c"))
+        select(created_day.label("d"), func.count(Lead.id).label("created"), literal_column("0").label("converted"))
         .where(base)
         .where(Lead.created_at.isnot(None))
     )
@@ -1550,12 +1894,11 @@ async def get_leads_over_time(
         created_q = created_q.where(Lead.created_at >= date_from_dt)
     if date_to_dt:
         created_q = created_q.where(Lead.created_at <= date_to_dt)
-    created_q = created_q.group_by(func.date(Lead.created_at)).order_by(func.date(Lead.created_at))
-    created_result = await db.execute(created_q)
-    created_by_date = {str(row.d): row.c for row in created_result.all()}
+    created_q = created_q.group_by(created_day)
 
+    converted_day = func.date(Lead.converted_at)
     converted_q = (
-        select(func.date(Lead.converted_at).label("d"), func.count(Lead.id).label("c"))
+        select(converted_day.label("d"), literal_column("0").label("created"), func.count(Lead.id).label("converted"))
         .where(base)
         .where(Lead.outcome == "converted", Lead.converted_at.isnot(None))
     )
@@ -1563,23 +1906,30 @@ async def get_leads_over_time(
         converted_q = converted_q.where(Lead.converted_at >= date_from_dt)
     if date_to_dt:
         converted_q = converted_q.where(Lead.converted_at <= date_to_dt)
-    converted_q = converted_q.group_by(func.date(Lead.converted_at)).order_by(func.date(Lead.converted_at))
-    converted_result = await db.execute(converted_q)
-    converted_by_date = {str(row.d): row.c for row in converted_result.all()}
+    converted_q = converted_q.group_by(converted_day)
 
-    all_dates = sorted(set(created_by_date.keys()) | set(converted_by_date.keys()))
+    by_day = union_all(created_q, converted_q).subquery()
+    series_result = await db.execute(
+        select(
+            by_day.c.d,
+            func.sum(by_day.c.created).label("created"),
+            func.sum(by_day.c.converted).label("converted"),
+        )
+        .group_by(by_day.c.d)
+        .order_by(by_day.c.d)
+    )
     series = [
         LeadsOverTimeItem(
-            date=d,
-            leads_created=created_by_date.get(d, 0),
-            leads_converted=converted_by_date.get(d, 0),
+            date=str(row.d),
+            leads_created=int(row.created),
+            leads_converted=int(row.converted),
         )
-        for d in all_dates
+        for row in series_result.all()
     ]
-    return LeadsOverTimeResponse(series=series)
+    return await _cache_analytics_response(cache_key, date_to_dt, LeadsOverTimeResponse(series=series))
 
 
-@router.get("/analytics/leads-by-stage", response_model=LeadsByStageResponse)
+@router.get("/analytics/leads-by-stage", response_model=LeadsByStageResponse, response_class=ORJSONResponse)
 async def get_leads_by_stage(
     date_from: Optional[str] = Query(None),
     date_to: Optional[str] = Query(None),
@@ -1597,17 +1947,51 @@ async def get_leads_by_stage(
     )
     if not resolved:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Dealership context required.")
-    filters = list(lead_filters) if lead_filters else [Lead.dealership_id == resolved]
+    date_from_dt = None
+    date_to_dt = None
     if date_from:
         try:
-            filters.append(Lead.created_at >= datetime.fromisoformat(date_from.replace("Z", "+00:00")))
+            date_from_dt = datetime.fromisoformat(date_from.replace("Z", "+00:00"))
         except ValueError:
             pass
     if date_to:
         try:
-            filters.append(Lead.created_at <= datetime.fromisoformat(date_to.replace("Z", "+00:00")))
+            date_to_dt = datetime.fromisoformat(date_to.replace("Z", "+00:00"))
         except ValueError:
             pass
+
+    cache_key = _analytics_cache_key(
+        "leads_by_stage", resolved, date_from_dt, date_to_dt, assigned_to, bdc_agent_id, source, stage_id
+    )
+    cached = await cache_get(cache_key)
+    if cached is not None:
+        return ORJSONResponse(cached)
+
+    rollup_window = _closed_rollup_window(date_from_dt, date_to_dt)
+    if rollup_window is not None:
+        leads_created = func.sum(_lead_rollup.c.n)
+        rollup_result = await db.execute(
+            select(_lead_rollup.c.stage_id, LeadStage.display_name, leads_created.label("count"))
+            .select_from(_lead_rollup)
+            .join(LeadStage, LeadStage.id == _lead_rollup.c.stage_id)
+            .where(
+                *_lead_rollup_filters(resolved, rollup_window, assigned_to, bdc_agent_id, source, stage_id),
+                _lead_rollup.c.metric == "leads_created",
+            )
+            .group_by(_lead_rollup.c.stage_id, LeadStage.display_name)
+            .order_by(leads_created.desc())
+        )
+        items = [
+            LeadsByStageItem(stage_id=str(row.stage_id), stage_name=row.display_name or "", count=int(row.count))
+            for row in rollup_result.all()
+        ]
+        return await _cache_analytics_response(cache_key, date_to_dt, LeadsByStageResponse(items=items))
+
+    filters = list(lead_filters) if lead_filters else [Lead.dealership_id == resolved]
+    if date_from_dt:
+        filters.append(Lead.created_at >= date_from_dt)
+    if date_to_dt:
+        filters.append(Lead.created_at <= date_to_dt)
     base = and_(*filters)
 
     q = (
@@ -1622,10 +2006,10 @@ async def get_leads_by_stage(
         LeadsByStageItem(stage_id=str(row.stage_id), stage_name=row.display_name or "", count=row.count)
         for row in result.all()
     ]
-    return LeadsByStageResponse(items=items)
+    return await _cache_analytics_response(cache_key, date_to_dt, LeadsByStageResponse(items=items))
 
 
-@router.get("/analytics/leads-by-source", response_model=LeadsBySourceResponse)
+@router.get("/analytics/leads-by-source", response_model=LeadsBySourceResponse, response_class=ORJSONResponse)
 async def get_leads_by_source(
     date_from: Optional[str] = Query(None),
     date_to: Optional[str] = Query(None),
@@ -1643,17 +2027,49 @@ async def get_leads_by_source(
     )
     if not resolved:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Dealership context required.")
-    filters = list(lead_filters) if lead_filters else [Lead.dealership_id == resolved]
+    date_from_dt = None
+    date_to_dt = None
     if date_from:
         try:
-            filters.append(Lead.created_at >= datetime.fromisoformat(date_from.replace("Z", "+00:00")))
+            date_from_dt = datetime.fromisoformat(date_from.replace("Z", "+00:00"))
         except ValueError:
             pass
     if date_to:
         try:
-            filters.append(Lead.created_at <= datetime.fromisoformat(date_to.replace("Z", "+00:00")))
+            date_to_dt = datetime.fromisoformat(date_to.replace("Z", "+00:00"))
         except ValueError:
             pass
+
+    cache_key = _analytics_cache_key(
+        "leads_by_source", resolved, date_from_dt, date_to_dt, assigned_to, bdc_agent_id, source, stage_id
+    )
+    cached = await cache_get(cache_key)
+    if cached is not None:
+        return ORJSONResponse(cached)
+
+    rollup_window = _closed_rollup_window(date_from_dt, date_to_dt)
+    if rollup_window is not None:
+        leads_created = func.sum(_lead_rollup.c.n)
+        rollup_result = await db.execute(
+            select(_lead_rollup.c.source, leads_created.label("count"))
+            .where(
+                *_lead_rollup_filters(resolved, rollup_window, assigned_to, bdc_agent_id, source, stage_id),
+                _lead_rollup.c.metric == "leads_created",
+            )
+            .group_by(_lead_rollup.c.source)
+            .order_by(leads_created.desc())
+        )
+        items = [
+            LeadsBySourceItem(source=row.source.value if hasattr(row.source, "value") else str(row.source), count=int(row.count))
+            for row in rollup_result.all()
+        ]
+        return await _cache_analytics_response(cache_key, date_to_dt, LeadsBySourceResponse(items=items))
+
+    filters = list(lead_filters) if lead_filters else [Lead.dealership_id == resolved]
+    if date_from_dt:
+        filters.append(Lead.created_at >= date_from_dt)
+    if date_to_dt:
+        filters.append(Lead.created_at <= date_to_dt)
     base = and_(*filters)
 
     q = (
@@ -1667,10 +2083,10 @@ async def get_leads_by_source(
         LeadsBySourceItem(source=row.source.value if hasattr(row.source, "value") else str(row.source), count=row.count)
         for row in result.all()
     ]
-    return LeadsBySourceResponse(items=items)
+    return await _cache_analytics_response(cache_key, date_to_dt, LeadsBySourceResponse(items=items))
 
 
-@router.get("/analytics/activities-over-time", response_model=ActivitiesOverTimeResponse)
+@router.get("/analytics/activities-over-time", response_model=ActivitiesOverTimeResponse, response_class=ORJSONResponse)
 async def get_activities_over_time(
     date_from: Optional[str] = Query(None),
     date_to: Optional[str] = Query(None),
@@ -1683,23 +2099,11 @@ async def get_activities_over_time(
     current_user: User = Depends(require_admin_or_owner),
 ) -> Any:
     """Time-series of activities and notes per day (scoped to dealership and optional lead filters)."""
-    resolved, lead_filters, has_lead_specific_filters = await _resolve_dealership_and_lead_filters(
+    resolved, lead_filters, _ = await _resolve_dealership_and_lead_filters(
         db, current_user, dealership_id, assigned_to, source, stage_id, bdc_agent_id
     )
     if not resolved:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Dealership context required.")
-    lead_filters_base = and_(*lead_filters) if lead_filters else (Lead.dealership_id == resolved)
-    lead_ids_result = await db.execute(select(Lead.id).where(lead_filters_base))
-    lead_ids = [r[0] for r in lead_ids_result.fetchall()]
-
-    # If lead-specific filters were applied but no leads match, return empty series
-    no_matching_leads = has_lead_specific_filters and not lead_ids
-    if no_matching_leads:
-        return ActivitiesOverTimeResponse(series=[])
-
-    activity_filters = [Activity.dealership_id == resolved]
-    if lead_ids:
-        activity_filters.append(Activity.lead_id.in_(lead_ids))
     date_from_dt = None
     date_to_dt = None
     if date_from:
@@ -1712,6 +2116,43 @@ async def get_activities_over_time(
             date_to_dt = datetime.fromisoformat(date_to.replace("Z", "+00:00"))
         except ValueError:
             pass
+
+    cache_key = _analytics_cache_key(
+        "activities_over_time", resolved, date_from_dt, date_to_dt, assigned_to, bdc_agent_id, source, stage_id
+    )
+    cached = await cache_get(cache_key)
+    if cached is not None:
+        return ORJSONResponse(cached)
+
+    rollup_window = _closed_rollup_window(date_from_dt, date_to_dt)
+    if rollup_window is not None:
+        n, metric = _lead_rollup.c.n, _lead_rollup.c.metric
+        day = func.date(_lead_rollup.c.bucket)
+        rollup_result = await db.execute(
+            select(
+                day.label("d"),
+                func.sum(n).filter(metric == "activities").label("activities"),
+                func.sum(n).filter(metric == "notes").label("notes"),
+            )
+            .where(
+                *_lead_rollup_filters(resolved, rollup_window, assigned_to, bdc_agent_id, source, stage_id),
+                metric.in_(["activities", "notes"]),
+            )
+            .group_by(day)
+            .order_by(day)
+        )
+        series = [
+            ActivitiesOverTimeItem(date=str(row.d), activities=int(row.activities or 0), notes=int(row.notes or 0))
+            for row in rollup_result.all()
+        ]
+        return await _cache_analytics_response(cache_key, date_to_dt, ActivitiesOverTimeResponse(series=series))
+
+    # The matching lead set stays in the database as a subquery (planned as a semi-join);
+    # when no leads match, the series is simply empty.
+    lead_filters_base = and_(*lead_filters) if lead_filters else (Lead.dealership_id == resolved)
+    lead_ids_subq = select(Lead.id).where(lead_filters_base)
+
+    activity_filters = [Activity.dealership_id == resolved, Activity.lead_id.in_(lead_ids_subq)]
     if date_from_dt:
         activity_filters.append(Activity.created_at >= date_from_dt)
     if date_to_dt:
@@ -1745,13 +2186,14 @@ async def get_activities_over_time(
         )
         for d in all_dates
     ]
-    return ActivitiesOverTimeResponse(series=series)
+    return await _cache_analytics_response(cache_key, date_to_dt, ActivitiesOverTimeResponse(series=series))
 
 
 @router.get("/daily-activities", response_model=DailyActivityResponse)
 async def get_daily_activities(
-    date_from: str = Query(..., description="ISO date for range start (YYYY-MM-DD or ISO datetime)"),
-    date_to: str = Query(..., description="ISO date for range end (YYYY-MM-DD or ISO datetime)"),
+    date_from: Annotated[DateOrDateTime, Query(description="ISO date for range start (YYYY-MM-DD or ISO datetime)")],
+    date_to: Annotated[DateOrDateTime, Query(description="ISO date for range end (YYYY-MM-DD or ISO datetime)")],
+    request: Request,
     dealership_id: Optional[UUID] = Query(None, description="Dealership to scope (super_admin only)"),
     user_id: Optional[UUID] = Query(None, description="Filter by specific salesperson"),
     activity_types: Optional[str] = Query(None, description="Comma-separated activity types to filter"),
@@ -1796,22 +2238,10 @@ async def get_daily_activities(
             detail="Dealership context required. Please select a dealership."
         )
     
-    # Parse dates
-    try:
-        if "T" in date_from:
-            date_from_dt = datetime.fromisoformat(date_from.replace("Z", "+00:00"))
-        else:
-            date_from_dt = datetime.fromisoformat(f"{date_from}T00:00:00+00:00")
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid date_from format")
-    
-    try:
-        if "T" in date_to:
-            date_to_dt = datetime.fromisoformat(date_to.replace("Z", "+00:00"))
-        else:
-            date_to_dt = datetime.fromisoformat(f"{date_to}T23:59:59+00:00")
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid date_to format")
+    date_from_dt, date_to_dt = _utc_date_range(date_from, date_to)
+    # The response echoes the range exactly as the client sent it
+    date_from_raw = request.query_params["date_from"]
+    date_to_raw = request.query_params["date_to"]
     
     # Parse activity types filter
     type_filter = None
@@ -1838,12 +2268,14 @@ async def get_daily_activities(
     sp_result = await db.execute(select(User).where(and_(*sp_filters)))
     salespersons = sp_result.scalars().all()
     sp_ids = [sp.id for sp in salespersons]
-    sp_map = {sp.id: sp for sp in salespersons}
+    # Plain-string lookups so the row loop does not touch ORM attributes per activity
+    sp_names = {sp.id: sp.full_name for sp in salespersons}
+    sp_emails = {sp.id: sp.email for sp in salespersons}
     
     if not sp_ids:
         return DailyActivityResponse(
-            date_from=date_from,
-            date_to=date_to,
+            date_from=date_from_raw,
+            date_to=date_to_raw,
             dealership_id=str(resolved_dealership_id),
             total_activities=0,
             total_notes=0,
@@ -1873,21 +2305,21 @@ async def get_daily_activities(
     activity_result = await db.execute(activity_q)
     activities_raw = activity_result.all()
     
-    # Get call logs for duration info
-    call_filters = [
-        CallLog.user_id.in_(sp_ids),
-        CallLog.created_at >= date_from_dt,
-        CallLog.created_at <= date_to_dt,
-    ]
-    call_result = await db.execute(
-        select(CallLog).where(and_(*call_filters))
+    # Unique leads/customers touched per user, counted in the database
+    touched_result = await db.execute(
+        select(
+            Activity.user_id,
+            func.count(func.distinct(Activity.lead_id)),
+            func.count(func.distinct(Lead.customer_id)),
+        )
+        .outerjoin(Lead, Activity.lead_id == Lead.id)
+        .where(and_(*activity_filters))
+        .group_by(Activity.user_id)
     )
-    call_logs = {cl.id: cl for cl in call_result.scalars().all()}
+    touched_counts = {row[0]: (row[1], row[2]) for row in touched_result.all()}
     
     # Group activities by user
     user_activities: dict[UUID, list] = {sp_id: [] for sp_id in sp_ids}
-    user_leads_touched: dict[UUID, set] = {sp_id: set() for sp_id in sp_ids}
-    user_customers_touched: dict[UUID, set] = {sp_id: set() for sp_id in sp_ids}
     user_stats: dict[UUID, dict] = {
         sp_id: {
             "notes_count": 0,
@@ -1913,14 +2345,6 @@ async def get_daily_activities(
         elif lead:
             lead_name = f"Lead {str(lead.id)[:8]}"
         
-        # Track leads touched
-        if activity.lead_id:
-            user_leads_touched[activity.user_id].add(activity.lead_id)
-        
-        # Track unique customers contacted
-        if lead and lead.customer_id:
-            user_customers_touched[activity.user_id].add(lead.customer_id)
-        
         # Build description based on type
         description = activity.description or ""
         meta = activity.meta_data if isinstance(activity.meta_data, dict) else {}
@@ -1930,26 +2354,28 @@ async def get_daily_activities(
         parent_id_str = str(activity.parent_id) if activity.parent_id else None
         
         # Update stats based on activity type
+        stats = user_stats[activity.user_id]
         if activity.type == ActivityType.NOTE_ADDED:
-            user_stats[activity.user_id]["notes_count"] += 1
-            if meta.get("content"):
-                description = meta["content"][:200] + ("..." if len(meta.get("content", "")) > 200 else "")
+            stats["notes_count"] += 1
+            content = meta.get("content")
+            if content:
+                description = f"{content[:200]}..." if len(content) > 200 else content
         elif activity.type == ActivityType.CALL_LOGGED:
-            user_stats[activity.user_id]["calls_count"] += 1
+            stats["calls_count"] += 1
             duration = meta.get("duration_seconds", 0) or 0
-            user_stats[activity.user_id]["call_duration_total"] += duration
+            stats["call_duration_total"] += duration
             outcome = meta.get("outcome", "")
             description = f"Call ({duration}s) - {outcome}" if outcome else f"Call ({duration}s)"
         elif activity.type == ActivityType.FOLLOW_UP_COMPLETED:
-            user_stats[activity.user_id]["follow_ups_completed"] += 1
+            stats["follow_ups_completed"] += 1
         elif activity.type == ActivityType.FOLLOW_UP_SCHEDULED:
-            user_stats[activity.user_id]["follow_ups_scheduled"] += 1
+            stats["follow_ups_scheduled"] += 1
         elif activity.type == ActivityType.APPOINTMENT_COMPLETED:
-            user_stats[activity.user_id]["appointments_completed"] += 1
+            stats["appointments_completed"] += 1
         elif activity.type == ActivityType.APPOINTMENT_SCHEDULED:
-            user_stats[activity.user_id]["appointments_scheduled"] += 1
+            stats["appointments_scheduled"] += 1
         elif activity.type == ActivityType.EMAIL_SENT:
-            user_stats[activity.user_id]["emails_sent"] += 1
+            stats["emails_sent"] += 1
             subject = meta.get("subject", "")
             description = f"Email: {subject}" if subject else "Email sent"
         
@@ -1958,7 +2384,7 @@ async def get_daily_activities(
                 id=str(activity.id),
                 type=activity.type.value if hasattr(activity.type, "value") else str(activity.type),
                 user_id=str(activity.user_id) if activity.user_id else None,
-                user_name=sp_map[activity.user_id].full_name if activity.user_id in sp_map else None,
+                user_name=sp_names.get(activity.user_id),
                 lead_id=str(activity.lead_id) if activity.lead_id else None,
                 lead_name=lead_name,
                 description=description,
@@ -1977,10 +2403,14 @@ async def get_daily_activities(
     total_follow_ups_completed = 0
     total_appointments = 0
     
-    for sp_id in sp_ids:
-        sp = sp_map[sp_id]
+    # Order by total activities descending; the key is one len() per salesperson
+    # rather than re-reading summary.activities on every comparison.
+    ordered_sp_ids = sorted(sp_ids, key=lambda sid: len(user_activities[sid]), reverse=True)
+    
+    for sp_id in ordered_sp_ids:
         stats = user_stats[sp_id]
         activities = user_activities[sp_id]
+        leads_worked, customers_contacted = touched_counts.get(sp_id, (0, 0))
         
         total_activities += len(activities)
         total_notes += stats["notes_count"]
@@ -1991,8 +2421,8 @@ async def get_daily_activities(
         salesperson_summaries.append(
             SalespersonDailySummary(
                 user_id=str(sp_id),
-                user_name=sp.full_name,
-                user_email=sp.email,
+                user_name=sp_names[sp_id],
+                user_email=sp_emails[sp_id],
                 notes_count=stats["notes_count"],
                 calls_count=stats["calls_count"],
                 call_duration_total=stats["call_duration_total"],
@@ -2001,18 +2431,15 @@ async def get_daily_activities(
                 appointments_completed=stats["appointments_completed"],
                 appointments_scheduled=stats["appointments_scheduled"],
                 emails_sent=stats["emails_sent"],
-                leads_worked=len(user_leads_touched[sp_id]),
-                customers_contacted=len(user_customers_touched[sp_id]),
+                leads_worked=leads_worked,
+                customers_contacted=customers_contacted,
                 activities=activities,
             )
         )
     
-    # Sort by total activities descending
-    salesperson_summaries.sort(key=lambda x: len(x.activities), reverse=True)
-    
     return DailyActivityResponse(
-        date_from=date_from,
-        date_to=date_to,
+        date_from=date_from_raw,
+        date_to=date_to_raw,
         dealership_id=str(resolved_dealership_id),
         total_activities=total_activities,
         total_notes=total_notes,
@@ -5,10 +5,12 @@ from typing import Any, List
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select, delete
+from sqlalchemy import select, delete, insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api import deps
+from app.core.access_scope import get_user_dealership_id
+from app.core.cache import cache_get, cache_invalidate_prefix, cache_set
 from app.core.permissions import Permission, UserRole
 from app.db.database import get_db
 from app.models.schedule import Schedule
@@ -17,6 +19,14 @@ from app.schemas.follow_up import ScheduleResponse, ScheduleCreate
 
 router = APIRouter()
 
+SCHEDULE_CACHE_PREFIX = "schedules:"
+# Schedules change rarely; update_user_schedule drops the entry on write
+SCHEDULE_CACHE_TTL_SECONDS = 300
+
+
+def _schedule_cache_key(user_id: UUID) -> str:
+    return f"{SCHEDULE_CACHE_PREFIX}{user_id}"
+
 
 @router.get("/{user_id}", response_model=List[ScheduleResponse])
 async def get_user_schedule(
@@ -31,8 +41,17 @@ async def get_user_schedule(
     if current_user.role == UserRole.SALESPERSON and current_user.id != user_id:
         raise HTTPException(status_code=403, detail="Not authorized")
         
+    cache_key = _schedule_cache_key(user_id)
+    cached = await cache_get(cache_key)
+    if cached is not None:
+        return cached
+
     result = await db.execute(select(Schedule).where(Schedule.user_id == user_id))
-    return result.scalars().all()
+    schedules = [
+        ScheduleResponse.model_validate(sch).model_dump(mode="json") for sch in result.scalars().all()
+    ]
+    await cache_set(cache_key, schedules, ttl_seconds=SCHEDULE_CACHE_TTL_SECONDS)
+    return schedules
 
 
 @router.put("/{user_id}", response_model=List[ScheduleResponse])
@@ -49,9 +68,8 @@ async def update_user_schedule(
     if current_user.id != user_id:
         if current_user.role in [UserRole.DEALERSHIP_ADMIN, UserRole.DEALERSHIP_OWNER]:
             # Check if user is in same dealership
-            user_result = await db.execute(select(User).where(User.id == user_id))
-            target_user = user_result.scalar_one_or_none()
-            if not target_user or target_user.dealership_id != current_user.dealership_id:
+            target_dealership_id = await get_user_dealership_id(db, user_id)
+            if target_dealership_id is None or target_dealership_id != current_user.dealership_id:
                 raise HTTPException(status_code=403, detail="Not authorized")
         elif current_user.role != UserRole.SUPER_ADMIN:
             raise HTTPException(status_code=403, detail="Not authorized")
@@ -59,18 +77,14 @@ async def update_user_schedule(
     # Clear existing schedule
     await db.execute(delete(Schedule).where(Schedule.user_id == user_id))
     
-    # Add new schedules
+    # Add new schedules: one INSERT ... RETURNING for the whole week (the DELETE
+    # above runs in the same transaction, so the replace is two statements)
     new_schedules = []
-    for sch in schedules_in:
-        new_sch = Schedule(
-            user_id=user_id,
-            day_of_week=sch.get("day_of_week"),
-            start_time=sch.get("start_time"),
-            end_time=sch.get("end_time"),
-            is_available=sch.get("is_available", True)
-        )
-        db.add(new_sch)
-        new_schedules.append(new_sch)
-        
-    await db.flush()
+    if schedules_in:
+        rows = [{"user_id": user_id, **sch.model_dump()} for sch in schedules_in]
+        new_schedules = (await db.scalars(insert(Schedule).returning(Schedule), rows)).all()
+
+    # Commit before dropping the cached copy so a concurrent GET cannot re-cache the old week
+    await db.commit()
+    await cache_invalidate_prefix(_schedule_cache_key(user_id))
     return new_schedules
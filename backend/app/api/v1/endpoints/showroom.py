@@ -1,20 +1,30 @@
 """
 Showroom Endpoints - Check-in/Check-out for customer tracking
 """
+import asyncio
 import logging
+import uuid
 from datetime import datetime, timedelta, timezone
 from typing import Any, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import select, func, and_
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, status
+from fastapi.responses import ORJSONResponse, Response
+from pydantic import BaseModel
+from sqlalchemy import select, func, and_, or_, extract, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased, joinedload, noload, raiseload, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
 from app.api import deps
+from app.core.cache import cache_get, cache_invalidate_prefix, cache_set
+from app.core.permissions import UserRole
 from app.core.timezone import utc_now
 from app.db.database import get_db
 from app.models.user import User
 from app.models.lead import Lead
+from app.models.lead_stage import LeadStage
 from app.models.customer import Customer
 from app.services.lead_stage_service import LeadStageService
 from app.models.appointment import Appointment, AppointmentStatus
@@ -22,24 +32,94 @@ from app.models.showroom_visit import ShowroomVisit, ShowroomOutcome
 from app.models.activity import ActivityType
 from app.services.activity import ActivityService
 from app.services.stips_service import _lead_access
+from app.services.notification_service import emit_showroom_update, emit_lead_updated
 from app.schemas.showroom import (
+    CustomerBrief,
+    LeadBrief,
     ShowroomCheckIn,
     ShowroomCheckOut,
     ShowroomVisitResponse,
     ShowroomCurrentResponse,
     ShowroomHistoryResponse,
     ShowroomStats,
+    UserBrief,
 )
+from app.utils.cursor import decode_keyset_cursor, encode_keyset_cursor
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 _LINKABLE_APPOINTMENT_STATUSES = (
     AppointmentStatus.SCHEDULED,
     AppointmentStatus.CONFIRMED,
 )
 
+# Lead stage (by name) a check-out moves the lead to; other outcomes fall back to "contacted"
+_OUTCOME_TO_STAGE_NAME = {
+    ShowroomOutcome.SOLD: "converted",
+    ShowroomOutcome.NOT_INTERESTED: "not_interested",
+    ShowroomOutcome.FOLLOW_UP: "follow_up",
+    ShowroomOutcome.RESCHEDULE: "reschedule",
+    ShowroomOutcome.BROWSING: "browsing",
+    ShowroomOutcome.COULDNT_QUALIFY: "couldnt_qualify",
+}
+
+SHOWROOM_CACHE_PREFIX = "showroom:"
+# Dashboards poll the stats cards and current visitors; check-in/check-out drop the
+# dealership's entries. The visitor list also shows lead details edited elsewhere, so
+# it is kept shorter.
+SHOWROOM_STATS_CACHE_TTL_SECONDS = 20
+SHOWROOM_CURRENT_CACHE_TTL_SECONDS = 10
+
+
+def _showroom_cache_key(kind: str, current_user: User) -> str:
+    """Showroom reads are scoped by dealership (none for super admins) and, for salespersons, by user."""
+    dealership_id = current_user.dealership_id if current_user.role != UserRole.SUPER_ADMIN else None
+    viewer = current_user.id if current_user.role == UserRole.SALESPERSON else "all"
+    return f"{SHOWROOM_CACHE_PREFIX}{dealership_id or 'all'}:{kind}:{viewer}"
+
+
+def _visit_scope(current_user: User) -> tuple[list, bool]:
+    """
+    Visit filters for the caller's role and whether they need leads joined in:
+    admins/owners see their dealership's visits, salespersons only their assigned leads.
+    """
+    filters = []
+    if current_user.role != UserRole.SUPER_ADMIN and current_user.dealership_id:
+        filters.append(ShowroomVisit.dealership_id == current_user.dealership_id)
+    needs_lead_join = current_user.role == UserRole.SALESPERSON
+    if needs_lead_join:
+        filters.append(Lead.assigned_to == current_user.id)
+    return filters, needs_lead_join
+
+
+async def _invalidate_showroom_cache(dealership_id: UUID) -> None:
+    """Drop cached reads that include this dealership's visits (its own and the unscoped ones)."""
+    await cache_invalidate_prefix(f"{SHOWROOM_CACHE_PREFIX}{dealership_id}:")
+    await cache_invalidate_prefix(f"{SHOWROOM_CACHE_PREFIX}all:")
+
+
+async def _emit_visit_events(
+    dealership_id: str,
+    action: str,
+    visit_data: dict,
+    lead_id: Optional[str] = None,
+    lead_data: Optional[dict] = None,
+) -> None:
+    """
+    Send a visit's showroom update and (when lead_data is given) its lead status
+    update together; a failed one is logged, not raised. The coroutines are only
+    created here, inside the background task, so none is left un-awaited if the
+    request fails before the task runs.
+    """
+    emissions = [emit_showroom_update(dealership_id, action, visit_data)]
+    if lead_id is not None and lead_data is not None:
+        emissions.append(emit_lead_updated(lead_id, dealership_id, "status_changed", lead_data))
+    for result in await asyncio.gather(*emissions, return_exceptions=True):
+        if isinstance(result, Exception):
+            logger.warning(f"Failed to emit showroom WebSocket event: {result}")
+
 
 async def _resolve_check_in_appointment(
     db: AsyncSession,
@@ -49,10 +129,7 @@ async def _resolve_check_in_appointment(
 ) -> Optional[Appointment]:
     """Return the appointment to link on check-in (explicit id or sole today appt)."""
     if appointment_id:
-        result = await db.execute(
-            select(Appointment).where(Appointment.id == appointment_id)
-        )
-        appointment = result.scalar_one_or_none()
+        appointment = await db.get(Appointment, appointment_id)
         if (
             appointment
             and appointment.lead_id == lead_id
@@ -103,10 +180,7 @@ async def _finalize_appointment_on_check_out(
     if not visit.appointment_id:
         return
 
-    result = await db.execute(
-        select(Appointment).where(Appointment.id == visit.appointment_id)
-    )
-    appointment = result.scalar_one_or_none()
+    appointment = await db.get(Appointment, visit.appointment_id)
     if not appointment:
         return
 
@@ -149,72 +223,40 @@ async def _finalize_appointment_on_check_out(
         )
 
 
-async def enrich_visit(db: AsyncSession, visit: ShowroomVisit) -> dict:
-    """Add lead and user info to visit response"""
-    response = {
-        "id": visit.id,
-        "lead_id": visit.lead_id,
-        "appointment_id": visit.appointment_id,
-        "dealership_id": visit.dealership_id,
-        "checked_in_at": visit.checked_in_at,
-        "checked_out_at": visit.checked_out_at,
-        "checked_in_by": visit.checked_in_by,
-        "checked_out_by": visit.checked_out_by,
-        "outcome": visit.outcome,
-        "notes": visit.notes,
-        "is_checked_in": visit.is_checked_in,
-        "lead": None,
-        "checked_in_by_user": None,
-        "checked_out_by_user": None,
-        "created_at": visit.created_at,
-        "updated_at": visit.updated_at,
-    }
-    
-    # Fetch lead + customer
-    lead_result = await db.execute(select(Lead).where(Lead.id == visit.lead_id))
-    lead = lead_result.scalar_one_or_none()
-    if lead:
-        cust = await db.execute(select(Customer).where(Customer.id == lead.customer_id))
-        customer = cust.scalar_one_or_none()
-        response["lead"] = {
-            "id": lead.id,
-            "customer": {
-                "first_name": customer.first_name if customer else "",
-                "last_name": customer.last_name if customer else None,
-                "full_name": customer.full_name if customer else "",
-                "phone": customer.phone if customer else None,
-                "email": customer.email if customer else None,
-            } if customer else None,
-        }
-    
-    # Fetch checked_in_by user
-    if visit.checked_in_by:
-        user_result = await db.execute(select(User).where(User.id == visit.checked_in_by))
-        user = user_result.scalar_one_or_none()
-        if user:
-            response["checked_in_by_user"] = {
-                "id": user.id,
-                "first_name": user.first_name,
-                "last_name": user.last_name,
-            }
-    
-    # Fetch checked_out_by user
-    if visit.checked_out_by:
-        user_result = await db.execute(select(User).where(User.id == visit.checked_out_by))
-        user = user_result.scalar_one_or_none()
-        if user:
-            response["checked_out_by_user"] = {
-                "id": user.id,
-                "first_name": user.first_name,
-                "last_name": user.last_name,
-            }
-    
-    return response
+# Everything enrich_visit reads, loaded with one IN-query per relation for a whole
+# result set; the lead's other eager relations are not needed here. Any other
+# relationship access on these visits raises instead of silently returning None.
+_VISIT_ENRICH_OPTIONS = (
+    selectinload(ShowroomVisit.lead).options(
+        selectinload(Lead.customer),
+        noload(Lead.secondary_customer),
+        noload(Lead.stage),
+    ),
+    selectinload(ShowroomVisit.checked_in_by_user),
+    selectinload(ShowroomVisit.checked_out_by_user),
+    raiseload("*"),
+)
+
+
+def enrich_visit(visit: ShowroomVisit) -> ShowroomVisitResponse:
+    """Build the visit response with lead and user info (visit loaded with _VISIT_ENRICH_OPTIONS)"""
+    return ShowroomVisitResponse.model_validate(visit)
+
+
+def _json_response(response: BaseModel, status_code: int = status.HTTP_200_OK) -> Response:
+    """
+    Send a response model as JSON, serialized straight to bytes by pydantic-core.
+    Returning a Response skips FastAPI's second response_model validation and
+    jsonable_encoder pass over a payload we built; the decorators keep response_model
+    for the OpenAPI schema.
+    """
+    return Response(response.model_dump_json(), status_code=status_code, media_type="application/json")
 
 
 @router.post("/check-in", response_model=ShowroomVisitResponse, status_code=status.HTTP_201_CREATED)
 async def check_in(
     check_in_data: ShowroomCheckIn,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(deps.get_current_active_user)
 ) -> Any:
@@ -222,25 +264,12 @@ async def check_in(
     Check in a customer to the showroom.
     Sets lead status to IN_SHOWROOM.
     """
-    # Verify lead exists
-    lead_result = await db.execute(select(Lead).where(Lead.id == check_in_data.lead_id))
-    lead = lead_result.scalar_one_or_none()
+    # Verify lead exists (an existing open visit is caught by the insert below)
+    lead = await db.get(Lead, check_in_data.lead_id)
     
     if not lead:
         raise HTTPException(status_code=404, detail="Lead not found")
     
-    # Check if lead is already checked in
-    existing_visit = await db.execute(
-        select(ShowroomVisit).where(
-            and_(
-                ShowroomVisit.lead_id == check_in_data.lead_id,
-                ShowroomVisit.checked_out_at.is_(None)
-            )
-        )
-    )
-    if existing_visit.scalar_one_or_none():
-        raise HTTPException(status_code=400, detail="Customer is already checked in")
-    
     # Determine dealership (lead's assigned dealership or current user's dealership)
     dealership_id = lead.dealership_id or current_user.dealership_id
     if not dealership_id:
@@ -256,27 +285,40 @@ async def check_in(
         check_in_data.appointment_id,
     )
 
-    # Create visit
-    visit = ShowroomVisit(
-        lead_id=check_in_data.lead_id,
-        appointment_id=linked_appointment.id if linked_appointment else None,
-        dealership_id=dealership_id,
-        checked_in_by=current_user.id,
-        notes=check_in_data.notes,
+    # Create visit; the unique open-visit index turns a second check-in (including a
+    # concurrent one) into a no-op insert, so nothing is returned
+    visit_result = await db.scalars(
+        pg_insert(ShowroomVisit)
+        .values(
+            id=uuid.uuid4(),
+            lead_id=lead.id,
+            appointment_id=linked_appointment.id if linked_appointment else None,
+            dealership_id=dealership_id,
+            checked_in_by=current_user.id,
+            notes=check_in_data.notes,
+        )
+        .on_conflict_do_nothing(
+            index_elements=[ShowroomVisit.lead_id],
+            index_where=ShowroomVisit.checked_out_at.is_(None),
+        )
+        .returning(ShowroomVisit)
     )
-    db.add(visit)
+    visit = visit_result.one_or_none()
+    if visit is None:
+        raise HTTPException(status_code=400, detail="Customer is already checked in")
+    # The lead and user are already loaded; attach them for the response without a reload
+    set_committed_value(visit, "lead", lead)
+    set_committed_value(visit, "checked_in_by_user", current_user)
     
-    # Update lead stage to IN_SHOWROOM
-    from app.models.lead_stage import LeadStage as LS
-    old_stage = await LeadStageService.get_stage(db, lead.stage_id)
+    # Update lead stage to IN_SHOWROOM (the current stage is loaded with the lead)
+    old_stage = await db.get(LeadStage, lead.stage_id)
     old_stage_name = old_stage.display_name if old_stage else "?"
-    in_showroom_stage = await LeadStageService.get_stage_by_name(db, "in_showroom", dealership_id)
+    in_showroom_stage = await LeadStageService.get_stage_ref_by_name(db, "in_showroom", dealership_id)
     if in_showroom_stage:
         lead.stage_id = in_showroom_stage.id
 
-    # Log activity
-    cust_r = await db.execute(select(Customer).where(Customer.id == lead.customer_id))
-    cust_obj = cust_r.scalar_one_or_none()
+    # Log activity (the lead's customer is already in the identity map)
+    cust_obj = await db.get(Customer, lead.customer_id)
     lead_name = cust_obj.full_name if cust_obj else "Customer"
     await ActivityService.log_activity(
         db,
@@ -297,36 +339,35 @@ async def check_in(
         _confirm_appointment_on_check_in(linked_appointment)
 
     await db.commit()
-    await db.refresh(visit)
-
-    # Emit WebSocket events so showroom dashboard and lead list/detail update (status = IN_SHOWROOM)
-    try:
-        from app.services.notification_service import emit_showroom_update, emit_lead_updated
-        await emit_showroom_update(str(dealership_id), "check_in", {
+    await _invalidate_showroom_cache(dealership_id)
+
+    # Emit WebSocket events so showroom dashboard and lead list/detail update (status = IN_SHOWROOM);
+    # they are sent after the response so the client only waits for the commit
+    background_tasks.add_task(
+        _emit_visit_events,
+        str(dealership_id),
+        "check_in",
+        {
             "visit_id": str(visit.id),
             "lead_id": str(lead.id),
             "lead_name": lead_name,
-        })
-        await emit_lead_updated(
-            str(lead.id),
-            str(dealership_id),
-            "status_changed",
-            {
-                "status": in_showroom_stage.name if in_showroom_stage else "in_showroom",
-                "old_status": old_stage.name if old_stage else None,
-                "source": "showroom_check_in",
-            },
-        )
-    except Exception as e:
-        logger.warning(f"Failed to emit showroom update: {e}")
+        },
+        str(lead.id),
+        {
+            "status": in_showroom_stage.name if in_showroom_stage else "in_showroom",
+            "old_status": old_stage.name if old_stage else None,
+            "source": "showroom_check_in",
+        },
+    )
 
-    return await enrich_visit(db, visit)
+    return _json_response(enrich_visit(visit), status_code=status.HTTP_201_CREATED)
 
 
 @router.post("/{visit_id}/check-out", response_model=ShowroomVisitResponse)
 async def check_out(
     visit_id: UUID,
     check_out_data: ShowroomCheckOut,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(deps.get_current_active_user)
 ) -> Any:
@@ -334,11 +375,13 @@ async def check_out(
     Check out a customer from the showroom.
     Updates lead status based on outcome.
     """
-    # Find visit
-    visit_result = await db.execute(
-        select(ShowroomVisit).where(ShowroomVisit.id == visit_id)
+    # Find visit (with its lead joined in for the stage update below, and the
+    # check-in user for the response)
+    visit = await db.get(
+        ShowroomVisit,
+        visit_id,
+        options=[joinedload(ShowroomVisit.lead), selectinload(ShowroomVisit.checked_in_by_user)],
     )
-    visit = visit_result.scalar_one_or_none()
     
     if not visit:
         raise HTTPException(status_code=404, detail="Visit not found")
@@ -348,26 +391,16 @@ async def check_out(
     
     # Update visit
     visit.checked_out_at = utc_now()
-    visit.checked_out_by = current_user.id
+    visit.checked_out_by_user = current_user
     visit.outcome = check_out_data.outcome
     if check_out_data.notes:
         visit.notes = (visit.notes or "") + f"\n\nCheckout: {check_out_data.notes}"
     
-    # Get lead and update stage based on check-out outcome
-    lead_result = await db.execute(select(Lead).where(Lead.id == visit.lead_id))
-    lead = lead_result.scalar_one_or_none()
-
-    # Map showroom outcome to stage name
-    outcome_to_stage = {
-        ShowroomOutcome.SOLD: "converted",
-        ShowroomOutcome.NOT_INTERESTED: "not_interested",
-        ShowroomOutcome.FOLLOW_UP: "follow_up",
-        ShowroomOutcome.RESCHEDULE: "reschedule",
-        ShowroomOutcome.BROWSING: "browsing",
-        ShowroomOutcome.COULDNT_QUALIFY: "couldnt_qualify",
-    }
-    target_stage_name = outcome_to_stage.get(check_out_data.outcome, "contacted")
-    target_stage = await LeadStageService.get_stage_by_name(
+    # Update lead stage based on check-out outcome
+    lead = visit.lead
+
+    target_stage_name = _OUTCOME_TO_STAGE_NAME.get(check_out_data.outcome, "contacted")
+    target_stage = await LeadStageService.get_stage_ref_by_name(
         db, target_stage_name, visit.dealership_id
     )
 
@@ -377,7 +410,7 @@ async def check_out(
 
     old_stage = None
     if lead and target_stage:
-        old_stage = await LeadStageService.get_stage(db, lead.stage_id)
+        old_stage = await db.get(LeadStage, lead.stage_id)
         old_stage_name = old_stage.display_name if old_stage else "?"
         lead.stage_id = target_stage.id
 
@@ -390,8 +423,7 @@ async def check_out(
                 lead.converted_at = utc_now()
 
         # Log activity
-        _co = await db.execute(select(Customer).where(Customer.id == lead.customer_id))
-        _cust = _co.scalar_one_or_none()
+        _cust = await db.get(Customer, lead.customer_id)
         lead_name = _cust.full_name if _cust else "Customer"
         outcome_label = check_out_data.outcome.value.replace("_", " ").title()
         await ActivityService.log_activity(
@@ -429,32 +461,29 @@ async def check_out(
         )
 
     await db.commit()
-    await db.refresh(visit)
+    await _invalidate_showroom_cache(visit.dealership_id)
 
     # Emit WebSocket events so showroom dashboard and lead list/dashboards update in real time
-    try:
-        from app.services.notification_service import emit_showroom_update, emit_lead_updated
-        await emit_showroom_update(str(visit.dealership_id), "check_out", {
+    # (after the response is sent)
+    background_tasks.add_task(
+        _emit_visit_events,
+        str(visit.dealership_id),
+        "check_out",
+        {
             "visit_id": str(visit.id),
             "lead_id": str(visit.lead_id),
             "outcome": check_out_data.outcome.value,
-        })
-        if lead:
-            await emit_lead_updated(
-                str(lead.id),
-                str(visit.dealership_id),
-                "status_changed",
-                {
-                    "status": target_stage.name if target_stage else None,
-                    "old_status": old_stage.name if old_stage else None,
-                    "source": "showroom_check_out",
-                    "outcome": check_out_data.outcome.value,
-                },
-            )
-    except Exception as e:
-        logger.warning(f"Failed to emit WebSocket events: {e}")
+        },
+        str(lead.id) if lead else None,
+        {
+            "status": target_stage.name if target_stage else None,
+            "old_status": old_stage.name if old_stage else None,
+            "source": "showroom_check_out",
+            "outcome": check_out_data.outcome.value,
+        } if lead else None,
+    )
 
-    return await enrich_visit(db, visit)
+    return _json_response(enrich_visit(visit))
 
 
 @router.get("/lead/{lead_id}/current", response_model=ShowroomVisitResponse)
@@ -470,15 +499,73 @@ async def get_lead_current_visit(
     """
     await _lead_access(db, lead_id, current_user)
     result = await db.execute(
-        select(ShowroomVisit).where(
+        select(ShowroomVisit)
+        .where(
             ShowroomVisit.lead_id == lead_id,
             ShowroomVisit.checked_out_at.is_(None),
         )
+        .options(*_VISIT_ENRICH_OPTIONS)
     )
     visit = result.scalar_one_or_none()
     if not visit:
         raise HTTPException(status_code=404, detail="No active showroom visit for this lead")
-    return await enrich_visit(db, visit)
+    return _json_response(enrich_visit(visit))
+
+
+_VISIT_COLUMNS = (
+    ShowroomVisit.id,
+    ShowroomVisit.lead_id,
+    ShowroomVisit.appointment_id,
+    ShowroomVisit.dealership_id,
+    ShowroomVisit.checked_in_at,
+    ShowroomVisit.checked_out_at,
+    ShowroomVisit.checked_in_by,
+    ShowroomVisit.checked_out_by,
+    ShowroomVisit.outcome,
+    ShowroomVisit.notes,
+    ShowroomVisit.created_at,
+    ShowroomVisit.updated_at,
+)
+
+
+def _open_visit_from_row(r) -> ShowroomVisitResponse:
+    """Build an open visit's response from the /current projection (rows are trusted, so no validation)."""
+    customer = None
+    if r.customer_id is not None:
+        customer = CustomerBrief.model_construct(
+            first_name=r.customer_first_name,
+            last_name=r.customer_last_name,
+            full_name=(
+                f"{r.customer_first_name} {r.customer_last_name}" if r.customer_last_name else r.customer_first_name
+            ),
+            phone=r.customer_phone,
+            email=r.customer_email,
+        )
+    checked_in_by_user = None
+    if r.checked_in_by_first_name is not None:
+        checked_in_by_user = UserBrief.model_construct(
+            id=r.checked_in_by,
+            first_name=r.checked_in_by_first_name,
+            last_name=r.checked_in_by_last_name,
+        )
+    return ShowroomVisitResponse.model_construct(
+        id=r.id,
+        lead_id=r.lead_id,
+        appointment_id=r.appointment_id,
+        dealership_id=r.dealership_id,
+        checked_in_at=r.checked_in_at,
+        checked_out_at=r.checked_out_at,
+        checked_in_by=r.checked_in_by,
+        checked_out_by=r.checked_out_by,
+        outcome=r.outcome,
+        notes=r.notes,
+        is_checked_in=True,
+        lead=LeadBrief.model_construct(id=r.lead_id, customer=customer),
+        checked_in_by_user=checked_in_by_user,
+        checked_out_by_user=None,
+        created_at=r.created_at,
+        updated_at=r.updated_at,
+    )
 
 
 @router.get("/current", response_model=ShowroomCurrentResponse)
@@ -489,29 +576,64 @@ async def get_current_visitors(
     """
     Get customers currently in the showroom.
     Admins/owners see all visits in their dealership; salespersons see only their assigned leads.
+    Cached briefly per scope; check-in/check-out invalidate it.
     """
-    from app.core.permissions import UserRole
-
-    query = select(ShowroomVisit).where(ShowroomVisit.checked_out_at.is_(None))
-    if current_user.role != UserRole.SUPER_ADMIN and current_user.dealership_id:
-        query = query.where(ShowroomVisit.dealership_id == current_user.dealership_id)
-    if current_user.role == UserRole.SALESPERSON:
-        query = query.join(Lead, ShowroomVisit.lead_id == Lead.id).where(
-            Lead.assigned_to == current_user.id
+    cache_key = _showroom_cache_key("current", current_user)
+    cached = await cache_get(cache_key)
+    if cached is not None:
+        return ORJSONResponse(cached)
+
+    # One statement projects every field the response needs (lead, customer and check-in
+    # user joined in) instead of loading ORM visits plus a selectin query per relation.
+    # Open visits have no check-out user.
+    checker = aliased(User)
+    query = (
+        select(
+            *_VISIT_COLUMNS,
+            Customer.id.label("customer_id"),
+            Customer.first_name.label("customer_first_name"),
+            Customer.last_name.label("customer_last_name"),
+            Customer.phone.label("customer_phone"),
+            Customer.email.label("customer_email"),
+            checker.first_name.label("checked_in_by_first_name"),
+            checker.last_name.label("checked_in_by_last_name"),
         )
-    query = query.order_by(ShowroomVisit.checked_in_at.desc())
+        .select_from(ShowroomVisit)
+        .join(Lead, Lead.id == ShowroomVisit.lead_id)
+        .outerjoin(Customer, Customer.id == Lead.customer_id)
+        .outerjoin(checker, checker.id == ShowroomVisit.checked_in_by)
+        .where(ShowroomVisit.checked_out_at.is_(None))
+    )
+    # The lead is always joined here, so the join flag does not matter
+    scope_filters, _ = _visit_scope(current_user)
+    query = query.where(*scope_filters).order_by(ShowroomVisit.checked_in_at.desc())
 
     result = await db.execute(query)
-    visits = result.unique().scalars().all() if current_user.role == UserRole.SALESPERSON else result.scalars().all()
+    visits = [_open_visit_from_row(r) for r in result]
+    content = ShowroomCurrentResponse.model_construct(count=len(visits), visits=visits).model_dump(mode="json")
+    await cache_set(cache_key, content, ttl_seconds=SHOWROOM_CURRENT_CACHE_TTL_SECONDS)
+    return ORJSONResponse(content)
+
+
+def _history_cursor(visit: ShowroomVisit) -> str:
+    """Opaque keyset cursor for the history page after this visit: its (checked_in_at, id)."""
+    return encode_keyset_cursor(visit.checked_in_at, visit.id)
 
-    enriched_visits = [await enrich_visit(db, v) for v in visits]
-    return {"count": len(enriched_visits), "visits": enriched_visits}
+
+def _parse_history_cursor(cursor: str) -> tuple[datetime, UUID]:
+    try:
+        return decode_keyset_cursor(cursor)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid history cursor")
 
 
 @router.get("/history", response_model=ShowroomHistoryResponse)
 async def get_visit_history(
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(
+        None, description="next_cursor from the previous page; seeks past it instead of using page"
+    ),
     date_from: Optional[datetime] = None,
     date_to: Optional[datetime] = None,
     outcome: Optional[ShowroomOutcome] = None,
@@ -521,46 +643,59 @@ async def get_visit_history(
     """
     Get showroom visit history with pagination.
     Admins/owners see all visits in their dealership; salespersons see only their assigned leads.
+    Pass next_cursor back as cursor to page forward without OFFSET (deep pages stay cheap).
     """
-    from app.core.permissions import UserRole
-
-    query = select(ShowroomVisit)
-    count_query = select(func.count(ShowroomVisit.id))
-    if current_user.role != UserRole.SUPER_ADMIN and current_user.dealership_id:
-        query = query.where(ShowroomVisit.dealership_id == current_user.dealership_id)
-        count_query = count_query.where(ShowroomVisit.dealership_id == current_user.dealership_id)
-    if current_user.role == UserRole.SALESPERSON:
-        query = query.join(Lead, ShowroomVisit.lead_id == Lead.id).where(
-            Lead.assigned_to == current_user.id
-        )
-        count_query = count_query.join(Lead, ShowroomVisit.lead_id == Lead.id).where(
-            Lead.assigned_to == current_user.id
-        )
+    filters, needs_lead_join = _visit_scope(current_user)
 
     # Apply filters
     if date_from:
-        query = query.where(ShowroomVisit.checked_in_at >= date_from)
-        count_query = count_query.where(ShowroomVisit.checked_in_at >= date_from)
+        filters.append(ShowroomVisit.checked_in_at >= date_from)
     if date_to:
-        query = query.where(ShowroomVisit.checked_in_at <= date_to)
-        count_query = count_query.where(ShowroomVisit.checked_in_at <= date_to)
+        filters.append(ShowroomVisit.checked_in_at <= date_to)
     if outcome:
-        query = query.where(ShowroomVisit.outcome == outcome)
-        count_query = count_query.where(ShowroomVisit.outcome == outcome)
-    
-    # Get total count
-    total_result = await db.execute(count_query)
-    total = total_result.scalar() or 0
-    
-    # Apply pagination and ordering
-    query = query.order_by(ShowroomVisit.checked_in_at.desc())
-    query = query.offset((page - 1) * page_size).limit(page_size)
-    
-    result = await db.execute(query)
-    visits = result.unique().scalars().all() if current_user.role == UserRole.SALESPERSON else result.scalars().all()
+        filters.append(ShowroomVisit.outcome == outcome)
+
+    def scoped(query):
+        if needs_lead_join:
+            query = query.join(Lead, ShowroomVisit.lead_id == Lead.id)
+        return query.where(*filters)
+
+    # id breaks ties between visits checked in at the same instant, so pages never overlap
+    order_by = (ShowroomVisit.checked_in_at.desc(), ShowroomVisit.id.desc())
+    if cursor:
+        # Seek past the cursor; the window count would only see the rows after it, so the
+        # total comes from an uncorrelated subquery (evaluated once, same round-trip)
+        cursor_checked_in_at, cursor_id = _parse_history_cursor(cursor)
+        total_query = scoped(select(func.count(ShowroomVisit.id)).select_from(ShowroomVisit))
+        query = scoped(select(ShowroomVisit, total_query.correlate(None).scalar_subquery().label("total")))
+        query = query.where(
+            tuple_(ShowroomVisit.checked_in_at, ShowroomVisit.id) < (cursor_checked_in_at, cursor_id)
+        )
+    else:
+        # The page carries the total as COUNT(*) OVER () (computed before LIMIT), so one
+        # scan returns both
+        query = scoped(select(ShowroomVisit, func.count().over().label("total")))
+        query = query.offset((page - 1) * page_size)
+    query = query.order_by(*order_by).limit(page_size).options(*_VISIT_ENRICH_OPTIONS)
+
+    rows = (await db.execute(query)).all()
+    visits = [row[0] for row in rows]
+    if rows:
+        total = rows[0].total
+    elif page > 1 or cursor:
+        # Past the last page there is no row to carry the total
+        total_result = await db.execute(scoped(select(func.count(ShowroomVisit.id)).select_from(ShowroomVisit)))
+        total = total_result.scalar() or 0
+    else:
+        total = 0
 
-    enriched_visits = [await enrich_visit(db, v) for v in visits]
-    return {"items": enriched_visits, "total": total, "page": page, "page_size": page_size}
+    enriched_visits = [enrich_visit(v) for v in visits]
+    next_cursor = _history_cursor(visits[-1]) if len(visits) == page_size else None
+    return _json_response(
+        ShowroomHistoryResponse(
+            items=enriched_visits, total=total, page=page, page_size=page_size, next_cursor=next_cursor
+        )
+    )
 
 
 @router.get("/stats", response_model=ShowroomStats)
@@ -571,81 +706,49 @@ async def get_showroom_stats(
     """
     Get showroom statistics for dashboard.
     Admins/owners see dealership-wide stats; salespersons see only their assigned leads.
+    Cached briefly per scope; check-in/check-out invalidate it.
     """
-    from app.core.permissions import UserRole
-
-    base_filters = [ShowroomVisit.checked_out_at.is_(None)]
-    if current_user.role != UserRole.SUPER_ADMIN and current_user.dealership_id:
-        base_filters.append(ShowroomVisit.dealership_id == current_user.dealership_id)
-    if current_user.role == UserRole.SALESPERSON:
-        base_filters.append(Lead.assigned_to == current_user.id)
-
-    # Currently in showroom
-    current_query = select(func.count(ShowroomVisit.id)).select_from(ShowroomVisit)
-    if current_user.role == UserRole.SALESPERSON:
-        current_query = current_query.join(Lead, ShowroomVisit.lead_id == Lead.id)
-    current_query = current_query.where(and_(*base_filters))
-    current_result = await db.execute(current_query)
-    currently_in_showroom = current_result.scalar() or 0
+    cache_key = _showroom_cache_key("stats", current_user)
+    cached = await cache_get(cache_key)
+    if cached is not None:
+        return ORJSONResponse(cached)
 
     now = utc_now()
     start_of_day = now.replace(hour=0, minute=0, second=0, microsecond=0)
-    today_filters = [ShowroomVisit.checked_in_at >= start_of_day]
-    if current_user.role != UserRole.SUPER_ADMIN and current_user.dealership_id:
-        today_filters.append(ShowroomVisit.dealership_id == current_user.dealership_id)
-    if current_user.role == UserRole.SALESPERSON:
-        today_filters.append(Lead.assigned_to == current_user.id)
-
-    today_query = select(func.count(ShowroomVisit.id)).select_from(ShowroomVisit)
-    if current_user.role == UserRole.SALESPERSON:
-        today_query = today_query.join(Lead, ShowroomVisit.lead_id == Lead.id)
-    today_query = today_query.where(and_(*today_filters))
-    today_result = await db.execute(today_query)
-    checked_in_today = today_result.scalar() or 0
-
-    sold_filters = [
-        ShowroomVisit.checked_in_at >= start_of_day,
-        ShowroomVisit.outcome == ShowroomOutcome.SOLD,
-    ]
-    if current_user.role != UserRole.SUPER_ADMIN and current_user.dealership_id:
-        sold_filters.append(ShowroomVisit.dealership_id == current_user.dealership_id)
-    if current_user.role == UserRole.SALESPERSON:
-        sold_filters.append(Lead.assigned_to == current_user.id)
-    sold_query = select(func.count(ShowroomVisit.id)).select_from(ShowroomVisit)
-    if current_user.role == UserRole.SALESPERSON:
-        sold_query = sold_query.join(Lead, ShowroomVisit.lead_id == Lead.id)
-    sold_query = sold_query.where(and_(*sold_filters))
-    sold_result = await db.execute(sold_query)
-    sold_today = sold_result.scalar() or 0
-
     thirty_days_ago = now - timedelta(days=30)
-    avg_duration = None
-    try:
-        from sqlalchemy import extract
-        duration_filters = [
-            ShowroomVisit.checked_out_at.isnot(None),
-            ShowroomVisit.checked_in_at >= thirty_days_ago,
-        ]
-        if current_user.role != UserRole.SUPER_ADMIN and current_user.dealership_id:
-            duration_filters.append(ShowroomVisit.dealership_id == current_user.dealership_id)
-        if current_user.role == UserRole.SALESPERSON:
-            duration_filters.append(Lead.assigned_to == current_user.id)
-        duration_query = select(
-            func.avg(
-                extract("epoch", ShowroomVisit.checked_out_at - ShowroomVisit.checked_in_at) / 60
-            )
-        ).select_from(ShowroomVisit)
-        if current_user.role == UserRole.SALESPERSON:
-            duration_query = duration_query.join(Lead, ShowroomVisit.lead_id == Lead.id)
-        duration_query = duration_query.where(and_(*duration_filters))
-        duration_result = await db.execute(duration_query)
-        avg_duration = duration_result.scalar()
-    except Exception as e:
-        logger.warning(f"Failed to calculate avg duration: {e}")
-
-    return {
-        "currently_in_showroom": currently_in_showroom,
-        "checked_in_today": checked_in_today,
-        "sold_today": sold_today,
-        "avg_visit_duration_minutes": round(avg_duration, 1) if avg_duration else None
+
+    # Every card comes from one scan: open visits plus the last 30 days of check-ins
+    # (which include today's), each count picking its rows with FILTER.
+    scope_filters, needs_lead_join = _visit_scope(current_user)
+
+    checked_in_today_filter = ShowroomVisit.checked_in_at >= start_of_day
+    stats_query = select(
+        func.count().filter(ShowroomVisit.checked_out_at.is_(None)).label("currently_in_showroom"),
+        func.count().filter(checked_in_today_filter).label("checked_in_today"),
+        func.count().filter(
+            and_(checked_in_today_filter, ShowroomVisit.outcome == ShowroomOutcome.SOLD)
+        ).label("sold_today"),
+        func.avg(
+            extract("epoch", ShowroomVisit.checked_out_at - ShowroomVisit.checked_in_at)
+        ).filter(
+            and_(ShowroomVisit.checked_out_at.isnot(None), ShowroomVisit.checked_in_at >= thirty_days_ago)
+        ).label("avg_duration_seconds"),
+    ).select_from(ShowroomVisit)
+    if needs_lead_join:
+        stats_query = stats_query.join(Lead, ShowroomVisit.lead_id == Lead.id)
+    stats_query = stats_query.where(
+        or_(ShowroomVisit.checked_out_at.is_(None), ShowroomVisit.checked_in_at >= thirty_days_ago),
+        *scope_filters,
+    )
+    stats = (await db.execute(stats_query)).one()
+
+    response = {
+        "currently_in_showroom": stats.currently_in_showroom,
+        "checked_in_today": stats.checked_in_today,
+        "sold_today": stats.sold_today,
+        "avg_visit_duration_minutes": (
+            round(float(stats.avg_duration_seconds) / 60, 1) if stats.avg_duration_seconds else None
+        ),
     }
+    await cache_set(cache_key, response, ttl_seconds=SHOWROOM_STATS_CACHE_TTL_SECONDS)
+    return ORJSONResponse(response)
@@ -3,25 +3,27 @@ SMS API Endpoints - Conversation-style messaging
 """
 import logging
 from datetime import datetime
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, Query
 from pydantic import BaseModel, Field
 from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, raiseload
 
 from app.api import deps
-from app.services.dealership_twilio_config_service import get_effective_twilio_config
+from app.services.dealership_twilio_config_service import get_sms_status
 from app.core.permissions import UserRole
 from app.core.access_scope import get_accessible_dealership_ids, user_can_access_lead
-from app.db.database import get_db
+from app.db.database import async_session_maker, get_db
 from app.models.user import User
 from app.models.sms_log import SMSLog, MessageDirection
+from app.models.customer import Customer
 from app.models.lead import Lead
 from app.services.sms_conversation_service import SMSConversationService, get_sms_conversation_service
 from app.core.websocket_manager import ws_manager
+from app.utils.cursor import decode_keyset_cursor, encode_keyset_cursor
 
 logger = logging.getLogger(__name__)
 
@@ -75,6 +77,7 @@ class ConversationResponse(BaseModel):
     lead_name: str
     lead_phone: Optional[str]
     messages: List[SMSMessageResponse]
+    next_cursor: Optional[str] = None  # Pass as cursor to load older messages
 
 
 class ConversationListItem(BaseModel):
@@ -97,6 +100,42 @@ class UnreadCountResponse(BaseModel):
     count: int
 
 
+# ============ Helpers ============
+
+def _encode_message_cursor(msg: SMSLog) -> str:
+    """Opaque keyset cursor for the messages older than msg: its (created_at, id)."""
+    return encode_keyset_cursor(msg.created_at, msg.id)
+
+
+def _decode_message_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    try:
+        return decode_keyset_cursor(cursor)
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+
+async def _mark_read_bg(lead_id: UUID, dealership_id: Optional[UUID]) -> None:
+    """
+    Mark a conversation read after the response has gone out. Runs in its own session
+    (the request session is closed by then) and tells the dealership's other tabs.
+    """
+    try:
+        async with async_session_maker() as db:
+            marked = await SMSConversationService(db).mark_conversation_as_read(lead_id)
+            await db.commit()
+    except Exception as e:
+        logger.error(f"Failed to mark SMS conversation {lead_id} as read: {e}")
+        return
+    if marked:
+        await ws_manager.broadcast_to_dealership(
+            str(dealership_id) if dealership_id else None,
+            {
+                "type": "sms:read",
+                "payload": {"lead_id": str(lead_id), "marked": marked}
+            }
+        )
+
+
 # ============ Endpoints ============
 
 @router.get("/config", response_model=SMSConfigResponse)
@@ -105,11 +144,8 @@ async def get_sms_config(
     db: AsyncSession = Depends(get_db),
 ):
     """Get SMS configuration status"""
-    effective = await get_effective_twilio_config(db, current_user.dealership_id)
-    return SMSConfigResponse(
-        sms_enabled=effective.is_sms_ready(),
-        phone_number=effective.sms_from_number if effective.is_sms_ready() else None,
-    )
+    sms_ready, phone_number = await get_sms_status(db, current_user.dealership_id)
+    return SMSConfigResponse(sms_enabled=sms_ready, phone_number=phone_number)
 
 
 @router.post("/send", response_model=SendSMSResponse)
@@ -119,8 +155,8 @@ async def send_sms(
     db: AsyncSession = Depends(get_db)
 ):
     """Send an SMS message"""
-    effective = await get_effective_twilio_config(db, current_user.dealership_id)
-    if not effective.is_sms_ready():
+    sms_ready, _ = await get_sms_status(db, current_user.dealership_id)
+    if not sms_ready:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="SMS is not configured"
@@ -187,7 +223,7 @@ async def list_conversations(
     elif current_user.role == UserRole.BDC:
         dealership_ids = await get_accessible_dealership_ids(db, current_user)
 
-    conversations = await service.get_conversations_list(
+    conversations, total_unread = await service.get_conversations_list_with_unread(
         user_id=user_id,
         dealership_id=dealership_id,
         dealership_ids=dealership_ids,
@@ -195,12 +231,6 @@ async def list_conversations(
         limit=limit,
         offset=offset
     )
-
-    total_unread = await service.get_unread_count(
-        user_id=user_id,
-        dealership_id=dealership_id,
-        dealership_ids=dealership_ids,
-    )
     
     return ConversationsListResponse(
         items=[ConversationListItem(**c) for c in conversations],
@@ -211,15 +241,18 @@ async def list_conversations(
 @router.get("/conversations/{lead_id}", response_model=ConversationResponse)
 async def get_conversation(
     lead_id: UUID,
+    background_tasks: BackgroundTasks,
     limit: int = Query(50, ge=1, le=100),
     before: Optional[datetime] = None,
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page (preferred over before)"),
     current_user: User = Depends(deps.get_current_active_user),
     db: AsyncSession = Depends(get_db)
 ):
     """Get SMS conversation with a lead (returns full customer-level history)."""
+    message_cursor = _decode_message_cursor(cursor) if cursor else None
     # Verify access to lead and load customer for name/phone
     result = await db.execute(
-        select(Lead).options(selectinload(Lead.customer)).where(Lead.id == lead_id)
+        select(Lead).options(joinedload(Lead.customer), raiseload("*")).where(Lead.id == lead_id)
     )
     lead = result.scalar_one_or_none()
     
@@ -241,12 +274,12 @@ async def get_conversation(
     messages = await service.get_conversation(
         lead_id=lead_id,
         limit=limit,
-        before=before
+        before=before,
+        cursor=message_cursor
     )
     
-    # Mark as read
-    await service.mark_conversation_as_read(lead_id)
-    await db.commit()
+    # Mark as read once the response is sent; inbound messages are reported read as before
+    background_tasks.add_task(_mark_read_bg, lead.id, lead.dealership_id)
     
     return ConversationResponse(
         lead_id=lead.id,
@@ -262,13 +295,14 @@ async def get_conversation(
                 to_number=msg.to_number,
                 body=msg.body,
                 status=msg.status.value,
-                is_read=msg.is_read,
+                is_read=msg.is_read or msg.direction == MessageDirection.INBOUND,
                 created_at=msg.created_at,
                 sent_at=msg.sent_at,
                 delivered_at=msg.delivered_at
             )
             for msg in messages
-        ]
+        ],
+        next_cursor=_encode_message_cursor(messages[0]) if len(messages) == limit else None
     )
 
 
@@ -280,25 +314,28 @@ async def send_to_lead(
     db: AsyncSession = Depends(get_db)
 ):
     """Send SMS to a specific lead"""
-    # Verify access to lead
+    # Verify access to lead: only the columns needed to check access and address the SMS
     result = await db.execute(
-        select(Lead).where(Lead.id == lead_id)
+        select(Customer.phone, Lead.assigned_to, Lead.dealership_id)
+        .join(Customer, Customer.id == Lead.customer_id)
+        .where(Lead.id == lead_id)
     )
-    lead = result.scalar_one_or_none()
+    row = result.one_or_none()
     
-    if not lead:
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Lead not found"
         )
+    phone, assigned_to, dealership_id = row
     
-    if not lead.phone:
+    if not phone:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Lead has no phone number"
         )
     
-    if not await user_can_access_lead(db, current_user, lead.dealership_id, lead.assigned_to):
+    if not await user_can_access_lead(db, current_user, dealership_id, assigned_to):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Access denied",
@@ -307,11 +344,11 @@ async def send_to_lead(
     service = get_sms_conversation_service(db)
 
     success, sms_log, error = await service.send_sms(
-        to_number=lead.phone,
+        to_number=phone,
         body=request.body,
         user_id=current_user.id,
-        lead_id=lead.id,
-        dealership_id=lead.dealership_id
+        lead_id=lead_id,
+        dealership_id=dealership_id
     )
     
     await db.commit()
@@ -319,12 +356,12 @@ async def send_to_lead(
     if success and sms_log:
         # Send real-time update
         await ws_manager.broadcast_to_dealership(
-            str(lead.dealership_id) if lead.dealership_id else None,
+            str(dealership_id) if dealership_id else None,
             {
                 "type": "sms:sent",
                 "payload": {
                     "message_id": str(sms_log.id),
-                    "lead_id": str(lead.id),
+                    "lead_id": str(lead_id),
                     "body_preview": sms_log.body[:50] if sms_log.body else ""
                 }
             }
@@ -23,6 +23,9 @@ from app.services.stips_service import StipsCategoryService
 
 router = APIRouter()
 
+# Azure storage settings come from the environment and are fixed for the process lifetime
+_STIPS_CONFIGURED = settings.is_azure_stips_configured
+
 
 class StipsStatusResponse(BaseModel):
     configured: bool
@@ -33,7 +36,7 @@ async def stips_status(
     current_user: User = Depends(deps.get_current_active_user),
 ) -> Any:
     """Whether Stips storage (Azure) is configured; frontend uses this to show/hide upload."""
-    return StipsStatusResponse(configured=settings.is_azure_stips_configured)
+    return StipsStatusResponse(configured=_STIPS_CONFIGURED)
 
 
 @router.get("/categories", response_model=List[StipsCategoryResponse])
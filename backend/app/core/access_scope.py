@@ -28,6 +28,16 @@ async def build_ws_token_claims(db: AsyncSession, user: User) -> Dict[str, Any]:
     return claims
 
 
+async def get_user_dealership_id(db: AsyncSession, user_id: UUID) -> Optional[UUID]:
+    """
+    Dealership of another user (None if the user does not exist or has none).
+    Read fresh on every call: it backs authorization checks, so a user moved to
+    another dealership must lose access immediately.
+    """
+    result = await db.execute(select(User.dealership_id).where(User.id == user_id))
+    return result.scalar_one_or_none()
+
+
 async def get_accessible_dealership_ids(
     db: AsyncSession,
     user: User,
@@ -56,6 +56,14 @@ class Settings(BaseSettings):
         default="",
         validation_alias=AliasChoices("DATABASE_URL", "DATABASE_URL_33"),
     )
+    # Connection pool per worker process. 0 keeps NullPool (connect per session), which is
+    # safe with many workers or behind an external pooler (PgBouncer, Neon). A positive size
+    # keeps that many connections open so requests skip the connect/TLS/auth handshake;
+    # size it so workers x (pool size + overflow) stays under Postgres max_connections.
+    db_pool_size: int = 0
+    db_max_overflow: int = 10
+    db_pool_recycle_seconds: int = 1800
+    db_pool_timeout_seconds: int = 30
     
     # JWT Settings (.env may use SECRET_KEY or JWT_SECRET)
     secret_key: str = Field(
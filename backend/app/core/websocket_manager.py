@@ -1,14 +1,20 @@
 """
 WebSocket Connection Manager for real-time updates
 """
+import asyncio
 import logging
-from typing import Dict, List, Optional, Set
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 import json
 
 from fastapi import WebSocket
+from starlette.websockets import WebSocketState
 
 logger = logging.getLogger(__name__)
 
+# Broadcast fan-out: sends within a batch run concurrently; the loop gets a turn
+# between batches so a large dealership does not hold it for the whole broadcast
+BROADCAST_BATCH_SIZE = 50
+
 
 class WebSocketManager:
     """
@@ -111,6 +117,31 @@ class WebSocketManager:
             for ws in dead_connections:
                 self.active_connections[user_id].discard(ws)
     
+    async def _send_batched(self, targets: List[Tuple[str, WebSocket]], message: dict) -> None:
+        """Send message to (user_id, websocket) pairs in concurrent batches, dropping dead sockets."""
+        for start in range(0, len(targets), BROADCAST_BATCH_SIZE):
+            if start:
+                await asyncio.sleep(0)
+            batch = targets[start:start + BROADCAST_BATCH_SIZE]
+            results = await asyncio.gather(
+                *(websocket.send_json(message) for _, websocket in batch),
+                return_exceptions=True,
+            )
+            for (user_id, websocket), result in zip(batch, results):
+                if isinstance(result, Exception):
+                    logger.warning(f"Failed to send to user {user_id}: {result}")
+                    if user_id in self.active_connections:
+                        self.active_connections[user_id].discard(websocket)
+
+    def _open_connections(self, user_ids: Iterable[str]) -> List[Tuple[str, WebSocket]]:
+        """Snapshot the open connections of user_ids (safe against connects/disconnects mid-send)."""
+        return [
+            (user_id, websocket)
+            for user_id in user_ids
+            for websocket in list(self.active_connections.get(user_id, ()))
+            if websocket.client_state == WebSocketState.CONNECTED
+        ]
+
     async def send_to_users(self, user_ids: List[str], message: dict):
         """Send a message to multiple users"""
         for user_id in user_ids:
@@ -136,9 +167,8 @@ class WebSocketManager:
                 user_count,
                 dealership_id,
             )
-            for user_id in self.dealership_users[dealership_id]:
-                if user_id != exclude_user:
-                    await self.send_to_user(user_id, message)
+            user_ids = [u for u in self.dealership_users[dealership_id] if u != exclude_user]
+            await self._send_batched(self._open_connections(user_ids), message)
         else:
             logger.debug(
                 "No users connected for dealership %s (event %s)",
@@ -148,8 +178,7 @@ class WebSocketManager:
     
     async def broadcast_all(self, message: dict):
         """Broadcast a message to all connected users"""
-        for user_id in list(self.active_connections.keys()):
-            await self.send_to_user(user_id, message)
+        await self._send_batched(self._open_connections(list(self.active_connections.keys())), message)
     
     def get_connected_users(self) -> List[str]:
         """Get list of all connected user IDs"""
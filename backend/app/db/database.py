@@ -2,12 +2,15 @@
 Database configuration and session management
 
 NOTE: When running with multiple workers (uvicorn --workers N), each worker
-gets its own copy of the engine. Using NullPool prevents connection exhaustion
-by creating connections on-demand and closing them immediately after use.
+gets its own copy of the engine. By default NullPool prevents connection
+exhaustion by creating connections on-demand and closing them immediately after
+use; set DB_POOL_SIZE to keep a bounded per-worker pool of open connections
+instead (see Settings.db_pool_size).
 
 Connection timeouts are set to prevent stuck transactions from blocking the database.
 """
-from typing import AsyncGenerator
+import asyncio
+from typing import Any, AsyncGenerator, List
 
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
@@ -45,15 +48,33 @@ def get_engine_url_and_connect_args():
 
 _engine_url, _connect_args = get_engine_url_and_connect_args()
 
-# Create async engine with NullPool for multi-worker compatibility
-# NullPool creates connections on-demand and closes them immediately after use
-# This prevents connection exhaustion when running with multiple workers
+
+def _engine_pool_kwargs() -> dict:
+    """
+    Pool settings for the app engine.
+
+    Default (DB_POOL_SIZE=0): NullPool for multi-worker compatibility - connections
+    are created on-demand and closed immediately after use, so N workers cannot
+    exhaust the server. With DB_POOL_SIZE > 0 each worker keeps a bounded queue
+    pool; pre-ping and recycling drop connections the server or a proxy closed.
+    """
+    if settings.db_pool_size <= 0:
+        return {"poolclass": NullPool}
+    return {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_pre_ping": True,
+        "pool_recycle": settings.db_pool_recycle_seconds,
+        "pool_timeout": settings.db_pool_timeout_seconds,
+    }
+
+
 engine = create_async_engine(
     _engine_url,
     echo=False,  # Disable SQL logging for better performance
     future=True,
-    poolclass=NullPool,  # Each query gets a fresh connection - works with multi-worker
     connect_args=_connect_args,
+    **_engine_pool_kwargs(),
 )
 
 # Create async session factory
@@ -84,6 +105,45 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+# Extra connections execute_concurrently may hold at once, across all requests of
+# this worker. Two pool slots stay free for ordinary request sessions. Under
+# NullPool (or a pool too small to spare any) there is no fan-out at all: every
+# extra connection would be a fresh handshake, and NullPool exists so N workers
+# cannot exhaust the server.
+_CONCURRENT_EXECUTE_LIMIT = settings.db_pool_size - 2
+_concurrent_execute_semaphore = (
+    asyncio.Semaphore(_CONCURRENT_EXECUTE_LIMIT) if _CONCURRENT_EXECUTE_LIMIT > 0 else None
+)
+
+
+async def execute_concurrently(db: AsyncSession, *statements: Any) -> List[Any]:
+    """
+    Execute independent read-only statements in parallel.
+
+    An AsyncSession owns a single connection and cannot run statements
+    concurrently, so the first statement runs on ``db`` and each remaining one
+    on its own short-lived session, bounded by a per-worker semaphore sized from
+    the pool settings. Without a pool to draw from, the statements run one after
+    another on ``db``. ORM results are fully buffered by ``execute`` in async
+    mode, so they stay readable after those sessions close.
+    Returns the results in the same order as ``statements``.
+    """
+    async def _execute_in_new_session(statement: Any) -> Any:
+        async with _concurrent_execute_semaphore:
+            async with async_session_maker() as session:
+                return await session.execute(statement)
+
+    if not statements:
+        return []
+    if _concurrent_execute_semaphore is None:
+        return [await db.execute(stmt) for stmt in statements]
+    first, *rest = statements
+    return list(await asyncio.gather(
+        db.execute(first),
+        *(_execute_in_new_session(stmt) for stmt in rest),
+    ))
+
+
 async def create_tables():
     """Create all tables (for development only)"""
     async with engine.begin() as conn:
@@ -8,7 +8,7 @@ from typing import TYPE_CHECKING, Optional, List
 
 from app.core.timezone import utc_now
 
-from sqlalchemy import DateTime, ForeignKey, String, Text
+from sqlalchemy import DateTime, ForeignKey, Index, String, Text, text
 from sqlalchemy import Enum as SQLEnum
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -167,3 +167,21 @@ class Activity(Base):
     
     def __repr__(self) -> str:
         return f"<Activity {self.type.value} at {self.created_at}>"
+
+
+# Dealership activity by type and time (analysis / daily-activity reports)
+Index(
+    "ix_activities_dealership_type_created",
+    Activity.dealership_id,
+    Activity.type,
+    Activity.created_at,
+    postgresql_include=["user_id", "lead_id"],
+)
+# Newest notes per author (analysis "last note" column: DISTINCT ON user ordered by recency)
+Index(
+    "ix_activities_user_notes_created",
+    Activity.user_id,
+    Activity.created_at.desc(),
+    postgresql_where=text("type = 'NOTE_ADDED'"),
+    postgresql_include=["lead_id"],
+)
@@ -6,7 +6,7 @@ from datetime import datetime
 from enum import Enum
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, String, Text, Enum as SQLEnum
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, Integer, String, Text, Enum as SQLEnum, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -190,3 +190,19 @@ class Appointment(Base):
     
     def __repr__(self) -> str:
         return f"<Appointment {self.title} ({self.status.value}) at {self.scheduled_at}>"
+
+
+# Open (scheduled/confirmed) appointments per assignee ordered by time
+Index(
+    "ix_appointments_assigned_active",
+    Appointment.assigned_to,
+    Appointment.scheduled_at,
+    postgresql_where=text("status IN ('scheduled', 'confirmed')"),
+)
+# Appointments slotted per dealership over a period (Saturday ranges); INCLUDE covers per-salesperson counts
+Index(
+    "ix_appointments_dealership_scheduled",
+    Appointment.dealership_id,
+    Appointment.scheduled_at,
+    postgresql_include=["assigned_to", "lead_id"],
+)
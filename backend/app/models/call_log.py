@@ -6,7 +6,7 @@ from datetime import datetime
 from enum import Enum
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import DateTime, ForeignKey, String, Text, Integer, Boolean
+from sqlalchemy import DateTime, ForeignKey, Index, String, Text, Integer, Boolean, text
 from sqlalchemy import Enum as SQLEnum
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -233,3 +233,20 @@ class CallLog(Base):
     
     def __repr__(self) -> str:
         return f"<CallLog {self.direction.value} {self.status.value} {self.from_number} -> {self.to_number}>"
+
+
+# Dealership call history by recency; INCLUDE covers the communication report aggregates
+Index(
+    "ix_call_logs_dealership_created",
+    CallLog.dealership_id,
+    CallLog.created_at.desc(),
+    postgresql_include=["user_id", "direction", "status", "duration_seconds"],
+)
+# Outbound calls per dealership over a period (Friday ranges); INCLUDE covers per-salesperson counts
+Index(
+    "ix_call_logs_dealership_outbound_started",
+    CallLog.dealership_id,
+    CallLog.started_at,
+    postgresql_where=text("direction = 'outbound'"),
+    postgresql_include=["user_id", "lead_id"],
+)
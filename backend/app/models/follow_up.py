@@ -6,7 +6,7 @@ from datetime import datetime
 from enum import Enum
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import DateTime, ForeignKey, Text
+from sqlalchemy import DateTime, ForeignKey, Index, Text, text
 from sqlalchemy import Enum as SQLEnum
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -108,3 +108,12 @@ class FollowUp(Base):
     
     def __repr__(self) -> str:
         return f"<FollowUp {self.id} for Lead {self.lead_id} at {self.scheduled_at}>"
+
+
+# Pending follow-ups per assignee ordered by due time (pending-tasks report, reminders)
+Index(
+    "ix_follow_ups_assigned_pending",
+    FollowUp.assigned_to,
+    FollowUp.scheduled_at,
+    postgresql_where=text("status = 'PENDING'"),
+)
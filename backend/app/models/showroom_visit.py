@@ -6,7 +6,7 @@ from datetime import datetime
 from enum import Enum
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import DateTime, ForeignKey, Text, Enum as SQLEnum
+from sqlalchemy import DateTime, ForeignKey, Index, Text, Enum as SQLEnum, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -146,3 +146,32 @@ class ShowroomVisit(Base):
     
     def __repr__(self):
         return f"<ShowroomVisit {self.id} lead={self.lead_id} in={self.is_checked_in}>"
+
+
+# Check-ins per dealership over a report period; INCLUDE covers the lead-scoped counts
+Index(
+    "ix_showroom_visits_dealership_checked_in",
+    ShowroomVisit.dealership_id,
+    ShowroomVisit.checked_in_at,
+    postgresql_include=["lead_id"],
+)
+# Open visits: at most one per lead (check-in's ON CONFLICT target) and a dealership's current visitors
+Index(
+    "ix_showroom_visits_open_lead",
+    ShowroomVisit.lead_id,
+    unique=True,
+    postgresql_where=text("checked_out_at IS NULL"),
+)
+Index(
+    "ix_showroom_visits_open_dealership",
+    ShowroomVisit.dealership_id,
+    ShowroomVisit.checked_in_at.desc(),
+    postgresql_where=text("checked_out_at IS NULL"),
+)
+# Visits by outcome per dealership over time ("sold today", history outcome filter)
+Index(
+    "ix_showroom_visits_dealership_outcome_checked_in",
+    ShowroomVisit.dealership_id,
+    ShowroomVisit.outcome,
+    ShowroomVisit.checked_in_at,
+)
@@ -6,7 +6,7 @@ from datetime import datetime
 from enum import Enum
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import DateTime, ForeignKey, String, Text, Boolean
+from sqlalchemy import DateTime, ForeignKey, Index, String, Text, Boolean
 from sqlalchemy import Enum as SQLEnum
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -195,3 +195,25 @@ class SMSLog(Base):
     def __repr__(self) -> str:
         preview = self.body[:30] + "..." if len(self.body) > 30 else self.body
         return f"<SMSLog {self.direction.value} '{preview}'>"
+
+
+# Dealership SMS history by recency; INCLUDE covers the communication report aggregates
+Index(
+    "ix_sms_logs_dealership_created",
+    SMSLog.dealership_id,
+    SMSLog.created_at.desc(),
+    postgresql_include=["user_id", "direction"],
+)
+# Conversation threads (customer-level, legacy lead-level) paged by a (created_at, id) cursor
+Index(
+    "ix_sms_logs_customer_created_id",
+    SMSLog.customer_id,
+    SMSLog.created_at.desc(),
+    SMSLog.id.desc(),
+)
+Index(
+    "ix_sms_logs_lead_created_id",
+    SMSLog.lead_id,
+    SMSLog.created_at.desc(),
+    SMSLog.id.desc(),
+)
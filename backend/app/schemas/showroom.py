@@ -32,6 +32,9 @@ class CustomerBrief(BaseModel):
     phone: Optional[str] = None
     email: Optional[str] = None
 
+    class Config:
+        from_attributes = True
+
 
 class LeadBrief(BaseModel):
     """Brief lead info for showroom responses (id + customer details)"""
@@ -88,6 +91,7 @@ class ShowroomHistoryResponse(BaseModel):
     total: int
     page: int
     page_size: int
+    next_cursor: Optional[str] = None  # Pass as cursor for the next page (keyset)
 
 
 class ShowroomStats(BaseModel):
@@ -11,11 +11,15 @@ from uuid import UUID
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import cache_get, cache_invalidate_prefix, cache_set
 from app.core.config import Settings, settings
 from app.models.dealership_twilio_config import DealershipTwilioConfig
 
 logger = logging.getLogger(__name__)
 
+SMS_STATUS_CACHE_PREFIX = "twilio:sms:"
+SMS_STATUS_CACHE_TTL_SECONDS = 60
+
 
 def digits_last10(phone: Optional[str]) -> str:
     """Normalize to last 10 digits for comparing Twilio From/To numbers."""
@@ -183,6 +187,34 @@ async def get_effective_twilio_config(
     return _merge(row, settings)
 
 
+async def get_sms_status(
+    db: AsyncSession, dealership_id: Optional[UUID]
+) -> tuple[bool, Optional[str]]:
+    """
+    (SMS ready, from number) for a dealership, cached so the SMS endpoints do not
+    re-read and decrypt the Twilio row on every request. Secrets are never cached.
+    """
+    cache_key = f"{SMS_STATUS_CACHE_PREFIX}{dealership_id or 'global'}"
+    cached = await cache_get(cache_key)
+    if cached is not None:
+        return cached["ready"], cached["from_number"]
+
+    effective = await get_effective_twilio_config(db, dealership_id)
+    ready = effective.is_sms_ready()
+    from_number = effective.sms_from_number if ready else None
+    await cache_set(
+        cache_key,
+        {"ready": ready, "from_number": from_number},
+        ttl_seconds=SMS_STATUS_CACHE_TTL_SECONDS,
+    )
+    return ready, from_number
+
+
+async def invalidate_sms_status(dealership_id: UUID) -> None:
+    """Drop the cached SMS status of a dealership after its Twilio config changes."""
+    await cache_invalidate_prefix(f"{SMS_STATUS_CACHE_PREFIX}{dealership_id}")
+
+
 async def find_dealership_id_by_inbound_to(
     db: AsyncSession, to_raw: str
 ) -> Optional[UUID]:
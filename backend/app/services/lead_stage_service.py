@@ -2,16 +2,32 @@
 LeadStage Service — CRUD, reorder, seed defaults.
 """
 import logging
+from dataclasses import asdict, dataclass
 from typing import List, Optional
 from uuid import UUID
 
 from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import cache_get, cache_invalidate_prefix, cache_set
 from app.models.lead_stage import DEFAULT_STAGES, LeadStage
 
 logger = logging.getLogger(__name__)
 
+LEAD_STAGE_CACHE_PREFIX = "lead_stages:"
+# Stages are edited from the pipeline settings only; those routes drop the cache
+LEAD_STAGE_CACHE_TTL_SECONDS = 300
+
+
+@dataclass(frozen=True)
+class StageRef:
+    """The stage fields hot write paths need, detached from any session."""
+
+    id: UUID
+    name: str
+    display_name: str
+    is_terminal: bool
+
 
 class LeadStageService:
     """Service for managing pipeline stages."""
@@ -73,6 +89,33 @@ class LeadStageService:
         result = await db.execute(q)
         return result.scalar_one_or_none()
 
+    @staticmethod
+    async def get_stage_ref_by_name(
+        db: AsyncSession, name: str, dealership_id: Optional[UUID] = None
+    ) -> Optional[StageRef]:
+        """Cached get_stage_by_name for callers that only need the stage's identity."""
+        cache_key = f"{LEAD_STAGE_CACHE_PREFIX}name:{dealership_id or 'global'}:{name}"
+        cached = await cache_get(cache_key)
+        if cached is not None:
+            return StageRef(**{**cached, "id": UUID(cached["id"])})
+
+        stage = await LeadStageService.get_stage_by_name(db, name, dealership_id)
+        if stage is None:
+            return None
+        ref = StageRef(
+            id=stage.id,
+            name=stage.name,
+            display_name=stage.display_name,
+            is_terminal=stage.is_terminal,
+        )
+        await cache_set(cache_key, asdict(ref), ttl_seconds=LEAD_STAGE_CACHE_TTL_SECONDS)
+        return ref
+
+    @staticmethod
+    async def invalidate_stage_cache() -> None:
+        """Drop cached stage lookups after stages are created, edited or seeded."""
+        await cache_invalidate_prefix(LEAD_STAGE_CACHE_PREFIX)
+
     @staticmethod
     async def get_default_stage(
         db: AsyncSession, dealership_id: Optional[UUID] = None
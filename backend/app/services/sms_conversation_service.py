@@ -6,7 +6,7 @@ from datetime import datetime
 from typing import Optional, Dict, Any, List, Tuple
 from uuid import UUID
 
-from sqlalchemy import select, or_, func, and_
+from sqlalchemy import select, or_, func, and_, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -287,9 +287,14 @@ class SMSConversationService:
         self,
         lead_id: UUID,
         limit: int = 50,
-        before: Optional[datetime] = None
+        before: Optional[datetime] = None,
+        cursor: Optional[Tuple[datetime, UUID]] = None
     ) -> List[SMSLog]:
-        """Get SMS conversation for the lead's customer (full history at customer level)."""
+        """
+        Get SMS conversation for the lead's customer (full history at customer level).
+        cursor is the (created_at, id) of the oldest message already shown; the page is
+        the messages strictly older than it, so ties and new arrivals never shift pages.
+        """
         lead_result = await self.db.execute(select(Lead).where(Lead.id == lead_id))
         lead = lead_result.scalar_one_or_none()
         if not lead:
@@ -301,13 +306,15 @@ class SMSConversationService:
             query = query.where(SMSLog.customer_id == customer_id)
         else:
             query = query.where(SMSLog.lead_id == lead_id)
-        if before:
+        if cursor:
+            query = query.where(tuple_(SMSLog.created_at, SMSLog.id) < cursor)
+        elif before:
             query = query.where(SMSLog.created_at < before)
-        query = query.order_by(SMSLog.created_at.desc()).limit(limit)
+        query = query.order_by(SMSLog.created_at.desc(), SMSLog.id.desc()).limit(limit)
         result = await self.db.execute(query)
         return list(reversed(result.scalars().all()))
     
-    async def get_conversations_list(
+    def _conversations_list_query(
         self,
         user_id: Optional[UUID] = None,
         dealership_id: Optional[UUID] = None,
@@ -315,12 +322,8 @@ class SMSConversationService:
         unread_only: bool = False,
         limit: int = 50,
         offset: int = 0
-    ) -> List[Dict[str, Any]]:
-        """
-        Get list of SMS conversations with last message and unread count.
-        Groups by lead (so assignee sees their leads); name/phone from Customer.
-        Opening a conversation shows full customer-level history.
-        """
+    ):
+        """Page of conversations: each lead's last message with its customer's name/phone."""
         # Subquery: last message per lead (lead is the conversation key for list)
         subq = (
             select(
@@ -365,37 +368,75 @@ class SMSConversationService:
                 SMSLog.direction == MessageDirection.INBOUND
             )
 
-        query = query.order_by(SMSLog.created_at.desc()).offset(offset).limit(limit)
+        return query.order_by(SMSLog.created_at.desc()).offset(offset).limit(limit)
+
+    @staticmethod
+    def _conversation_item(sms: SMSLog, first_name, last_name, phone, unread_count) -> Dict[str, Any]:
+        return {
+            "lead_id": str(sms.lead_id),
+            "customer_id": str(sms.customer_id) if sms.customer_id else None,
+            "lead_name": f"{first_name or ''} {last_name or ''}".strip() or "Unknown",
+            "lead_phone": phone,
+            "last_message": {
+                "id": str(sms.id),
+                "body": sms.body,
+                "direction": sms.direction.value,
+                "created_at": sms.created_at.isoformat(),
+                "status": sms.status.value
+            },
+            "unread_count": unread_count
+        }
+
+    async def get_conversations_list(
+        self,
+        user_id: Optional[UUID] = None,
+        dealership_id: Optional[UUID] = None,
+        dealership_ids: Optional[List[UUID]] = None,
+        unread_only: bool = False,
+        limit: int = 50,
+        offset: int = 0
+    ) -> List[Dict[str, Any]]:
+        """
+        Get list of SMS conversations with last message and unread count.
+        Groups by lead (so assignee sees their leads); name/phone from Customer.
+        Opening a conversation shows full customer-level history.
+        """
+        query = self._conversations_list_query(
+            user_id, dealership_id, dealership_ids, unread_only, limit, offset
+        )
         result = await self.db.execute(query)
-        rows = result.all()
+        return [self._conversation_item(*row) for row in result.all()]
 
-        conversations = []
-        for row in rows:
-            sms, first_name, last_name, phone, unread_count = row
-            conversations.append({
-                "lead_id": str(sms.lead_id),
-                "customer_id": str(sms.customer_id) if sms.customer_id else None,
-                "lead_name": f"{first_name or ''} {last_name or ''}".strip() or "Unknown",
-                "lead_phone": phone,
-                "last_message": {
-                    "id": str(sms.id),
-                    "body": sms.body,
-                    "direction": sms.direction.value,
-                    "created_at": sms.created_at.isoformat(),
-                    "status": sms.status.value
-                },
-                "unread_count": unread_count
-            })
+    async def get_conversations_list_with_unread(
+        self,
+        user_id: Optional[UUID] = None,
+        dealership_id: Optional[UUID] = None,
+        dealership_ids: Optional[List[UUID]] = None,
+        unread_only: bool = False,
+        limit: int = 50,
+        offset: int = 0
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        get_conversations_list plus get_unread_count in one round-trip: the total rides
+        on every page row as an uncorrelated scalar subquery (evaluated once).
+        """
+        total_unread = self._unread_count_query(user_id, dealership_id, dealership_ids)
+        query = self._conversations_list_query(
+            user_id, dealership_id, dealership_ids, unread_only, limit, offset
+        ).add_columns(total_unread.correlate(None).scalar_subquery().label("total_unread"))
+        rows = (await self.db.execute(query)).all()
+        if not rows:
+            # An empty page has no row to carry the total
+            return [], await self.get_unread_count(user_id, dealership_id, dealership_ids)
+        return [self._conversation_item(*row[:5]) for row in rows], rows[0].total_unread or 0
 
-        return conversations
-    
-    async def get_unread_count(
+    def _unread_count_query(
         self,
         user_id: Optional[UUID] = None,
         dealership_id: Optional[UUID] = None,
         dealership_ids: Optional[List[UUID]] = None,
-    ) -> int:
-        """Get total unread SMS count (customer-level: via lead or customer access)."""
+    ):
+        """Total unread inbound SMS (customer-level: via lead or customer access)."""
         query = select(func.count(func.distinct(SMSLog.id))).where(
             SMSLog.is_read == False,
             SMSLog.direction == MessageDirection.INBOUND
@@ -420,7 +461,16 @@ class SMSConversationService:
                 query = query.where(Lead.dealership_id.in_(dealership_ids))
             else:
                 query = query.where(Lead.dealership_id == dealership_id)
-        result = await self.db.execute(query)
+        return query
+
+    async def get_unread_count(
+        self,
+        user_id: Optional[UUID] = None,
+        dealership_id: Optional[UUID] = None,
+        dealership_ids: Optional[List[UUID]] = None,
+    ) -> int:
+        """Get total unread SMS count (customer-level: via lead or customer access)."""
+        result = await self.db.execute(self._unread_count_query(user_id, dealership_id, dealership_ids))
         return result.scalar() or 0
     
     async def _log_sms_activity(
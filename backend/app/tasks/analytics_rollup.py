@@ -0,0 +1,29 @@
+"""
+Analytics rollup refresh task
+
+Keeps the report rollups fresh. Runs every 5 minutes:
+- mv_dealership_hourly_activity (alembic bd_dealership_hourly_rollup) for the
+  /reports/analysis summary
+- mv_lead_hourly_activity (alembic bf_lead_hourly_rollup) for the
+  /reports/analytics charts
+"""
+import logging
+
+from sqlalchemy import text
+
+from app.db.database import engine
+
+logger = logging.getLogger(__name__)
+
+ROLLUP_VIEW_NAMES = ("mv_dealership_hourly_activity", "mv_lead_hourly_activity")
+
+
+async def refresh_analytics_rollups():
+    """Refresh each hourly rollup without blocking readers."""
+    for view_name in ROLLUP_VIEW_NAMES:
+        try:
+            async with engine.begin() as conn:
+                await conn.execute(text(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {view_name}"))
+            logger.debug("Refreshed %s", view_name)
+        except Exception as e:
+            logger.error(f"Failed to refresh {view_name}: {e}")
@@ -8,6 +8,7 @@ Active jobs only:
 - Appointment reminders (every 5 minutes)
 - Follow-up reminders (every 15 minutes)
 - Missed appointment detection (every 30 minutes)
+- Analytics hourly rollups refresh (every 5 minutes)
 
 IMAP email sync and WhatsApp bulk/auto workers are intentionally not scheduled.
 """
@@ -119,6 +120,17 @@ def setup_scheduler():
         max_instances=1,
     )
 
+    # Analytics rollup materialized views - every 5 minutes
+    from app.tasks.analytics_rollup import refresh_analytics_rollups
+    scheduler.add_job(
+        refresh_analytics_rollups,
+        trigger=IntervalTrigger(minutes=5, start_date=datetime.now() + timedelta(seconds=40)),
+        id="analytics_rollup_refresh",
+        name="Refresh hourly analytics rollups",
+        replace_existing=True,
+        max_instances=1,
+    )
+
     logger.info("Background scheduler configured (lead sync + appointments only):")
     logger.info("  - Google Sheets lead sync (every 2 minutes)")
     logger.info("  - Lead auto-assignment (every 2 minutes)")
@@ -126,6 +138,7 @@ def setup_scheduler():
     logger.info("  - Appointment reminders (every 5 minutes)")
     logger.info("  - Follow-up reminders (every 15 minutes)")
     logger.info("  - Missed appointment detection (every 30 minutes)")
+    logger.info("  - Analytics rollup refresh (every 5 minutes)")
     logger.info("  - DISABLED: IMAP email sync, WhatsApp bulk, Auto WhatsApp worker")
 
 
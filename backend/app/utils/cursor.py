@@ -0,0 +1,22 @@
+"""
+Opaque keyset cursors for (timestamp, id) ordered lists
+"""
+import base64
+import binascii
+from datetime import datetime
+from typing import Tuple
+from uuid import UUID
+
+
+def encode_keyset_cursor(timestamp: datetime, row_id: UUID) -> str:
+    """URL-safe cursor for the rows after (timestamp, row_id) in (timestamp DESC, id DESC) order."""
+    return base64.urlsafe_b64encode(f"{timestamp.isoformat()}|{row_id}".encode()).decode()
+
+
+def decode_keyset_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """Inverse of encode_keyset_cursor; raises ValueError for anything it did not produce."""
+    try:
+        timestamp, row_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|", 1)
+        return datetime.fromisoformat(timestamp), UUID(row_id)
+    except (binascii.Error, UnicodeDecodeError) as e:
+        raise ValueError("Invalid cursor") from e
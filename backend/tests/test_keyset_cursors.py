@@ -0,0 +1,61 @@
+"""
+Tests for the opaque keyset cursors used by showroom history, SMS threads and the team activity feed.
+Run with: pytest tests/test_keyset_cursors.py -v
+"""
+import base64
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+
+from app.api.v1.endpoints.showroom import _history_cursor, _parse_history_cursor
+from app.api.v1.endpoints.sms import _decode_message_cursor, _encode_message_cursor
+from app.utils.cursor import decode_keyset_cursor, encode_keyset_cursor
+
+INVALID_CURSORS = [
+    "!!!",
+    base64.urlsafe_b64encode(b"hello").decode(),
+    base64.urlsafe_b64encode(b"not-a-date|" + str(uuid4()).encode()).decode(),
+    base64.urlsafe_b64encode(b"2026-10-17T00:00:00+00:00|not-a-uuid").decode(),
+    "2026-10-17T00:00:00+00:00|" + str(uuid4()),
+]
+
+
+class TestKeysetCursor:
+    """Test the shared encode/decode pair."""
+
+    def test_round_trip(self):
+        ts = datetime(2026, 10, 17, 15, 20, 18, 340197, tzinfo=timezone.utc)
+        row_id = uuid4()
+        assert decode_keyset_cursor(encode_keyset_cursor(ts, row_id)) == (ts, row_id)
+
+    def test_query_string_safe(self):
+        """No '+', '/' or '|' that a query string could mangle."""
+        cursor = encode_keyset_cursor(datetime(2026, 10, 17, tzinfo=timezone.utc), uuid4())
+        assert not set(cursor) & {"+", "/", "|", " "}
+
+    @pytest.mark.parametrize("cursor", INVALID_CURSORS)
+    def test_invalid_cursor_raises_value_error(self, cursor):
+        with pytest.raises(ValueError):
+            decode_keyset_cursor(cursor)
+
+
+class TestEndpointCursors:
+    """Test the showroom history and SMS thread cursors built on it."""
+
+    def test_history_cursor_round_trip(self):
+        visit = SimpleNamespace(checked_in_at=datetime(2026, 10, 17, 9, 30, tzinfo=timezone.utc), id=uuid4())
+        assert _parse_history_cursor(_history_cursor(visit)) == (visit.checked_in_at, visit.id)
+
+    def test_message_cursor_round_trip(self):
+        msg = SimpleNamespace(created_at=datetime(2026, 10, 17, 9, 30, tzinfo=timezone.utc), id=uuid4())
+        assert _decode_message_cursor(_encode_message_cursor(msg)) == (msg.created_at, msg.id)
+
+    @pytest.mark.parametrize("cursor", INVALID_CURSORS)
+    def test_invalid_cursor_is_400(self, cursor):
+        for decode in (_parse_history_cursor, _decode_message_cursor):
+            with pytest.raises(HTTPException) as exc_info:
+                decode(cursor)
+            assert exc_info.value.status_code == 400
@@ -0,0 +1,56 @@
+"""
+Tests for daily-activities range parsing (bare dates vs explicit datetimes).
+Run with: pytest tests/test_report_date_range.py -v
+"""
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+from pydantic import TypeAdapter, ValidationError
+
+from app.api.v1.endpoints.reports import DateOrDateTime, _utc_date_range
+
+UTC = timezone.utc
+parse = TypeAdapter(DateOrDateTime).validate_python
+
+
+class TestDateOrDateTime:
+    """Test that bare dates stay dates and everything else parses as a datetime."""
+
+    def test_bare_date(self):
+        assert parse("2026-10-17") == date(2026, 10, 17)
+        assert not isinstance(parse("2026-10-17"), datetime)
+
+    def test_explicit_midnight_is_a_datetime(self):
+        assert parse("2026-10-17T00:00:00") == datetime(2026, 10, 17, 0, 0)
+
+    def test_aware_datetime(self):
+        assert parse("2026-10-17T05:00:00Z") == datetime(2026, 10, 17, 5, 0, tzinfo=UTC)
+
+    @pytest.mark.parametrize("value", ["bad", "2026-13-01", ""])
+    def test_invalid_values_are_rejected(self, value):
+        with pytest.raises(ValidationError):
+            parse(value)
+
+
+class TestUtcDateRange:
+    """Test normalization of parsed bounds to an aware UTC range."""
+
+    def test_bare_dates_cover_whole_days(self):
+        assert _utc_date_range(parse("2026-10-01"), parse("2026-10-17")) == (
+            datetime(2026, 10, 1, 0, 0, tzinfo=UTC),
+            datetime(2026, 10, 17, 23, 59, 59, tzinfo=UTC),
+        )
+
+    def test_explicit_midnight_is_not_widened(self):
+        assert _utc_date_range(parse("2026-10-01T00:00:00"), parse("2026-10-17T00:00:00")) == (
+            datetime(2026, 10, 1, 0, 0, tzinfo=UTC),
+            datetime(2026, 10, 17, 0, 0, tzinfo=UTC),
+        )
+
+    def test_offset_datetimes_are_converted(self):
+        date_from, date_to = _utc_date_range(
+            parse("2026-10-01T00:00:00-04:00"), parse("2026-10-01T23:59:59-04:00")
+        )
+        assert date_from == datetime(2026, 10, 1, 4, 0, tzinfo=UTC)
+        assert date_to == datetime(2026, 10, 2, 3, 59, 59, tzinfo=UTC)
+        assert date_from.utcoffset() == timedelta(0)
@@ -0,0 +1,106 @@
+"""
+Tests for the hourly-rollup window helpers used by /reports/analysis and the analytics charts.
+Run with: pytest tests/test_report_rollup_windows.py -v
+"""
+from datetime import datetime, timedelta, timezone
+
+from app.api.v1.endpoints import reports
+from app.api.v1.endpoints.reports import _closed_rollup_window, _rollup_window, _utc_weekday_starts
+
+UTC = timezone.utc
+IST = timezone(timedelta(hours=5, minutes=30))
+EDT = timezone(timedelta(hours=-4))
+
+
+class TestRollupWindow:
+    """Test mapping inclusive ranges onto UTC hour buckets."""
+
+    def test_utc_day_bounds(self):
+        """endOfDay().toISOString() style bounds cover whole hours, end exclusive."""
+        window = _rollup_window(
+            datetime(2026, 10, 1, 0, 0, tzinfo=UTC),
+            datetime(2026, 10, 1, 23, 59, 59, 999000, tzinfo=UTC),
+        )
+        assert window == (datetime(2026, 10, 1, 0, 0, tzinfo=UTC), datetime(2026, 10, 2, 0, 0, tzinfo=UTC))
+
+    def test_naive_bounds_are_utc(self):
+        window = _rollup_window(datetime(2026, 10, 1, 0, 0), datetime(2026, 10, 1, 23, 59, 59))
+        assert window == (datetime(2026, 10, 1, 0, 0, tzinfo=UTC), datetime(2026, 10, 2, 0, 0, tzinfo=UTC))
+
+    def test_whole_hour_offset_is_converted_to_utc(self):
+        """A -04:00 local day starts and ends on UTC hours 04:00."""
+        window = _rollup_window(
+            datetime(2026, 10, 1, 0, 0, tzinfo=EDT),
+            datetime(2026, 10, 1, 23, 59, 59, 999000, tzinfo=EDT),
+        )
+        assert window == (datetime(2026, 10, 1, 4, 0, tzinfo=UTC), datetime(2026, 10, 2, 4, 0, tzinfo=UTC))
+        assert all(bound.utcoffset() == timedelta(0) for bound in window)
+
+    def test_half_hour_offset_falls_back_to_live_counts(self):
+        """+05:30 midnight is 18:30 UTC, which no hourly bucket starts at."""
+        assert _rollup_window(
+            datetime(2026, 10, 1, 0, 0, tzinfo=IST),
+            datetime(2026, 10, 1, 23, 59, 59, 999000, tzinfo=IST),
+        ) is None
+
+    def test_unaligned_or_open_bounds(self):
+        assert _rollup_window(datetime(2026, 10, 1, 0, 15, tzinfo=UTC), datetime(2026, 10, 1, 23, 59, 59, tzinfo=UTC)) is None
+        assert _rollup_window(datetime(2026, 10, 1, 0, 0, tzinfo=UTC), datetime(2026, 10, 1, 23, 0, tzinfo=UTC)) is None
+        assert _rollup_window(None, datetime(2026, 10, 1, 23, 59, 59, tzinfo=UTC)) is None
+        assert _rollup_window(datetime(2026, 10, 1, 0, 0, tzinfo=UTC), None) is None
+
+
+class TestClosedRollupWindow:
+    """Test that ranges reaching today are always counted live."""
+
+    NOW = datetime(2026, 10, 17, 15, 0, tzinfo=UTC)
+
+    def test_range_before_today_uses_rollup(self, monkeypatch):
+        monkeypatch.setattr(reports, "utc_now", lambda: self.NOW)
+        window = _closed_rollup_window(
+            datetime(2026, 10, 1, 0, 0, tzinfo=UTC),
+            datetime(2026, 10, 16, 23, 59, 59, 999000, tzinfo=UTC),
+        )
+        assert window == (datetime(2026, 10, 1, 0, 0, tzinfo=UTC), datetime(2026, 10, 17, 0, 0, tzinfo=UTC))
+
+    def test_range_including_today_is_live(self, monkeypatch):
+        monkeypatch.setattr(reports, "utc_now", lambda: self.NOW)
+        assert _closed_rollup_window(
+            datetime(2026, 10, 1, 0, 0, tzinfo=UTC),
+            datetime(2026, 10, 17, 23, 59, 59, 999000, tzinfo=UTC),
+        ) is None
+
+    def test_offset_bounds_are_compared_in_utc(self, monkeypatch):
+        """A -04:00 day ending 2026-10-16 runs until 04:00 UTC on the 17th, i.e. into today."""
+        monkeypatch.setattr(reports, "utc_now", lambda: self.NOW)
+        assert _closed_rollup_window(
+            datetime(2026, 10, 16, 0, 0, tzinfo=EDT),
+            datetime(2026, 10, 16, 23, 59, 59, 999000, tzinfo=EDT),
+        ) is None
+        assert _closed_rollup_window(
+            datetime(2026, 10, 1, 0, 0, tzinfo=IST),
+            datetime(2026, 10, 10, 23, 59, 59, 999000, tzinfo=IST),
+        ) is None
+
+
+class TestUtcWeekdayStarts:
+    """Test enumeration of UTC midnights for a day of week (0=Sun, 5=Fri, 6=Sat)."""
+
+    def test_fridays_in_range(self):
+        starts = _utc_weekday_starts(datetime(2026, 10, 1, tzinfo=UTC), datetime(2026, 10, 31, tzinfo=UTC), 5)
+        assert [d.day for d in starts] == [2, 9, 16, 23, 30]
+        assert all(d.weekday() == 4 and d.tzinfo == UTC for d in starts)
+
+    def test_sunday_is_zero(self):
+        starts = _utc_weekday_starts(datetime(2026, 10, 1, tzinfo=UTC), datetime(2026, 10, 10, tzinfo=UTC), 0)
+        assert [d.day for d in starts] == [4]
+
+    def test_bounds_use_the_utc_calendar_day(self):
+        """Friday 2026-10-02 02:00 +05:30 is still Thursday in UTC."""
+        starts = _utc_weekday_starts(
+            datetime(2026, 10, 2, 2, 0, tzinfo=IST), datetime(2026, 10, 2, 4, 0, tzinfo=IST), 5
+        )
+        assert starts == []
+
+    def test_empty_when_no_matching_day(self):
+        assert _utc_weekday_starts(datetime(2026, 10, 5, tzinfo=UTC), datetime(2026, 10, 8, tzinfo=UTC), 6) == []
@@ -28,6 +28,7 @@ import { voiceService, CallLog, VoiceConfig } from "@/services/voice-service";
 import { smsService, ConversationListItem, SMSConfig } from "@/services/sms-service";
 import { whatsappService, WhatsAppConversationListItem, WhatsAppConfig } from "@/services/whatsapp-service";
 import { AudioPlayer } from "@/components/audio-player";
+import { useSmsReadEvents } from "@/hooks/use-websocket";
 import apiClient from "@/lib/api-client";
 
 // Email type (simplified from email service)
@@ -145,6 +146,14 @@ export default function UnifiedInboxPage() {
     }
   }, [voiceConfig, smsConfig, whatsappConfig, loadAll]);
 
+  // A conversation opened here or in another tab is marked read after its messages load
+  const handleSmsRead = useCallback((data: { lead_id: string }) => {
+    setSmsConversations((prev) =>
+      prev.map((conv) => (conv.lead_id === data.lead_id ? { ...conv, unread_count: 0 } : conv))
+    );
+  }, []);
+  useSmsReadEvents(handleSmsRead);
+
   // Deep-link tab from navbar: /inbox?tab=calls
   useEffect(() => {
     if (tabParam === "calls" || tabParam === "sms" || tabParam === "whatsapp" || tabParam === "email") {
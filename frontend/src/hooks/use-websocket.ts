@@ -142,6 +142,16 @@ export function useShowroomUpdates(
     useWebSocketEvent("showroom:update", onUpdate, [onUpdate]);
 }
 
+/**
+ * Hook for SMS conversation read events
+ * Triggers once a conversation has been marked read (after it was opened in any tab)
+ */
+export function useSmsReadEvents(
+    onRead: (data: { lead_id: string; marked: number }) => void
+) {
+    useWebSocketEvent("sms:read", onRead, [onRead]);
+}
+
 /**
  * Generic hook that provides lastMessage for any incoming WebSocket message
  * Useful for components that need to react to multiple message types
@@ -81,6 +81,7 @@ export interface TeamActivityResponse {
     total: number;
     page: number;
     page_size: number;
+    next_cursor?: string | null;
 }
 
 export interface DealershipSummary {
@@ -390,6 +391,7 @@ export const ReportsService = {
     async getTeamActivity(params?: {
         page?: number;
         page_size?: number;
+        cursor?: string;
         user_id?: string;
         type?: string;
     }): Promise<TeamActivityResponse> {
@@ -51,6 +51,7 @@ export interface ShowroomHistoryResponse {
     total: number
     page: number
     page_size: number
+    next_cursor?: string | null
 }
 
 export interface ShowroomStats {
@@ -120,6 +121,7 @@ export const ShowroomService = {
     async getHistory(params?: {
         page?: number
         page_size?: number
+        cursor?: string
         date_from?: string
         date_to?: string
         outcome?: ShowroomOutcome
@@ -40,6 +40,7 @@ export interface Conversation {
   lead_name: string;
   lead_phone: string | null;
   messages: SMSMessage[];
+  next_cursor?: string | null;
 }
 
 export interface ConversationListItem {
@@ -96,6 +97,7 @@ class SMSService {
   async getConversation(leadId: string, params?: {
     limit?: number;
     before?: string;
+    cursor?: string;
   }): Promise<Conversation> {
     const response = await apiClient.get<Conversation>(`/sms/conversations/${leadId}`, { params });
     return response.data;